@@ -4,7 +4,7 @@ Copyright (c) 2019 InnoGames GmbH
 """
 
 from adminapi.request import send_request
-from adminapi.exceptions import ApiError
+from adminapi.exceptions import ApiError, NoFreeIpAddrs
 
 API_CALL_ENDPOINT = '/call'
 
@@ -25,7 +25,11 @@ class FunctionGroup(object):
             result = send_request(API_CALL_ENDPOINT, post_params=call)
 
             if result['status'] == 'error':
-                raise ApiError(result['message'], status_code=None)
+                if result['type'] == 'NoFreeIpAddrs':
+                    exception_class = NoFreeIpAddrs
+                else:
+                    exception_class = ApiError
+                raise exception_class(result['message'], status_code=None)
 
             return result['retval']
 
@@ -35,3 +39,48 @@ class FunctionGroup(object):
 # XXX Deprecated
 def get(group):
     return FunctionGroup(group)
+
+
+class Lease(object):
+    """Mark the identifiers as in-use while in the context
+
+    All of the identifiers are acquired or none of them.  The leases are
+    released when leaving the context.  Long running contexts should renew
+    them before they expire.
+    """
+
+    def __init__(self, identifiers, seconds=60):
+        self.identifiers = [str(i) for i in identifiers]
+        self.seconds = seconds
+        self._group = FunctionGroup('lease')
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def acquire(self):
+        result = self._group.acquire(self.identifiers, self.seconds)
+        in_use = [i for i, v in result.items() if v is not True]
+        if in_use:
+            self._group.release(
+                [i for i, v in result.items() if v is True]
+            )
+            raise ApiError(
+                'Identifiers are already in use: {}'.format(', '.join(in_use)),
+                status_code=None,
+            )
+
+    def renew(self):
+        result = self._group.renew(self.identifiers, self.seconds)
+        expired = [i for i, v in result.items() if not v]
+        if expired:
+            raise ApiError(
+                'Leases have expired: {}'.format(', '.join(expired)),
+                status_code=None,
+            )
+
+    def release(self):
+        self._group.release(self.identifiers)
@@ -4,15 +4,20 @@ Copyright (c) 2019 InnoGames GmbH
 """
 
 from distutils.util import strtobool
-from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from ipaddress import IPv4Network, IPv6Network
 from itertools import chain
 from types import GeneratorType
 
 from adminapi import api
 from adminapi.datatype import validate_value, json_to_datatype
 from adminapi.filters import Any, BaseFilter, ContainedOnlyBy
+from adminapi.iprange import get_free_ip_ranges, iter_ip_addrs
 from adminapi.request import send_request, json_encode_extra
-from adminapi.exceptions import DatasetError, AdminapiException
+from adminapi.exceptions import (
+    AdminapiException,
+    DatasetError,
+    NoFreeIpAddrs,
+)
 
 NEW_OBJECT_ENDPOINT = '/dataset/new_object'
 COMMIT_ENDPOINT = '/dataset/commit'
@@ -20,7 +25,12 @@ QUERY_ENDPOINT = '/dataset/query'
 
 
 class BaseQuery(object):
-    def __init__(self, filters=None, restrict=['hostname'], order_by=None):
+    def __init__(
+        self, filters=None, restrict=['hostname'], order_by=None, as_of=None
+    ):
+        # The objects are queried as they were at the as_of time, if it is
+        # set.  Naive datetime objects are assumed to be in UTC.
+        self._as_of = as_of
         if filters is None:
             self._filters = None
             self._restrict = None
@@ -54,6 +64,8 @@ class BaseQuery(object):
             args.append('restrict=' + repr(self._restrict))
         if self._order_by is not None:
             args.append('order_by=' + repr(self._order_by))
+        if self._as_of is not None:
+            args.append('as_of=' + repr(self._as_of))
         return 'Query({})'.format(', '.join(args))
 
     @property
@@ -203,33 +215,27 @@ class BaseQuery(object):
             if isinstance(addr, (IPv4Network, IPv6Network)):
                 yield addr
 
-    def get_free_ip_addrs(self):
+    def get_free_ip_ranges(self):
+        """Get the free ranges of the queried networks
+
+        Returns (first, last) address tuples of the free ranges of each
+        network in order.
+        """
         networks = list(self.get_network_ip_addrs())
         if not networks:
             raise DatasetError('No networks')
 
-        # Index host and network addresses separately
-        used_hosts = set()
-        used_networks = list()
-        for obj in type(self)({
-            'intern_ip': Any(*(ContainedOnlyBy(n) for n in networks)),
-        }, ['intern_ip']):
-            addr = obj['intern_ip']
-            if isinstance(addr, (IPv4Address, IPv6Address)):
-                used_hosts.add(addr)
-            else:
-                assert isinstance(addr, (IPv4Network, IPv6Network))
-                used_networks.append(addr)
-
-        # Now, we are ready to return.
+        used = [
+            obj['intern_ip']
+            for obj in type(self)({
+                'intern_ip': Any(*(ContainedOnlyBy(n) for n in networks)),
+            }, ['intern_ip'])
+        ]
         for network in networks:
-            for host in network.hosts():
-                for other_network in used_networks:
-                    if host in other_network:
-                        break
-                else:
-                    if host not in used_hosts:
-                        yield host
+            yield from get_free_ip_ranges(network, used)
+
+    def get_free_ip_addrs(self):
+        return iter_ip_addrs(self.get_free_ip_ranges())
 
     def get_free_ip_addr(self, lock=True):
         """Get one free IP address from network
@@ -237,7 +243,8 @@ class BaseQuery(object):
         This will give you exactly one free IP address for the queried network
         and lock it to avoid somebody else using it. If you do not care you
         can set lock to false but may need to handle the CommitError with the
-        duplicate IP on your own.
+        duplicate IP on your own.  The address is found and locked on the
+        server with a single call.
 
         :param lock: Lock free IP address for 60 seconds
 
@@ -246,14 +253,22 @@ class BaseQuery(object):
 
         if not lock:
             try:
-                return next(self.get_network_ip_addrs())
+                return next(self.get_free_ip_addrs())
             except StopIteration:
                 raise AdminapiException('No free IPs left!')
 
-        lock_api = api.get('api')
-        for free_ip in self.get_free_ip_addrs():
-            if lock_api.lock(free_ip) is True:
-                return free_ip
+        networks = list(self.get_network_ip_addrs())
+        if not networks:
+            raise DatasetError('No networks')
+
+        # Only the full networks are skipped, the other errors like missing
+        # permissions are raised.
+        ip_api = api.get('ip')
+        for network in networks:
+            try:
+                return json_to_datatype(ip_api.allocate(str(network))[0])
+            except NoFreeIpAddrs:
+                continue
 
         raise AdminapiException('No free IPs left!')
 
@@ -282,6 +297,8 @@ class Query(BaseQuery):
             request_data['restrict'] = self._restrict
         if self._order_by is not None:
             request_data['order_by'] = self._order_by
+        if self._as_of is not None:
+            request_data['as_of'] = self._as_of
 
         response = send_request(QUERY_ENDPOINT, post_params=request_data)
         if response['status'] == 'error':
@@ -23,6 +23,11 @@ class ApiError(AdminapiException):
         super(Exception, self).__init__(*args, **kwargs)
 
 
+class NoFreeIpAddrs(ApiError):
+    """Not enough free IP addresses left in the network"""
+    pass
+
+
 class AuthenticationError(AdminapiException):
     """No suitable authentication credentials available"""
     pass
@@ -95,28 +95,28 @@ class GreaterThanOrEquals(BaseFilter):
     """Filter the attribute greater than or equals to the value"""
 
     def matches(self, value):
-        return self.value >= value
+        return value >= self.value
 
 
 class GreaterThan(GreaterThanOrEquals):
     """Filter the attribute greater than the value"""
 
     def matches(self, value):
-        return self.value > value
+        return value > self.value
 
 
 class LessThanOrEquals(BaseFilter):
     """Filter the attribute less than or equals to the value"""
 
     def matches(self, value):
-        return self.value <= value
+        return value <= self.value
 
 
 class LessThan(LessThanOrEquals):
     """Filter the attribute less than the value"""
 
     def matches(self, value):
-        return self.value < value
+        return value < self.value
 
 
 class Any(BaseFilter):
@@ -0,0 +1,74 @@
+"""Serveradmin - adminapi
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from ipaddress import IPv4Network, IPv6Network
+
+
+def get_free_ip_ranges(network, used):
+    """Get the free ranges of host addresses in the network
+
+    The used addresses and networks are converted to integer intervals,
+    sorted and merged, so that they can be subtracted from the network in
+    a single pass.  This works for the big IPv6 networks as well, because
+    the free addresses are never enumerated.  The used addresses of the
+    other IP version are ignored, as their integers would collide.
+
+    Returns the free ranges as (first, last) address tuples in order.
+    """
+    address_class = type(network.network_address)
+    first, last = _get_host_interval(network)
+    for used_first, used_last in _merge_intervals(
+        _get_interval(a) for a in used if a.version == network.version
+    ):
+        if used_last < first:
+            continue
+        if used_first > last:
+            break
+        if used_first > first:
+            yield address_class(first), address_class(used_first - 1)
+        first = used_last + 1
+    if first <= last:
+        yield address_class(first), address_class(last)
+
+
+def iter_ip_addrs(ranges):
+    """Iterate the addresses of the ranges lazily"""
+    for first, last in ranges:
+        for value in range(int(first), int(last) + 1):
+            yield type(first)(value)
+
+
+def _get_host_interval(network):
+    """Get the interval of the usable host addresses of the network
+
+    This excludes the same addresses as network.hosts().
+    """
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+    if isinstance(network, IPv4Network) and network.prefixlen < 31:
+        return first + 1, last - 1
+    if isinstance(network, IPv6Network) and network.prefixlen < 127:
+        return first + 1, last
+    return first, last
+
+
+def _get_interval(addr):
+    if isinstance(addr, (IPv4Network, IPv6Network)):
+        return int(addr.network_address), int(addr.broadcast_address)
+    return int(addr), int(addr)
+
+
+def _merge_intervals(intervals):
+    merged = None
+    for first, last in sorted(intervals):
+        if merged is None:
+            merged = [first, last]
+        elif first <= merged[1] + 1:
+            merged[1] = max(merged[1], last)
+        else:
+            yield tuple(merged)
+            merged = [first, last]
+    if merged is not None:
+        yield tuple(merged)
@@ -201,10 +201,14 @@ def _try_request(request, retry=False):
     try:
         return urlopen(request, timeout=Settings.timeout)
     except HTTPError as error:
-        if error.code >= 500:
-            if retry:
-                return None
-        elif error.code >= 400:
+        if retry and (error.code >= 500 or error.code == 429):
+            # The server may ask us to wait longer than usual, when we are
+            # over the limits of our application.
+            retry_after = error.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                time.sleep(max(int(retry_after) - Settings.sleep_interval, 0))
+            return None
+        if 400 <= error.code < 500:
             content_type = error.info()['Content-Type']
             message = str(error)
             if content_type == 'application/x-json':
@@ -0,0 +1,65 @@
+import unittest
+from ipaddress import ip_address, ip_network
+
+from adminapi.iprange import get_free_ip_ranges, iter_ip_addrs
+
+
+def _ranges(network, used):
+    return [
+        (str(first), str(last))
+        for first, last in get_free_ip_ranges(
+            ip_network(network),
+            [ip_network(u) if '/' in u else ip_address(u) for u in used],
+        )
+    ]
+
+
+class TestFreeIpRanges(unittest.TestCase):
+    def test_empty_network(self):
+        self.assertEqual(
+            _ranges('10.0.0.0/24', []), [('10.0.0.1', '10.0.0.254')]
+        )
+
+    def test_used(self):
+        self.assertEqual(
+            _ranges('10.0.0.0/24', [
+                '10.0.0.1', '10.0.0.5', '10.0.0.6', '10.0.0.64/26',
+                '10.0.0.100', '10.0.0.254',
+            ]),
+            [
+                ('10.0.0.2', '10.0.0.4'),
+                ('10.0.0.7', '10.0.0.63'),
+                ('10.0.0.128', '10.0.0.253'),
+            ],
+        )
+
+    def test_full(self):
+        self.assertEqual(_ranges('10.0.0.0/30', ['10.0.0.0/30']), [])
+
+    def test_ipv6(self):
+        self.assertEqual(
+            _ranges('2001:db8::/64', ['2001:db8::1', '2001:db8::8/125']),
+            [
+                ('2001:db8::2', '2001:db8::7'),
+                ('2001:db8::10', '2001:db8::ffff:ffff:ffff:ffff'),
+            ],
+        )
+
+    def test_other_version(self):
+        # ::a00:5 has the same integer as 10.0.0.5
+        self.assertEqual(
+            _ranges('10.0.0.0/29', ['10.0.0.1', '::a00:5', '::a00:0/125']),
+            [('10.0.0.2', '10.0.0.6')],
+        )
+        self.assertEqual(
+            _ranges('::a00:0/125', ['10.0.0.0/29', '::a00:2']),
+            [('::a00:1', '::a00:1'), ('::a00:3', '::a00:7')],
+        )
+
+    def test_same_as_hosts(self):
+        for network in ('10.0.0.0/29', '10.0.0.0/31', '2001:db8::/125'):
+            network = ip_network(network)
+            self.assertEqual(
+                list(iter_ip_addrs(get_free_ip_ranges(network, []))),
+                list(network.hosts()),
+            )
@@ -1,9 +1,24 @@
-from datetime import timedelta
+from contextlib import contextmanager
+from hashlib import sha1
+from itertools import islice
 
+from django.db import connection
+from django.db.models import Q
 from django.utils import timezone
 
+from adminapi.exceptions import DatasetError, NoFreeIpAddrs
+from serveradmin.api import ApiError
 from serveradmin.api.decorators import api_function
+from serveradmin.api.leases import (
+    acquire_leases,
+    release_leases,
+    renew_leases,
+)
 from serveradmin.api.models import Lock
+from serveradmin.dataset import Query
+
+# Upper limit of the addresses to allocate with a single call
+MAX_ALLOCATE_COUNT = 1000
 
 
 @api_function(group='api')
@@ -18,17 +33,113 @@ def lock(identifier, seconds=60):
 
     :return: True on success or seconds left if already in use
     """
+    return acquire_leases([identifier], seconds)[str(identifier)]
+
+
+@api_function(group='lease')
+def acquire(identifiers, seconds=60):
+    """Mark the identifiers as in-use for n seconds
+
+    The identifiers are acquired independently of each other, so some of
+    them may be acquired while others are already in use.
+
+    :param identifiers: A list of unique identifiers (e.g. 10.0.0.1)
+    :param seconds: seconds until the leases expire
+
+    :return: Dictionary of the identifiers to True on success or seconds
+             left if already in use
+    """
+    return acquire_leases(identifiers, seconds)
 
-    # Remove expired locks first
-    Lock.objects.filter(until__lt=timezone.now()).delete()
 
-    # Use hash sum because this has a constant length
-    hash_sum = Lock.get_hash_sum(identifier)
-    obj, created = Lock.objects.get_or_create(hash_sum=hash_sum, defaults={
-        'duration': seconds,
-        'until': timezone.now() + timedelta(seconds=seconds)})
+@api_function(group='lease')
+def renew(identifiers, seconds=None):
+    """Extend the leases of the identifiers for n seconds
 
-    if created:
-        return True
+    :param identifiers: A list of unique identifiers (e.g. 10.0.0.1)
+    :param seconds: seconds until the leases expire, the last duration
+                    of the leases by default
 
-    return (obj.until - timezone.now()).seconds
+    :return: Dictionary of the identifiers to whether they were renewed
+    """
+    return renew_leases(identifiers, seconds)
+
+
+@api_function(group='lease')
+def release(identifiers):
+    """Mark the identifiers as not in-use anymore
+
+    :param identifiers: A list of unique identifiers (e.g. 10.0.0.1)
+
+    :return: Dictionary of the identifiers to whether they were in use
+    """
+    return release_leases(identifiers)
+
+
+@api_function(group='ip')
+def allocate(network, count=1, seconds=60):
+    """Find free IP addresses in the network and lock them for n seconds
+
+    The allocations of the same network are serialized, so the parallel
+    callers never get the same addresses.  The addresses are locked the
+    same way as the api.lock function does, so both respect each other.
+
+    :param network: The network to allocate from (e.g. 10.0.0.0/24)
+    :param count: Number of addresses to allocate
+    :param seconds: seconds until the locks expire
+
+    :return: List of the allocated addresses
+    """
+    if not 1 <= count <= MAX_ALLOCATE_COUNT:
+        raise ApiError(
+            'Count has to be between 1 and {}'.format(MAX_ALLOCATE_COUNT)
+        )
+
+    with _advisory_lock('ip.allocate', network):
+        active = set(
+            Lock.objects
+            .filter(Q(until__gte=timezone.now()) | Q(until=None))
+            .values_list('hash_sum', flat=True)
+        )
+        try:
+            addrs = (
+                a for a in Query(
+                    {'intern_ip': network}, ['intern_ip']
+                ).get_free_ip_addrs()
+                if Lock.get_hash_sum(a) not in active
+            )
+            allocated = []
+            # The addresses may still be locked by the api.lock function in
+            # the meantime.  We carry on with the next ones then.
+            while len(allocated) < count:
+                batch = [str(a) for a in islice(addrs, count - len(allocated))]
+                if not batch:
+                    release_leases(allocated)
+                    raise NoFreeIpAddrs(
+                        'Only {} free IPs left!'.format(len(allocated))
+                    )
+                acquired = acquire_leases(batch, seconds)
+                allocated.extend(a for a in batch if acquired[a] is True)
+        except DatasetError as error:
+            raise ApiError(str(error))
+
+    return allocated
+
+
+@contextmanager
+def _advisory_lock(*identifiers):
+    """Hold a session level advisory lock of the database
+
+    A transaction level lock would not do, because the queries have to
+    run on their own transactions.
+    """
+    key = int.from_bytes(
+        sha1(':'.join(identifiers).encode()).digest()[:8], 'big', signed=True
+    )
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_lock(%s)', [key])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_unlock(%s)', [key])
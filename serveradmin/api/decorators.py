@@ -4,11 +4,12 @@ Copyright (c) 2019 InnoGames GmbH
 """
 
 from datetime import datetime, timedelta
-from functools import update_wrapper
+from functools import partial, update_wrapper
 from logging import getLogger
 from base64 import b64decode
 import json
 
+from django.conf import settings
 from django.core.exceptions import (
     ObjectDoesNotExist,
     PermissionDenied,
@@ -30,6 +31,7 @@ from adminapi.request import (
 from adminapi.filters import FilterValueError
 from serveradmin.apps.models import Application, PublicKey
 from serveradmin.api import AVAILABLE_API_FUNCTIONS
+from serveradmin.api.limits import LocalBackend, TooManyRequests, admit
 
 logger = getLogger('serveradmin')
 
@@ -38,8 +40,18 @@ logger = getLogger('serveradmin')
 # handled.  Chosen by a fair dice role.
 TIMESTAMP_GRACE_PERIOD = timedelta(seconds=16)
 
+limits_backend = LocalBackend(settings.API_LIMITS_DIR)
+
+
+def api_view(view=None, limit_field=None):
+    """Decorate the API views
+
+    The limit_field is the name of the field of the applications with
+    the number of their concurrent calls to the view.
+    """
+    if view is None:
+        return partial(api_view, limit_field=limit_field)
 
-def api_view(view):
     @csrf_exempt
     def _wrapper(request):
         logger.debug('api: Start processing request: {} {}'.format(
@@ -57,12 +69,17 @@ def api_view(view):
         ).replace(tzinfo=timezone.utc)
         body_json = json.loads(body) if body else None
         status_code = 200
+        retry_after = None
 
         try:
             app = authenticate_app(
                 public_keys, signatures, app_id, token, then, now, body
             )
-            return_value = view(request, app, body_json)
+            with admit(
+                limits_backend, app, limit_field,
+                settings.API_LIMIT_QUEUE_TIMEOUT,
+            ):
+                return_value = view(request, app, body_json)
 
             logger.info('api: Call: ' + (', '.join([
                 'Method: {}'.format(view.__name__),
@@ -77,6 +94,7 @@ def api_view(view):
             PermissionDenied,
             ObjectDoesNotExist,
             SuspiciousOperation,
+            TooManyRequests,
         ) as error:
             reason = ''
 
@@ -92,6 +110,10 @@ def api_view(view):
             if isinstance(error, ObjectDoesNotExist):
                 status_code = 404
                 reason = 'Not Found'
+            if isinstance(error, TooManyRequests):
+                status_code = 429
+                reason = 'Too Many Requests'
+                retry_after = error.retry_after
 
             message = '{}: {}'.format(reason, str(error))
             logger.error('api: {}'.format(message))
@@ -101,11 +123,15 @@ def api_view(view):
                 }
             }
 
-        return HttpResponse(
+        response = HttpResponse(
             json.dumps(return_value, default=json_encode_extra),
             content_type='application/x-json',
             status=status_code,
         )
+        if retry_after is not None:
+            response['Retry-After'] = str(retry_after)
+
+        return response
 
     return update_wrapper(_wrapper, view)
 
@@ -0,0 +1,128 @@
+"""Serveradmin - Leases
+
+The leases mark the resources with an identifier as in-use for a duration.
+They are stored on the api_lock table by the hash sums of the identifiers.
+The expired leases are not cleaned up when taking new ones; they are taken
+over on conflict, and removed regularly by the reap_leases command.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from serveradmin.api.models import Lock
+
+# Number of the expired leases to delete with a single statement
+REAP_BATCH_SIZE = 1000
+
+
+def acquire_leases(identifiers, seconds):
+    """Acquire the leases of the identifiers which are not in-use
+
+    :return: Dictionary of the identifiers to True on success or seconds
+             left if already in use
+    """
+    hash_sums = _get_hash_sums(identifiers)
+    now = timezone.now()
+    result = {}
+    # The leases in the way may be released or reaped before we look them
+    # up.  We try to acquire those again, so every identifier is in
+    # the result.
+    pending = list(hash_sums)
+    while pending:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'INSERT INTO api_lock (hash_sum, until, duration) '
+                'SELECT hash_sum, %s, %s '
+                'FROM unnest(%s::varchar[]) AS hash_sum '
+                'ON CONFLICT (hash_sum) DO UPDATE '
+                'SET until = excluded.until, duration = excluded.duration '
+                'WHERE api_lock.until < %s '
+                'RETURNING hash_sum',
+                [now + timedelta(seconds=seconds), seconds, pending, now],
+            )
+            acquired = {hash_sum for hash_sum, in cursor.fetchall()}
+
+        for hash_sum in acquired:
+            result[hash_sums[hash_sum]] = True
+        pending = [h for h in pending if h not in acquired]
+        if pending:
+            for hash_sum, until in Lock.objects.filter(
+                hash_sum__in=pending
+            ).values_list('hash_sum', 'until'):
+                result[hash_sums[hash_sum]] = (until - now).seconds
+            pending = [h for h in pending if hash_sums[h] not in result]
+
+    return result
+
+
+def renew_leases(identifiers, seconds=None):
+    """Extend the leases of the identifiers which are still in-use
+
+    The leases are extended by their last durations, if the seconds are
+    not given.
+
+    :return: Dictionary of the identifiers to whether they were renewed
+    """
+    hash_sums = _get_hash_sums(identifiers)
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'UPDATE api_lock '
+            'SET duration = coalesce(%s, duration), '
+            "   until = %s + coalesce(%s, duration) * interval '1 second' "
+            'WHERE hash_sum = ANY(%s::varchar[]) AND until >= %s '
+            'RETURNING hash_sum',
+            [seconds, now, seconds, list(hash_sums), now],
+        )
+        renewed = {hash_sum for hash_sum, in cursor.fetchall()}
+
+    return {i: h in renewed for h, i in hash_sums.items()}
+
+
+def release_leases(identifiers):
+    """Release the leases of the identifiers
+
+    :return: Dictionary of the identifiers to whether they were in-use
+    """
+    hash_sums = _get_hash_sums(identifiers)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'DELETE FROM api_lock '
+            'WHERE hash_sum = ANY(%s::varchar[]) '
+            'RETURNING hash_sum, until >= %s',
+            [list(hash_sums), timezone.now()],
+        )
+        released = {hash_sum for hash_sum, active in cursor.fetchall()
+                    if active}
+
+    return {i: h in released for h, i in hash_sums.items()}
+
+
+def reap_leases():
+    """Delete the expired leases in batches
+
+    :return: Number of the deleted leases
+    """
+    now = timezone.now()
+    count = 0
+    with connection.cursor() as cursor:
+        while True:
+            cursor.execute(
+                'DELETE FROM api_lock WHERE id IN ('
+                '    SELECT id FROM api_lock WHERE until < %s LIMIT %s'
+                ')',
+                [now, REAP_BATCH_SIZE],
+            )
+            count += cursor.rowcount
+            if cursor.rowcount < REAP_BATCH_SIZE:
+                return count
+
+
+def _get_hash_sums(identifiers):
+    # The duplicates are removed, because a single statement cannot
+    # insert and update the same row.
+    return {Lock.get_hash_sum(i): str(i) for i in identifiers}
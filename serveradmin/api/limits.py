@@ -0,0 +1,151 @@
+"""Serveradmin - Remote HTTP API
+
+The limits of the applications are enforced on the API calls, so that
+a single misbehaving application cannot occupy all of the workers and
+the database.  The state of the limits is shared between the worker
+processes with locked files on the local file system.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import time
+from contextlib import contextmanager
+from fcntl import LOCK_EX, LOCK_NB, LOCK_UN, flock
+from math import ceil
+from os import (
+    O_CREAT,
+    O_RDWR,
+    SEEK_SET,
+    close,
+    ftruncate,
+    lseek,
+    makedirs,
+    open as os_open,
+    read,
+    write,
+)
+from os.path import join
+
+# Seconds to wait between the attempts to get a free slot
+POLL_INTERVAL = 0.05
+
+# Seconds the clients are asked to wait, when all slots are busy
+BUSY_RETRY_AFTER = 1
+
+
+class TooManyRequests(Exception):
+    """The application is over its limits
+
+    The retry_after attribute is the number of seconds the client should
+    wait before sending the request again.
+    """
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LocalBackend:
+    """Shared state of the limits on the local file system
+
+    The concurrent requests are limited by locking one of the numbered slot
+    files.  The locks are released by the operating system, when a worker
+    dies, so the slots cannot leak.  The request rates are limited by token
+    buckets stored in files which are locked while they are updated.
+    """
+
+    def __init__(self, directory, clock=time.time, sleep=time.sleep):
+        self.directory = directory
+        self._clock = clock
+        self._sleep = sleep
+
+    def _open(self, name):
+        makedirs(self.directory, exist_ok=True)
+        return os_open(join(self.directory, name), O_RDWR | O_CREAT, 0o600)
+
+    @contextmanager
+    def slot(self, key, limit, timeout):
+        """Hold one of the slots of the key
+
+        The request is queued until the timeout, if all of the slots are
+        busy, then TooManyRequests is raised.
+        """
+        deadline = self._clock() + timeout
+        while True:
+            for index in range(limit):
+                fd = self._open('{}.{}.slot'.format(key, index))
+                try:
+                    flock(fd, LOCK_EX | LOCK_NB)
+                except BlockingIOError:
+                    close(fd)
+                    continue
+                try:
+                    yield
+                finally:
+                    flock(fd, LOCK_UN)
+                    close(fd)
+                return
+
+            if self._clock() >= deadline:
+                raise TooManyRequests(
+                    'All {} slots of {} are busy'.format(limit, key),
+                    BUSY_RETRY_AFTER,
+                )
+            self._sleep(POLL_INTERVAL)
+
+    def take_token(self, key, per_minute, timeout):
+        """Take a token from the bucket of the key
+
+        The bucket holds a minute of tokens and is refilled continuously.
+        The token is reserved in advance and the request is delayed, if
+        it becomes available before the timeout, otherwise TooManyRequests
+        is raised without taking it.
+        """
+        fd = self._open('{}.rate'.format(key))
+        try:
+            flock(fd, LOCK_EX)
+            now = self._clock()
+            state = read(fd, 64).split()
+            if state:
+                tokens, then = (float(s) for s in state)
+                tokens += (now - then) * per_minute / 60
+                tokens = min(tokens, per_minute)
+            else:
+                tokens = per_minute
+
+            wait = (1 - tokens) * 60 / per_minute
+            if wait > timeout:
+                raise TooManyRequests(
+                    'Over {} requests per minute for {}'.format(
+                        per_minute, key
+                    ),
+                    max(ceil(wait), 1),
+                )
+
+            lseek(fd, 0, SEEK_SET)
+            ftruncate(fd, 0)
+            write(fd, '{!r} {!r}'.format(tokens - 1, now).encode())
+        finally:
+            close(fd)
+
+        if wait > 0:
+            self._sleep(wait)
+
+
+@contextmanager
+def admit(backend, app, limit_field, timeout):
+    """Admit the request of the application within its limits
+
+    The limit_field is the name of the field of the application with
+    the number of its concurrent requests of the kind, or None.
+    """
+    key = 'app{}'.format(app.id)
+    if app.max_requests_per_minute is not None:
+        backend.take_token(key, app.max_requests_per_minute, timeout)
+
+    limit = None if limit_field is None else getattr(app, limit_field)
+    if limit is None:
+        yield
+    else:
+        with backend.slot(key + '.' + limit_field, limit, timeout):
+            yield
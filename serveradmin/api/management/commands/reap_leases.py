@@ -0,0 +1,22 @@
+"""Serveradmin - Leases
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.core.management.base import BaseCommand
+
+from serveradmin.api.leases import reap_leases
+
+
+class Command(BaseCommand):
+    """Delete the expired leases
+
+    This should run regularly.  The expired leases do not block anything,
+    but they would grow the table otherwise.
+    """
+    help = __doc__
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS(
+            '{} expired leases deleted'.format(reap_leases())
+        ))
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_api_lock'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lock',
+            name='until',
+            field=models.DateTimeField(db_index=True, null=True),
+        ),
+    ]
@@ -8,7 +8,7 @@ class Lock(models.Model):
         db_table = 'api_lock'
 
     hash_sum = models.CharField(max_length=40, null=False, unique=True)
-    until = models.DateTimeField(null=True)
+    until = models.DateTimeField(null=True, db_index=True)
     duration = models.PositiveIntegerField(null=True)
 
     @classmethod
@@ -0,0 +1,122 @@
+"""Serveradmin - API function tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from ipaddress import IPv4Network, ip_address
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from adminapi.exceptions import AdminapiException, ApiError, NoFreeIpAddrs
+from serveradmin.api.api import acquire, allocate, lock, release, renew
+from serveradmin.api.models import Lock
+from serveradmin.dataset import Query
+
+
+class TestAllocate(TransactionTestCase):
+    fixtures = ['auth_user.json', 'ip_addr_type.json']
+
+    def setUp(self):
+        network = Query().new_object('network')
+        network['hostname'] = 'net'
+        network['intern_ip'] = '10.0.0.0/29'
+        network.commit(user=User.objects.first())
+        server = Query().new_object('host')
+        server['hostname'] = 'host'
+        server['intern_ip'] = '10.0.0.1'
+        server.commit(user=User.objects.first())
+
+    def test_allocate(self):
+        first = allocate('10.0.0.0/29', 2)
+        second = allocate('10.0.0.0/29', 2)
+        allocated = first + second
+
+        self.assertEqual(len(set(allocated)), 4)
+        self.assertNotIn('10.0.0.1', allocated)
+        for addr in allocated:
+            self.assertIn(ip_address(addr), IPv4Network('10.0.0.0/29'))
+        self.assertEqual(Lock.objects.count(), 4)
+
+    def test_allocate_respects_lock(self):
+        self.assertIs(lock('10.0.0.2'), True)
+        self.assertEqual(allocate('10.0.0.0/29'), ['10.0.0.3'])
+
+    def test_allocate_full(self):
+        allocate('10.0.0.0/29', 5)
+        with self.assertRaises(NoFreeIpAddrs):
+            allocate('10.0.0.0/29')
+        self.assertEqual(Lock.objects.count(), 5)
+
+    def test_get_free_ip_addr_errors(self):
+        query = Query({'hostname': 'net'}, ['intern_ip'])
+        for error_type, exception_class in (
+            ('NoFreeIpAddrs', AdminapiException),
+            ('ApiError', ApiError),
+        ):
+            with mock.patch('adminapi.api.send_request', return_value={
+                'status': 'error', 'type': error_type, 'message': 'Error',
+            }), self.assertRaises(exception_class) as context:
+                query.get_free_ip_addr()
+            self.assertNotIsInstance(context.exception, NoFreeIpAddrs)
+
+
+class TestLeases(TransactionTestCase):
+
+    def expire(self, identifier):
+        Lock.objects.filter(hash_sum=Lock.get_hash_sum(identifier)).update(
+            until=timezone.now() - timedelta(seconds=1)
+        )
+
+    def test_acquire(self):
+        self.assertEqual(acquire(['a', 'b', 'a']), {'a': True, 'b': True})
+        result = acquire(['b', 'c'], 30)
+        self.assertIs(result['c'], True)
+        self.assertGreater(result['b'], 30)
+        self.assertIsNot(lock('a'), True)
+
+    def test_acquire_expired(self):
+        acquire(['a'])
+        self.expire('a')
+        self.assertEqual(acquire(['a']), {'a': True})
+        self.assertEqual(Lock.objects.count(), 1)
+
+    def test_renew(self):
+        acquire(['a', 'b'], 10)
+        self.expire('b')
+        self.assertEqual(renew(['a', 'b'], 100), {'a': True, 'b': False})
+        lease = Lock.objects.get(hash_sum=Lock.get_hash_sum('a'))
+        self.assertEqual(lease.duration, 100)
+        self.assertGreater(lease.until, timezone.now() + timedelta(seconds=90))
+
+    def test_acquire_released_meanwhile(self):
+        acquire(['a'])
+        lookup = Lock.objects.filter
+
+        def release_and_lookup(**kwargs):
+            release(['a'])
+            return lookup(**kwargs)
+
+        with mock.patch.object(
+            Lock.objects, 'filter', side_effect=release_and_lookup
+        ):
+            self.assertEqual(acquire(['a', 'b']), {'a': True, 'b': True})
+
+    def test_release(self):
+        acquire(['a', 'b'])
+        self.assertEqual(release(['a', 'c']), {'a': True, 'c': False})
+        self.assertEqual(acquire(['a', 'b'])['a'], True)
+
+    def test_reap(self):
+        acquire(['a', 'b'])
+        self.expire('a')
+        call_command('reap_leases', stdout=StringIO())
+        self.assertEqual(
+            list(Lock.objects.values_list('hash_sum', flat=True)),
+            [Lock.get_hash_sum('b')],
+        )
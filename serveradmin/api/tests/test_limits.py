@@ -0,0 +1,140 @@
+"""Serveradmin - API limit tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import json
+import time
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+
+from adminapi.request import calc_security_token
+from serveradmin.api import decorators
+from serveradmin.api.limits import LocalBackend, TooManyRequests
+from serveradmin.apps.models import Application
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestLocalBackend(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.clock = FakeClock()
+        self.backend = LocalBackend(
+            self.directory.name, self.clock, self.clock.sleep
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_slot(self):
+        # Another backend stands for another worker process
+        other = LocalBackend(self.directory.name, self.clock, self.clock.sleep)
+        with self.backend.slot('app', 2, 0), other.slot('app', 2, 0):
+            with self.assertRaises(TooManyRequests) as context:
+                with other.slot('app', 2, 1):
+                    pass
+            self.assertEqual(context.exception.retry_after, 1)
+            self.assertAlmostEqual(sum(self.clock.slept), 1, delta=0.1)
+
+            with other.slot('another_app', 1, 0):
+                pass
+
+        with other.slot('app', 2, 0), self.backend.slot('app', 2, 0):
+            pass
+
+    def test_token(self):
+        for _ in range(60):
+            self.backend.take_token('app', 60, 0)
+        with self.assertRaises(TooManyRequests) as context:
+            self.backend.take_token('app', 60, 0)
+        self.assertEqual(context.exception.retry_after, 1)
+
+        # The request is delayed, if the token becomes available in time
+        self.backend.take_token('app', 60, 1)
+        self.assertEqual(self.clock.slept, [1])
+
+        self.clock.now += 30
+        for _ in range(30):
+            self.backend.take_token('app', 60, 0)
+        with self.assertRaises(TooManyRequests):
+            self.backend.take_token('app', 60, 0)
+
+
+@override_settings(API_LIMIT_QUEUE_TIMEOUT=0)
+class TestApiLimits(TransactionTestCase):
+    fixtures = ['test_dataset.json']
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.backend = LocalBackend(self.directory.name)
+        patcher = mock.patch.object(decorators, 'limits_backend', self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+        self.app = Application.objects.create(
+            name='test', owner=User.objects.first(), location='test'
+        )
+
+    def query(self, filters=None):
+        timestamp = str(int(time.time()))
+        body = json.dumps({'filters': filters or {}, 'restrict': ['hostname']})
+        return self.client.post(
+            '/api/dataset/query',
+            body,
+            content_type='application/x-json',
+            HTTP_X_TIMESTAMP=timestamp,
+            HTTP_X_APPLICATION=self.app.app_id,
+            HTTP_X_SECURITYTOKEN=calc_security_token(
+                self.app.auth_token, timestamp, body
+            ),
+        )
+
+    def test_unlimited(self):
+        for _ in range(3):
+            self.assertEqual(self.query().status_code, 200)
+
+    def test_concurrent_queries(self):
+        self.app.max_concurrent_queries = 1
+        self.app.save()
+        key = 'app{}.max_concurrent_queries'.format(self.app.id)
+        with self.backend.slot(key, 1, 0):
+            response = self.query()
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(self.query().status_code, 200)
+
+    def test_requests_per_minute(self):
+        self.app.max_requests_per_minute = 2
+        self.app.save()
+        self.assertEqual(self.query().status_code, 200)
+        self.assertEqual(self.query().status_code, 200)
+        response = self.query()
+        self.assertEqual(response.status_code, 429)
+        self.assertIn(response['Retry-After'], ('29', '30'))
+
+    def test_query_rows(self):
+        self.app.max_query_rows = 0
+        self.app.save()
+        response = self.query()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['status'], 'error')
+
+        response = self.query({'hostname': {'Any': []}})
+        self.assertEqual(json.loads(response.content), {
+            'status': 'success', 'result': []
+        })
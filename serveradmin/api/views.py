@@ -3,6 +3,8 @@
 Copyright (c) 2019 InnoGames GmbH
 """
 
+from datetime import datetime
+
 from django.core.exceptions import (
     SuspiciousOperation,
     PermissionDenied,
@@ -10,11 +12,15 @@ from django.core.exceptions import (
 )
 from django.template.response import HttpResponse
 
+from adminapi.datatype import json_to_datatype
 from adminapi.filters import BaseFilter, FilterValueError
 from serveradmin.api import ApiError, AVAILABLE_API_FUNCTIONS
 from serveradmin.api.decorators import api_view
 from serveradmin.serverdb.query_committer import commit_query
-from serveradmin.serverdb.query_executer import execute_query
+from serveradmin.serverdb.query_executer import (
+    estimate_query_rows,
+    execute_query,
+)
 from serveradmin.serverdb.query_materializer import (
     get_default_attribute_values
 )
@@ -43,7 +49,7 @@ def health_check(request):
     return HttpResponse(status=242)
 
 
-@api_view
+@api_view(limit_field='max_concurrent_queries')
 def dataset_query(request, app, data):
     try:
         if 'filters' not in data or not isinstance(data['filters'], dict):
@@ -61,9 +67,25 @@ def dataset_query(request, app, data):
 
         order_by = data.get('order_by')
 
+        as_of = data.get('as_of')
+        if as_of is not None:
+            as_of = json_to_datatype(as_of)
+            if not isinstance(as_of, datetime):
+                raise SuspiciousOperation('Invalid as_of time')
+
+        # The size of the result is estimated without materializing it to
+        # reject the queries which would be too expensive for the app.
+        if app.max_query_rows is not None:
+            rows = estimate_query_rows(filters)
+            if rows > app.max_query_rows:
+                raise ValidationError(
+                    'Query estimated to match {} objects, over the limit of '
+                    '{} for this application'.format(rows, app.max_query_rows)
+                )
+
         return {
             'status': 'success',
-            'result': execute_query(filters, restrict, order_by),
+            'result': execute_query(filters, restrict, order_by, as_of),
         }
     except (FilterValueError, ValidationError) as error:
         return {
@@ -83,7 +105,7 @@ def dataset_new_object(request, app, data):
     return {'result': get_default_attribute_values(servertype)}
 
 
-@api_view
+@api_view(limit_field='max_concurrent_commits')
 def dataset_commit(request, app, data):
     if not isinstance(data, dict):
         raise SuspiciousOperation('Invalid payload')
@@ -199,6 +221,6 @@ def api_call(request, app, data):
     except ApiError as error:
         return {
             'status': 'error',
-            'type': 'ApiError',
+            'type': error.__class__.__name__,
             'message': str(error),
         }
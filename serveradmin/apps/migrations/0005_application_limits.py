@@ -0,0 +1,32 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0004_application_last_login'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='max_concurrent_queries',
+            field=models.PositiveIntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='max_concurrent_commits',
+            field=models.PositiveIntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='max_requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='max_query_rows',
+            field=models.PositiveIntegerField(blank=True, help_text='Maximum number of objects estimated by the query planner', null=True),
+        ),
+    ]
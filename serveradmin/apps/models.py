@@ -6,6 +6,7 @@ from django.db.models.signals import pre_save, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 
 from paramiko.ssh_exception import SSHException
 from paramiko import RSAKey, ECDSAKey
@@ -36,6 +37,20 @@ class Application(models.Model):
     last_login = models.DateTimeField(null=True, default=None, editable=False)
     superuser = models.BooleanField(default=False)
     allowed_methods = models.TextField(blank=True)
+    # The limits of the API calls, they are not enforced, if they are null
+    max_concurrent_queries = models.PositiveIntegerField(
+        null=True, blank=True, validators=[MinValueValidator(1)]
+    )
+    max_concurrent_commits = models.PositiveIntegerField(
+        null=True, blank=True, validators=[MinValueValidator(1)]
+    )
+    max_requests_per_minute = models.PositiveIntegerField(
+        null=True, blank=True, validators=[MinValueValidator(1)]
+    )
+    max_query_rows = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text='Maximum number of objects estimated by the query planner',
+    )
 
     def __str__(self):
         return self.name
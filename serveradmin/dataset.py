@@ -22,7 +22,9 @@ class Query(BaseQuery):
         self._confirm_changes()
 
     def _fetch_results(self):
-        return execute_query(self._filters, self._restrict, self._order_by)
+        return execute_query(
+            self._filters, self._restrict, self._order_by, self._as_of
+        )
 
 
 class DatasetObject(ApiDatasetObject):
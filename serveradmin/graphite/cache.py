@@ -0,0 +1,90 @@
+"""Serveradmin - Graphite Integration
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import logging
+import time
+from threading import Condition, Thread
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Cache the values of slow functions for some seconds
+
+    The concurrent callers of a missing key wait for a single call of
+    the function instead of calling it themselves.  The expired values can
+    be served stale for some more seconds while they are refreshed in
+    the background, so that the callers don't wait for the slow function.
+    The errors are not cached.
+    """
+
+    def __init__(self, ttl, stale_ttl=0, max_size=10000, clock=time.monotonic):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._condition = Condition()
+        self._entries = {}      # Keys to the values and their times
+        self._in_flight = set()
+
+    def get(self, key, func):
+        """Get the value of the key calling the function if necessary"""
+        with self._condition:
+            while True:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    value, created_at = entry
+                    age = self._clock() - created_at
+                    if age < self.ttl:
+                        return value
+                    if age < self.ttl + self.stale_ttl:
+                        if key not in self._in_flight:
+                            self._in_flight.add(key)
+                            Thread(
+                                target=self._refresh, args=(key, func),
+                                daemon=True,
+                            ).start()
+                        return value
+                if key not in self._in_flight:
+                    self._in_flight.add(key)
+                    break
+                self._condition.wait()
+
+        try:
+            value = func()
+        except BaseException:
+            with self._condition:
+                self._in_flight.discard(key)
+                self._condition.notify_all()
+            raise
+        self._set(key, value)
+
+        return value
+
+    def clear(self):
+        with self._condition:
+            self._entries.clear()
+
+    def _refresh(self, key, func):
+        try:
+            value = func()
+        except Exception:
+            logger.exception('Refreshing "{}" failed'.format(key))
+            with self._condition:
+                self._in_flight.discard(key)
+                self._condition.notify_all()
+        else:
+            self._set(key, value)
+
+    def _set(self, key, value):
+        with self._condition:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_size:
+                # The oldest entry is the first one, as the entries are
+                # inserted again when they are set.
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = value, self._clock()
+            self._in_flight.discard(key)
+            self._condition.notify_all()
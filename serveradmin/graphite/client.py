@@ -0,0 +1,86 @@
+"""Serveradmin - Graphite Integration
+
+The requests to Graphite reuse a keep-alive connection per thread, so that
+the parallel requests don't pay for a new connection every time.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from base64 import b64encode
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from shutil import copyfileobj
+from threading import local
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+# Seconds to wait for Graphite to respond
+GRAPHITE_TIMEOUT = 60
+
+_connections = local()
+
+
+class GraphiteError(IOError):
+    pass
+
+
+def get_from_graphite(path, params, fd=None):
+    """Make a GET request to Graphite and return the response body
+
+    :param path: The path under GRAPHITE_URL (e.g. /render)
+    :param params: The encoded query string
+    :param fd: The binary file to copy the response body to in chunks
+               instead of returning it
+    """
+    url = urlsplit(settings.GRAPHITE_URL)
+    headers = {}
+    if getattr(settings, 'GRAPHITE_USER', None):
+        headers['Authorization'] = 'Basic ' + b64encode('{}:{}'.format(
+            settings.GRAPHITE_USER, settings.GRAPHITE_PASSWORD
+        ).encode()).decode()
+    target = '{}{}?{}'.format(url.path.rstrip('/'), path, params)
+
+    # The connection may have been closed by the server while idle.  We try
+    # once more with a new connection then.
+    for retry in (True, False):
+        connection = _get_connection(url)
+        try:
+            connection.request('GET', target, headers=headers)
+            response = connection.getresponse()
+            if fd is None or response.status != 200:
+                body = response.read()
+            else:
+                fd.seek(0)
+                fd.truncate()
+                copyfileobj(response, fd)
+                body = None
+        except (HTTPException, OSError) as error:
+            connection.close()
+            if retry:
+                continue
+            raise GraphiteError(
+                'Graphite request to {} failed: {}'.format(target, error)
+            )
+        if response.status != 200:
+            raise GraphiteError('Graphite returned {} {} to {}'.format(
+                response.status, response.reason, target
+            ))
+
+        return body
+
+
+def _get_connection(url):
+    key = (url.scheme, url.netloc)
+    connections = getattr(_connections, 'connections', None)
+    if connections is None:
+        connections = _connections.connections = {}
+    if key not in connections:
+        if url.scheme == 'https':
+            connection_class = HTTPSConnection
+        else:
+            connection_class = HTTPConnection
+        connections[key] = connection_class(
+            url.netloc, timeout=GRAPHITE_TIMEOUT
+        )
+
+    return connections[key]
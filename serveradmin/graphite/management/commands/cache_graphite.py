@@ -4,95 +4,242 @@ Copyright (c) 2019 InnoGames GmbH
 """
 
 import json
-from datetime import datetime
-from os import mkdir
-from os.path import isdir
 import time
-from PIL import Image
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from hashlib import sha1
 from io import BytesIO
-from urllib.request import (
-    HTTPBasicAuthHandler,
-    HTTPPasswordMgrWithDefaultRealm,
-    build_opener
-)
-from urllib.error import HTTPError
+from os import getpid, listdir, makedirs, replace, unlink
+from os.path import basename, dirname, exists, getmtime, join
+from threading import Lock
+
+from PIL import Image
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, transaction
 
 from serveradmin.dataset import Query
+from serveradmin.graphite.client import GraphiteError, get_from_graphite
 from serveradmin.graphite.models import (
     GRAPHITE_ATTRIBUTE_ID,
     Collection,
     AttributeFormatter,
 )
-from serveradmin.serverdb.models import ServerNumberAttribute
+from serveradmin.serverdb.models import ChangeCommit
 from adminapi import filters
 
+# Seconds after which the left over temporary files are deleted
+TMP_FILE_MAX_AGE = 3600
+
 
 class Command(BaseCommand):
     """Generate sprites from the overview graphics"""
     help = __doc__
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=8,
+            help='Number of the parallel requests to Graphite',
+        )
+        parser.add_argument(
+            '--processes', type=int,
+            help='Number of the processes to compose the sprites, '
+            'the number of CPUs by default',
+        )
+        parser.add_argument(
+            '--max-age', type=int,
+            help='Seconds to keep the unchanged sprites, '
+            'all of them are regenerated by default',
+        )
+        parser.add_argument(
+            '--flush-interval', type=float, default=10,
+            help='Seconds to buffer the numerics before writing them',
+        )
+        parser.add_argument(
+            '--only-servers', nargs='+', metavar='HOSTNAME',
+            help='Hostnames of the servers to process, '
+            'the orphaned sprites are not deleted then',
+        )
+
+    def handle(self, *args, **options):
         """The entry point of the command"""
 
         start = time.time()
 
-        sprite_params = settings.GRAPHITE_SPRITE_PARAMS
-        sprite_dir = settings.MEDIA_ROOT + '/graph_sprite'
-        if not isdir(sprite_dir):
-            mkdir(sprite_dir)
-
-        # We will make sure to generate a single sprite for a single hostname.
-        for collection in Collection.objects.filter(overview=True):
-            collection_start = time.time()
-
-            collection_dir = sprite_dir + '/' + collection.name
-            if not isdir(collection_dir):
-                mkdir(collection_dir)
-
-            for server in Query(
-                {
-                    GRAPHITE_ATTRIBUTE_ID: collection.name,
-                    'state': filters.Not('retired'),
-                }):
-                graph_table = collection.graph_table(server, sprite_params)
-                if graph_table:
-                    self.generate_sprite(collection_dir, graph_table, server)
-                self.cache_numerics(collection, server)
-
-            collection_duration = time.time() - collection_start
-            print('[{}] Collection {} finished after {} seconds'.format(
-                datetime.now(), collection.name, collection_duration))
+        sprite_dir = join(settings.MEDIA_ROOT, 'graph_sprite')
+        makedirs(sprite_dir, exist_ok=True)
+        self.numerics = NumericBuffer(options['flush_interval'])
+
+        # The servers of a collection are processed by the workers in
+        # parallel.  Every worker makes one request at a time, so the number
+        # of the parallel requests to Graphite is bounded by the workers.
+        # The sprites are composed on separate processes, as it is CPU bound.
+        with ThreadPoolExecutor(options['workers']) as workers, \
+                ProcessPoolExecutor(options['processes']) as processes:
+            # The templates and the variations are prefetched, so that
+            # the workers don't need to query the database.
+            for collection in Collection.objects.filter(
+                overview=True
+            ).prefetch_related('template_set', 'variation_set', 'numeric_set'):
+                self.cache_collection(
+                    collection, sprite_dir, workers, processes,
+                    options['workers'] * 4, options['max_age'],
+                    options['only_servers'],
+                )
 
         duration = time.time() - start
         print('[{}] Finished after {} seconds'.format(datetime.now(),
                                                       duration))
 
-    def generate_sprite(self, collection_dir, graph_table, server):
-        """Generate sprites for the given server using the given collection"""
-        graphs = [v2 for k1, v1 in graph_table for k2, v2 in v1]
-        sprite_width = settings.GRAPHITE_SPRITE_WIDTH
-        sprite_height = settings.GRAPHITE_SPRITE_HEIGHT
-        total_width = len(graphs) * sprite_width
-        sprite_img = Image.new('RGB', (total_width, sprite_height), (255,) * 3)
+    def cache_collection(
+        self, collection, sprite_dir, workers, processes, queue_size,
+        max_age, only_servers,
+    ):
+        """Generate the sprites and the numerics of the collection"""
+        collection_start = time.time()
+        stats = Stats()
+
+        collection_dir = join(sprite_dir, collection.name)
+        makedirs(collection_dir, exist_ok=True)
+        manifest = Manifest(collection_dir)
+        if max_age is None:
+            min_generated_at = collection_start
+        else:
+            min_generated_at = collection_start - max_age
 
-        for graph, offset in zip(graphs, range(0, total_width, sprite_width)):
-            response = self.get_from_graphite(graph)
-            if response:
-                box = (offset, 0, offset + sprite_width, sprite_height)
-                sprite_img.paste(Image.open(BytesIO(response)), box)
+        query_filters = {
+            GRAPHITE_ATTRIBUTE_ID: collection.name,
+            'state': filters.Not('retired'),
+        }
+        if only_servers:
+            query_filters['hostname'] = filters.Any(*only_servers)
+
+        # We limit the servers in progress and the sprites waiting to be
+        # composed to keep the responses we hold in memory bounded.
+        fetches = deque()
+        sprites = deque()
+        sprite_count = 0
+        for server in Query(query_filters):
+            if len(fetches) >= queue_size:
+                sprites += self.finish_server(
+                    collection, manifest, processes, *fetches.popleft()
+                )
+            while len(sprites) > queue_size:
+                self.finish_sprite(manifest, *sprites.popleft())
+                sprite_count += 1
+            fetches.append((server, workers.submit(
+                self.fetch_server, collection, server, stats,
+                manifest.get_fresh(server['hostname'], min_generated_at),
+            )))
+        while fetches:
+            sprites += self.finish_server(
+                collection, manifest, processes, *fetches.popleft()
+            )
+            while len(sprites) > queue_size:
+                self.finish_sprite(manifest, *sprites.popleft())
+                sprite_count += 1
+        while sprites:
+            self.finish_sprite(manifest, *sprites.popleft())
+            sprite_count += 1
 
-        sprite_img.save(collection_dir + '/' + server['hostname'] + '.png')
+        # The sprites of the servers we haven't seen are orphaned.  We
+        # can only know them, if we have seen all of the servers.
+        if not only_servers:
+            manifest.delete_orphans()
+        manifest.save()
+        self.numerics.flush()
 
-    def cache_numerics(self, collection, server):
-        """Generate sprites for the given server using the given collection"""
+        collection_duration = time.time() - collection_start
+        print(
+            '[{}] Collection {} finished after {} seconds: {} servers, '
+            '{} requests with {} failures taking {:.1f} seconds, '
+            '{} sprites generated, {} sprites fresh, {} orphans deleted'
+            .format(
+                datetime.now(), collection.name, collection_duration,
+                stats.servers, stats.requests, stats.failures,
+                stats.request_duration, sprite_count, stats.fresh,
+                manifest.deleted,
+            )
+        )
+
+    def fetch_server(self, collection, server, stats, fresh_entry):
+        """Get the graphs and the numerics of the server from Graphite
+
+        The graphs are not fetched, if the fresh sprite of the server in
+        the manifest has the same params.  This runs on the workers.
+        The returned entry is False, if the graph table couldn't be
+        composed, so that the existing sprite is kept.
+        """
+        stats.add_server()
+        entry = graphs = None
+        try:
+            graph_table = collection.graph_table(
+                server, settings.GRAPHITE_SPRITE_PARAMS
+            )
+        except GraphiteError as error:
+            print('Warning: ' + str(error))
+            graph_table = None
+            entry = False
+
+        if graph_table:
+            params = [v2 for k1, v1 in graph_table for k2, v2 in v1]
+            entry = {
+                'params_hash': get_params_hash(params),
+                'generated_at': time.time(),
+                'object_id': server.object_id,
+            }
+            if (
+                fresh_entry and
+                fresh_entry['params_hash'] == entry['params_hash']
+            ):
+                stats.add_fresh()
+                entry = fresh_entry
+            else:
+                graphs = [self.get_from_graphite(p, stats) for p in params]
+                # The sprite with missing graphs should be tried again on
+                # the next run.
+                if not all(graphs):
+                    entry['generated_at'] = 0
+
+        numerics = []
         for numeric in collection.numeric_set.all():
             formatter = AttributeFormatter()
             params = formatter.vformat(numeric.params, (), server)
-            response = self.get_from_graphite(params)
+            numerics.append((numeric, self.get_from_graphite(params, stats)))
+
+        return entry, graphs, numerics
+
+    def finish_server(self, collection, manifest, processes, server, fetch):
+        """Compose the sprite and store the numerics of a fetched server"""
+        entry, graphs, numerics = fetch.result()
+        self.cache_numerics(collection, server, numerics)
+        hostname = server['hostname']
+        if entry is False:
+            manifest.keep(hostname)
+            return []
+        if graphs is None:
+            if entry is not None:
+                manifest.add(hostname, entry)
+            return []
+
+        return [(hostname, entry, processes.submit(
+            write_sprite,
+            manifest.get_path(hostname),
+            graphs,
+            settings.GRAPHITE_SPRITE_WIDTH,
+            settings.GRAPHITE_SPRITE_HEIGHT,
+        ))]
+
+    def finish_sprite(self, manifest, hostname, entry, sprite):
+        """Wait for the sprite to be composed and record it"""
+        sprite.result()
+        manifest.add(hostname, entry)
+
+    def cache_numerics(self, collection, server, numerics):
+        """Store the numerics of the server from the Graphite responses"""
+        for numeric, response in numerics:
             if not response:
                 continue
 
@@ -111,42 +258,227 @@ class Command(BaseCommand):
             if value is None:
                 continue
 
-            # Django can be set up to implicitly execute commands in database
-            # transactions.  We don't want that behavior in here even when
-            # it is set up like this.  This process takes a long time.
-            # We want the values to be immediately available to the users.
-            with transaction.atomic():
-                ServerNumberAttribute.objects.update_or_create(
-                    server_id=server.object_id,
-                    attribute=numeric.attribute,
-                    defaults={'value': value},
-                )
+            self.numerics.add(server.object_id, numeric.attribute_id, value)
 
-    def get_from_graphite(self, params):
+    def get_from_graphite(self, params, stats):
         """Make a GET request to Graphite with the given params"""
-        password_mgr = HTTPPasswordMgrWithDefaultRealm()
-        password_mgr.add_password(
-            None,
-            settings.GRAPHITE_URL,
-            settings.GRAPHITE_USER,
-            settings.GRAPHITE_PASSWORD,
-        )
-        auth_handler = HTTPBasicAuthHandler(password_mgr)
-        url = '{0}/render?{1}'.format(
-            settings.GRAPHITE_URL, params
-        )
         start = time.time()
-
         try:
-            with build_opener(auth_handler).open(url) as response:
-                return response.read()
-        except HTTPError as error:
-            print('Warning: Graphite returned ' + str(error) + ' to ' + url)
+            return get_from_graphite('/render', params)
+        except GraphiteError as error:
+            stats.add_failure()
+            print('Warning: ' + str(error))
         finally:
             end = time.time()
+            stats.add_request(end - start)
             if end - start > 10:
                 print(
                     'Warning: Graphite request to {0} took {1} seconds'.format(
-                        url, end - start
+                        params, end - start
                     )
                 )
+
+
+class Stats:
+    """Counters of a collection shared by the workers"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.servers = 0
+        self.requests = 0
+        self.failures = 0
+        self.request_duration = 0.0
+        self.fresh = 0
+
+    def add_server(self):
+        with self._lock:
+            self.servers += 1
+
+    def add_request(self, duration):
+        with self._lock:
+            self.requests += 1
+            self.request_duration += duration
+
+    def add_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def add_fresh(self):
+        with self._lock:
+            self.fresh += 1
+
+
+class NumericBuffer:
+    """The numerics to be written to the database in batches
+
+    The buffer is flushed when it is full or when the oldest value in it
+    has waited for the flush interval, so that the values are available
+    to the users soon.
+    """
+    batch_size = 1000
+
+    def __init__(self, flush_interval):
+        self.flush_interval = flush_interval
+        self._values = {}
+        self._first_added = None
+
+    def add(self, server_id, attribute_id, value):
+        if not self._values:
+            self._first_added = time.time()
+        self._values[(server_id, attribute_id)] = value
+        if (
+            len(self._values) >= self.batch_size or
+            time.time() - self._first_added >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write the values with a single statement
+
+        The values are updated in place or inserted.  The unique constraint
+        of the table includes the value, so we cannot use ON CONFLICT for
+        this.  The commits write the numeric attributes as well, so we lock
+        them out while flushing.  Otherwise a commit racing with us could
+        leave a second value of a single valued attribute.
+        """
+        if not self._values:
+            return
+
+        values = list(self._values.items())
+        self._values = {}
+        # Django can be set up to implicitly execute commands in database
+        # transactions.  We don't want that behavior in here even when
+        # it is set up like this.  This process takes a long time.
+        # We want the values to be immediately available to the users.
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Every commit inserts to the commit table first, so this waits
+            # for the running commits and holds the new ones back.  The mode
+            # conflicts with itself to serialize the parallel runs of this
+            # command as well.
+            cursor.execute(
+                'LOCK TABLE {} IN SHARE ROW EXCLUSIVE MODE'
+                .format(ChangeCommit._meta.db_table)
+            )
+            cursor.execute(
+                'WITH new (server_id, attribute_id, value) AS ('
+                '   VALUES {}'
+                '), updated AS ('
+                '   UPDATE server_number_attribute AS old '
+                '   SET value = new.value '
+                '   FROM new '
+                '   WHERE old.server_id = new.server_id AND '
+                '       old.attribute_id = new.attribute_id '
+                '   RETURNING old.server_id, old.attribute_id'
+                ') '
+                'INSERT INTO server_number_attribute '
+                '   (server_id, attribute_id, value) '
+                'SELECT server_id, attribute_id, value '
+                'FROM new '
+                'WHERE NOT EXISTS ('
+                '   SELECT 1 '
+                '   FROM updated '
+                '   WHERE updated.server_id = new.server_id AND '
+                '       updated.attribute_id = new.attribute_id'
+                ')'
+                .format(', '.join(
+                    ['(%s::integer, %s::varchar, %s::numeric)'] * len(values)
+                )),
+                [v for (s, a), n in values for v in (s, a, n)],
+            )
+
+
+class Manifest:
+    """The record of the sprites in a collection directory
+
+    The entries are indexed by the hostnames of the servers.  They hold
+    the hash of the params the sprite is generated from, the time it was
+    generated and the object_id of the server.
+    """
+    file_name = 'manifest.json'
+
+    def __init__(self, collection_dir):
+        self.collection_dir = collection_dir
+        self.deleted = 0
+        self._seen = set()
+        try:
+            with open(join(collection_dir, self.file_name)) as fd:
+                self._entries = json.load(fd)
+        except FileNotFoundError:
+            self._entries = {}
+
+    def get_path(self, hostname):
+        return join(self.collection_dir, hostname + '.png')
+
+    def get_fresh(self, hostname, min_generated_at):
+        """Get the entry, if the sprite is generated after the time"""
+        entry = self._entries.get(hostname)
+        if (
+            entry and
+            entry['generated_at'] >= min_generated_at and
+            exists(self.get_path(hostname))
+        ):
+            return entry
+
+        return None
+
+    def add(self, hostname, entry):
+        self._entries[hostname] = entry
+        self._seen.add(hostname)
+
+    def keep(self, hostname):
+        """Keep the entry and the sprite of the server as they are"""
+        self._seen.add(hostname)
+
+    def delete_orphans(self):
+        """Delete the sprites and the entries of the servers not seen"""
+        for file_name in listdir(self.collection_dir):
+            if file_name == self.file_name:
+                continue
+            path = join(self.collection_dir, file_name)
+            if file_name.endswith('.png'):
+                if file_name[:-len('.png')] in self._seen:
+                    continue
+            # The temporary files may belong to another run in progress.
+            elif not (
+                file_name.endswith('.tmp') and
+                getmtime(path) < time.time() - TMP_FILE_MAX_AGE
+            ):
+                continue
+            unlink(path)
+            self.deleted += 1
+        self._entries = {
+            k: v for k, v in self._entries.items() if k in self._seen
+        }
+
+    def save(self):
+        path = join(self.collection_dir, self.file_name)
+        tmp_path = join(
+            self.collection_dir, '.{}.{}.tmp'.format(self.file_name, getpid())
+        )
+        with open(tmp_path, 'w') as fd:
+            json.dump(self._entries, fd, indent=4, sort_keys=True)
+        replace(tmp_path, path)
+
+
+def get_params_hash(params):
+    return sha1('\n'.join(params).encode()).hexdigest()
+
+
+def write_sprite(path, graphs, width, height):
+    """Compose the graphs side by side and write the sprite
+
+    This runs on the processes.  The sprite is written to a temporary file
+    first and renamed, so that it is never served half written.
+    """
+    total_width = len(graphs) * width
+    sprite_img = Image.new('RGB', (total_width, height), (255,) * 3)
+    for graph, offset in zip(graphs, range(0, total_width, width)):
+        if graph:
+            box = (offset, 0, offset + width, height)
+            sprite_img.paste(Image.open(BytesIO(graph)), box)
+
+    tmp_path = join(
+        dirname(path), '.{}.{}.tmp'.format(basename(path), getpid())
+    )
+    sprite_img.save(tmp_path, 'PNG')
+    replace(tmp_path, path)
@@ -4,22 +4,30 @@ Copyright (c) 2019 InnoGames GmbH
 """
 
 import json
+import re
 from string import Formatter
-from urllib.request import (
-    HTTPBasicAuthHandler,
-    HTTPPasswordMgrWithDefaultRealm,
-    build_opener
-)
 
-from django.db import models
 from django.conf import settings
+from django.db import models
 
 from adminapi.dataset import MultiAttr
 
+from serveradmin.graphite.cache import TTLCache
+from serveradmin.graphite.client import get_from_graphite
 from serveradmin.serverdb.models import LOOKUP_ID_VALIDATORS, Attribute
 
 GRAPHITE_ATTRIBUTE_ID = 'graphite_graphs'
 
+# The attribute or item access of the fields of the params starts with these
+FIELD_NAME_END_RE = re.compile(r'[.\[]')
+
+# The metrics found for the foreach_paths of the templates are shared by
+# the page views and the sprite cache.
+foreach_cache = TTLCache(
+    settings.GRAPHITE_FOREACH_CACHE_TTL,
+    settings.GRAPHITE_FOREACH_CACHE_STALE_TTL,
+)
+
 
 class Collection(models.Model):
     """Collection of graphs and values to be shown for the servers"""
@@ -62,8 +70,7 @@ class Collection(models.Model):
 
     def __init__(self, *args, **kwargs):
         models.Model.__init__(self, *args, **kwargs)
-        self._templates = None     # To cache graph templates
-        self._variations = None    # To cache graph variations
+        self._compiled = {}     # To cache compiled params by custom params
 
     def __str__(self):
         name = self.name
@@ -72,6 +79,10 @@ class Collection(models.Model):
 
         return name
 
+    def save(self, *args, **kwargs):
+        self._compiled = {}
+        models.Model.save(self, *args, **kwargs)
+
     def graph_column(self, server, custom_params=''):
         """Generate graph URL table for a server
 
@@ -84,18 +95,17 @@ class Collection(models.Model):
             ]
         """
         column = []
-        for template in self.template_set.all():
+        for template, params, variations in self.compiled(custom_params):
             for foreach_metric in template.foreach(server):
                 formatter = AttributeFormatter({
                     'foreach_id': foreach_metric['id'],
                 })
-                params = self.merged_params((template.params, custom_params))
 
                 name = template.name
                 if foreach_metric['text']:
                     name += ' - ' + foreach_metric['text']
 
-                column.append((name, formatter.vformat(params, (), server)))
+                column.append((name, formatter.render(params, server)))
 
         return column
 
@@ -120,19 +130,18 @@ class Collection(models.Model):
         """
 
         table = []
-        for template in self.template_set.all():
+        for template, template_params, variations in self.compiled(
+            custom_params
+        ):
             for foreach_metric in template.foreach(server):
                 column = []
-                for variation in self.variation_set.all():
+                for variation, params in variations:
                     formatter = AttributeFormatter({
                         'foreach_id': foreach_metric['id'],
                         'summarize_interval': variation.summarize_interval,
                     })
-                    params = self.merged_params((variation.params,
-                                                 template.params,
-                                                 custom_params))
                     column.append((variation.name,
-                                   formatter.vformat(params, (), server)))
+                                   formatter.render(params, server)))
 
                 name = template.name
                 if foreach_metric['text']:
@@ -142,6 +151,55 @@ class Collection(models.Model):
 
         return table
 
+    def compiled(self, custom_params=''):
+        """Get the templates and the variations with their compiled params
+
+        They are compiled once for the collection, as they are rendered
+        for many servers.  The list is ordered.  Example:
+
+            [
+                (<Template: CPU Usage>, <compiled params>, [
+                    (<Variation: Hourly>, <compiled params>),
+                    (<Variation: Daily>, <compiled params>),
+                ]),
+            ]
+        """
+        if custom_params not in self._compiled:
+            variations = list(self.variation_set.all())
+            self._compiled[custom_params] = [
+                (
+                    template,
+                    compile_params(self.merged_params((
+                        template.params, custom_params
+                    ))),
+                    [
+                        (variation, compile_params(self.merged_params((
+                            variation.params, template.params, custom_params
+                        ))))
+                        for variation in variations
+                    ],
+                )
+                for template in self.template_set.all()
+            ]
+
+        return self._compiled[custom_params]
+
+    def field_names(self):
+        """Get the names of the fields used by the params of the graphs
+
+        The fields are the attributes of the servers, the variables like
+        "foreach_id", or the names that don't exist at all.
+        """
+        names = set()
+        for template, params, variations in self.compiled():
+            names.update(get_field_names(params))
+            if template.foreach_path:
+                names.update(get_field_names(template.compiled_foreach()))
+            for variation, params in variations:
+                names.update(get_field_names(params))
+
+        return names
+
     def merged_params(self, other_params):
         """Get merged and cleaned URL parameters"""
         params = self.params
@@ -228,9 +286,17 @@ class Template(models.Model):
         ordering = ['sort_order']
         unique_together = [['collection', 'name']]
 
+    def __init__(self, *args, **kwargs):
+        models.Model.__init__(self, *args, **kwargs)
+        self._compiled_foreach = None
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self._compiled_foreach = None
+        models.Model.save(self, *args, **kwargs)
+
     def foreach(self, server):
         """Helper function to iterate Graphite metrics using foreach_path
 
@@ -239,24 +305,13 @@ class Template(models.Model):
         """
 
         if self.foreach_path:
-            formatter = AttributeFormatter()
-            params = formatter.vformat(
-                'query=' + self.foreach_path, (), server
+            params = AttributeFormatter().render(
+                self.compiled_foreach(), server
             )
 
-            password_mgr = HTTPPasswordMgrWithDefaultRealm()
-            password_mgr.add_password(
-                None,
-                settings.GRAPHITE_URL,
-                settings.GRAPHITE_USER,
-                settings.GRAPHITE_PASSWORD,
-            )
-            auth_handler = HTTPBasicAuthHandler(password_mgr)
-            url = '{0}/metrics/find?{1}'.format(
-                settings.GRAPHITE_URL, params
-            )
-            with build_opener(auth_handler).open(url) as response:
-                return json.loads(response.read().decode())
+            return foreach_cache.get(params, lambda: json.loads(
+                get_from_graphite('/metrics/find', params).decode()
+            ))
 
         return [{
             'id': '',
@@ -267,6 +322,15 @@ class Template(models.Model):
             'allowChildren': 0,
         }]
 
+    def compiled_foreach(self):
+        """Get the compiled params to find the metrics of foreach_path"""
+        if self._compiled_foreach is None:
+            self._compiled_foreach = compile_params(
+                'query=' + self.foreach_path
+            )
+
+        return self._compiled_foreach
+
 
 class Variation(models.Model):
     """Variation to render the templates
@@ -341,6 +405,84 @@ class AttributeFormatter(Formatter):
 
         return format_attribute_value(server[key][self._last_item_ids[key]])
 
+    def render(self, segments, server):
+        """Render the segments returned by compile_params()
+
+        This is equivalent to vformat() without parsing the format string
+        every time.  The fields with only a name are looked up directly.
+        """
+        result = []
+        for literal, field_name, field in segments:
+            result.append(literal)
+            if field_name is not None:
+                result.append(str(self.get_value(field_name, (), server)))
+            elif field is not None:
+                result.append(self.vformat(field, (), server))
+
+        return ''.join(result)
+
+
+def compile_params(params):
+    """Parse the params to be rendered by AttributeFormatter.render()
+
+    The params are split into the literal texts and the fields following
+    them.  The fields with only a name, which are almost all of them, are
+    kept as the names.  The others are kept as format strings to be passed
+    to vformat().
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(
+        params
+    ):
+        if field_name is None:
+            segments.append((literal, None, None))
+        elif (
+            field_name and not format_spec and not conversion and
+            not any(c in field_name for c in '.[')
+        ):
+            segments.append((literal, field_name, None))
+        else:
+            field = field_name
+            if conversion:
+                field += '!' + conversion
+            if format_spec:
+                field += ':' + format_spec
+            segments.append((literal, None, '{' + field + '}'))
+
+    return tuple(segments)
+
+
+def get_field_names(segments):
+    """Get the names of the fields of the segments of compile_params()"""
+    for literal, field_name, field in segments:
+        if field_name is not None:
+            yield field_name
+        elif field is not None:
+            for literal, field_name, format_spec, conversion in (
+                Formatter().parse(field)
+            ):
+                yield FIELD_NAME_END_RE.split(field_name, 1)[0]
+
+
+def get_attribute_ids(collections):
+    """Get the attribute ids to query the servers of the collections
+
+    These are the existing attributes used by the params of the graphs
+    of the collections, the hostname and the attribute marking the servers
+    with the collections.  The servers don't have to be queried with all
+    of their attributes only to format the URLs.
+    """
+    field_names = {GRAPHITE_ATTRIBUTE_ID}
+    for collection in collections:
+        field_names.update(collection.field_names())
+    attribute_ids = {'hostname'}
+    attribute_ids.update(a for a in field_names if a in Attribute.specials)
+    attribute_ids.update(Attribute.objects.filter(
+        attribute_id__in=field_names
+    ).values_list('attribute_id', flat=True))
+
+    return sorted(attribute_ids)
+
 
 def format_attribute_value(value):
     """Apply random rules we have to the attribute values"""
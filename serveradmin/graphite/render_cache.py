@@ -0,0 +1,264 @@
+"""Serveradmin - Graphite Integration
+
+The rendered graphs are cached on disk, so that the graph table pages
+don't send all of their graphs to Graphite again on every reload.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import logging
+import re
+import time
+from hashlib import sha1
+from operator import itemgetter
+from os import fstat, getpid, makedirs, remove, replace, stat, utime, walk
+from os.path import dirname, join
+from threading import BoundedSemaphore, Condition, Lock, Thread, get_ident
+from urllib.parse import parse_qsl, urlencode
+
+from serveradmin.graphite.client import (
+    GRAPHITE_TIMEOUT,
+    GraphiteError,
+    get_from_graphite,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to cache the graphs, the time windows of the graphs are divided
+# by the divisor, but the result is kept between the minimum and maximum
+MIN_RENDER_TTL = 60
+MAX_RENDER_TTL = 3600
+RENDER_TTL_DIVISOR = 300
+
+# The ratio of the maximum size the cache is reduced to when it is full,
+# so that we don't need to evict on every write
+EVICT_RATIO = 0.9
+
+# Seconds after which the temporary files are considered to be left over
+# from crashed processes
+TMP_FILE_MAX_AGE = 3600
+
+# The units of the relative times of Graphite by their prefixes
+TIME_UNITS = (
+    ('s', 1),
+    ('min', 60),
+    ('h', 60 * 60),
+    ('d', 24 * 60 * 60),
+    ('w', 7 * 24 * 60 * 60),
+    ('mon', 30 * 24 * 60 * 60),
+    ('y', 365 * 24 * 60 * 60),
+)
+RELATIVE_TIME_RE = re.compile(r'\A(?:now)?(?:([+-])(\d+)([a-z]+))?\Z')
+
+
+class RenderCache:
+    """Size bounded on-disk cache of the rendered graphs
+
+    The graphs are keyed by their normalised render params, and kept for
+    a part of their time window.  The expired graphs are served for as long
+    again while they are refreshed in the background.  The least
+    recently used graphs are evicted when the cache grows over its size.
+    The access times of the files are set explicitly, so this doesn't
+    depend on the mount options of the file system.
+    """
+
+    def __init__(self, directory, max_size, concurrency, clock=time.time):
+        self.directory = directory
+        self.max_size = max_size
+        self._clock = clock
+        self._semaphore = BoundedSemaphore(concurrency)
+        self._condition = Condition()
+        self._in_flight = set()
+        self._evict_lock = Lock()
+        self._size = None       # Estimate, it is None until the first scan
+
+    def open(self, params):
+        """Open the graph of the render params fetching it if necessary
+
+        The returned file stays readable even if the graph is evicted or
+        replaced in the meantime.
+        """
+        params = normalize_params(params)
+        key = sha1(params.encode()).hexdigest()
+        path = join(self.directory, key[:2], key + '.png')
+        ttl = get_ttl(params)
+
+        while True:
+            fd = self._open_cached(path, ttl * 2)
+            if fd is not None:
+                age = self._clock() - fstat(fd.fileno()).st_mtime
+                if age >= ttl:
+                    with self._condition:
+                        if key not in self._in_flight:
+                            self._in_flight.add(key)
+                            Thread(
+                                target=self._refresh, args=(key, path, params),
+                                daemon=True,
+                            ).start()
+                return fd
+            with self._condition:
+                if key not in self._in_flight:
+                    self._in_flight.add(key)
+                    break
+                self._condition.wait()
+
+        try:
+            return self._fetch(path, params)
+        finally:
+            self._done(key)
+
+    def _open_cached(self, path, max_age):
+        try:
+            fd = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        mtime = fstat(fd.fileno()).st_mtime
+        if self._clock() - mtime >= max_age:
+            fd.close()
+            return None
+
+        # The access time is used to find the least recently used graphs
+        try:
+            utime(path, (self._clock(), mtime))
+        except FileNotFoundError:
+            pass
+
+        return fd
+
+    def _refresh(self, key, path, params):
+        try:
+            self._fetch(path, params).close()
+        except Exception:
+            logger.exception('Refreshing graph "{}" failed'.format(params))
+        finally:
+            self._done(key)
+
+    def _done(self, key):
+        with self._condition:
+            self._in_flight.discard(key)
+            self._condition.notify_all()
+
+    def _fetch(self, path, params):
+        makedirs(dirname(path), exist_ok=True)
+        tmp_path = '{}.{}.{}.tmp'.format(path, getpid(), get_ident())
+        fd = open(tmp_path, 'w+b')
+        try:
+            if not self._semaphore.acquire(timeout=GRAPHITE_TIMEOUT):
+                raise GraphiteError('Too many concurrent requests to Graphite')
+            try:
+                get_from_graphite('/render', params, fd)
+            finally:
+                self._semaphore.release()
+            fd.flush()
+            now = self._clock()
+            utime(tmp_path, (now, now))
+            replace(tmp_path, path)
+        except BaseException:
+            fd.close()
+            try:
+                remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self._add_size(fstat(fd.fileno()).st_size)
+        fd.seek(0)
+
+        return fd
+
+    def _add_size(self, size):
+        # The replaced graphs are counted twice, but the estimate is
+        # corrected by the scan before anything is evicted.
+        with self._evict_lock:
+            if self._size is not None:
+                self._size += size
+                if self._size <= self.max_size:
+                    return
+            try:
+                self._evict()
+            except OSError:
+                logger.exception('Evicting the cached graphs failed')
+
+    def _evict(self):
+        files = sorted(self._scan())
+        size = sum(s for a, s, p in files)
+        if size > self.max_size:
+            for atime, file_size, path in files:
+                if size <= self.max_size * EVICT_RATIO:
+                    break
+                try:
+                    remove(path)
+                except FileNotFoundError:
+                    pass
+                size -= file_size
+        self._size = size
+
+    def _scan(self):
+        """Yield the access times, sizes and paths of the cached graphs
+
+        The temporary files left over from crashed processes are removed.
+        """
+        for dir_path, dir_names, file_names in walk(self.directory):
+            for file_name in file_names:
+                path = join(dir_path, file_name)
+                try:
+                    st = stat(path)
+                    if file_name.endswith('.png'):
+                        yield st.st_atime, st.st_size, path
+                    elif self._clock() - st.st_mtime > TMP_FILE_MAX_AGE:
+                        remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+def normalize_params(params):
+    """Sort the render params by their names
+
+    The order of the params with the same name, like the targets, is kept
+    as it matters for the graph.
+    """
+    return urlencode(sorted(
+        parse_qsl(params, keep_blank_values=True), key=itemgetter(0)
+    ))
+
+
+def get_ttl(params):
+    """Get the seconds to cache the graph of the render params
+
+    Graphite draws about a point per pixel, so the graphs of the longer
+    time windows change less often.  The graphs ending at an absolute time
+    are expected not to change at all.
+    """
+    values = dict(parse_qsl(params))
+    until = parse_relative_time(values.get('until') or 'now')
+    if until is None:
+        return MAX_RENDER_TTL
+    start = parse_relative_time(values.get('from') or '-24h')
+    if start is None:
+        return MIN_RENDER_TTL
+
+    return min(max(
+        (until - start) // RENDER_TTL_DIVISOR, MIN_RENDER_TTL
+    ), MAX_RENDER_TTL)
+
+
+def parse_relative_time(value):
+    """Parse the relative time of Graphite to seconds
+
+    None is returned for the absolute times.
+    """
+    match = RELATIVE_TIME_RE.match(value)
+    if not match:
+        return None
+    sign, number, unit = match.groups()
+    if not number:
+        return 0
+    for prefix, seconds in TIME_UNITS:
+        if unit.startswith(prefix):
+            break
+    else:
+        return None
+    if sign == '-':
+        return -int(number) * seconds
+
+    return int(number) * seconds
@@ -0,0 +1,100 @@
+"""Serveradmin - Graphite TTL cache tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import time
+from threading import Event, Thread
+from unittest import TestCase
+
+from serveradmin.graphite.cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.calls = []
+
+    def func(self, value):
+        def _func():
+            self.calls.append(value)
+            return value
+
+        return _func
+
+    def test_ttl(self):
+        cache = TTLCache(10, clock=self.clock)
+        self.assertEqual(cache.get('key', self.func(1)), 1)
+        self.clock.now = 9
+        self.assertEqual(cache.get('key', self.func(2)), 1)
+        self.clock.now = 10
+        self.assertEqual(cache.get('key', self.func(3)), 3)
+        self.assertEqual(self.calls, [1, 3])
+
+    def test_error(self):
+        cache = TTLCache(10, clock=self.clock)
+
+        def fail():
+            raise IOError()
+
+        with self.assertRaises(IOError):
+            cache.get('key', fail)
+        self.assertEqual(cache.get('key', self.func(1)), 1)
+
+    def test_max_size(self):
+        cache = TTLCache(10, max_size=2, clock=self.clock)
+        for key in ('a', 'b', 'c'):
+            cache.get(key, self.func(key))
+        cache.get('a', self.func('a'))
+        self.assertEqual(self.calls, ['a', 'b', 'c', 'a'])
+
+    def test_coalescing(self):
+        cache = TTLCache(10, clock=self.clock)
+        started = Event()
+        release = Event()
+
+        def slow():
+            self.calls.append(1)
+            started.set()
+            release.wait(10)
+            return 1
+
+        results = []
+        threads = [
+            Thread(target=lambda: results.append(cache.get('key', slow)))
+            for i in range(4)
+        ]
+        threads[0].start()
+        started.wait(10)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(results, [1] * 4)
+        self.assertEqual(self.calls, [1])
+
+    def test_stale(self):
+        cache = TTLCache(10, stale_ttl=10, clock=self.clock)
+        cache.get('key', self.func(1))
+        self.clock.now = 15
+
+        # The stale value is served while refreshing in the background.
+        self.assertEqual(cache.get('key', self.func(2)), 1)
+        for i in range(1000):
+            if cache.get('key', self.func(3)) == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.calls, [1, 2])
+
+        self.clock.now = 40
+        self.assertEqual(cache.get('key', self.func(4)), 4)
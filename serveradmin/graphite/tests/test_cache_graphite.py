@@ -0,0 +1,287 @@
+"""Serveradmin - Graphite sprite cache tests
+
+The command runs against a local stub of the Graphite render API.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import json
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from os import listdir, makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from serveradmin.dataset import Query
+from serveradmin.graphite.client import GraphiteError
+from serveradmin.graphite.models import (
+    GRAPHITE_ATTRIBUTE_ID,
+    Collection,
+    Numeric,
+    Template,
+    Variation,
+)
+from serveradmin.serverdb.models import (
+    Attribute,
+    ServerNumberAttribute,
+    Servertype,
+    ServertypeAttribute,
+)
+
+
+class GraphiteStub(BaseHTTPRequestHandler):
+    """Respond to the render requests with PNG or JSON like Graphite"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.server.requests.append((
+            self.client_address,
+            self.headers.get('Authorization'),
+            parse_qs(url.query),
+        ))
+        if self.server.status != 200:
+            body = b'error'
+        elif parse_qs(url.query).get('format') == ['json']:
+            body = json.dumps([
+                {'datapoints': [[self.server.value, 0]]}
+            ]).encode()
+        else:
+            fd = BytesIO()
+            Image.new('RGB', (
+                settings.GRAPHITE_SPRITE_WIDTH, settings.GRAPHITE_SPRITE_HEIGHT
+            ), (255, 0, 0)).save(fd, 'PNG')
+            body = fd.getvalue()
+
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCacheGraphite(TransactionTestCase):
+    fixtures = ['auth_user.json']
+
+    def setUp(self):
+        any_value = {'regexp': r'\A.*\Z'}
+        servertype = Servertype.objects.create(
+            servertype_id='test', ip_addr_type='null'
+        )
+        for attribute in Attribute.objects.bulk_create([
+            Attribute(
+                attribute_id=GRAPHITE_ATTRIBUTE_ID, type='string', multi=True,
+                **any_value
+            ),
+            Attribute(attribute_id='state', type='string', **any_value),
+            Attribute(
+                attribute_id='load', type='number', readonly=True, **any_value
+            ),
+        ]):
+            ServertypeAttribute.objects.create(
+                servertype=servertype, attribute=attribute
+            )
+        for hostname in ('test1', 'test2'):
+            server = Query().new_object('test')
+            server['hostname'] = hostname
+            server[GRAPHITE_ATTRIBUTE_ID].add('os')
+            server['state'] = 'online'
+            server.commit(user=User.objects.first())
+
+        collection = Collection.objects.create(name='os', overview=True)
+        Template.objects.create(
+            collection=collection, name='CPU', params='target=cpu.{hostname}'
+        )
+        for name in ('Daily', 'Weekly'):
+            Variation.objects.create(
+                collection=collection, name=name, params='from=-' + name,
+                summarize_interval='1h',
+            )
+        Numeric.objects.create(
+            collection=collection, attribute_id='load',
+            params='target=load.{hostname}&format=json',
+        )
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), GraphiteStub)
+        self.server.requests = []
+        self.server.status = 200
+        self.server.value = 3
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.media_root = TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.media_root.cleanup()
+
+    def cache_graphite(self, *args):
+        with override_settings(
+            GRAPHITE_URL='http://127.0.0.1:{}'.format(
+                self.server.server_address[1]
+            ),
+            GRAPHITE_USER='user',
+            GRAPHITE_PASSWORD='secret',
+            MEDIA_ROOT=self.media_root.name,
+        ), redirect_stdout(StringIO()):
+            call_command('cache_graphite', *args)
+
+    def test_cache_graphite(self):
+        self.cache_graphite('--workers=2', '--processes=2')
+
+        collection_dir = join(self.media_root.name, 'graph_sprite', 'os')
+        self.assertEqual(sorted(listdir(collection_dir)), [
+            'manifest.json', 'test1.png', 'test2.png'
+        ])
+        with Image.open(join(collection_dir, 'test1.png')) as sprite:
+            self.assertEqual(sprite.size, (
+                settings.GRAPHITE_SPRITE_WIDTH * 2,
+                settings.GRAPHITE_SPRITE_HEIGHT,
+            ))
+            self.assertEqual(sprite.getpixel((0, 0)), (255, 0, 0))
+
+        self.assertEqual(
+            [
+                sa.get_value()
+                for sa in ServerNumberAttribute.objects.filter(
+                    attribute_id='load'
+                )
+            ],
+            [3, 3],
+        )
+
+        # Two graphs and a numeric for every server
+        self.assertEqual(len(self.server.requests), 6)
+        for client_address, authorization, params in self.server.requests:
+            self.assertEqual(authorization, 'Basic dXNlcjpzZWNyZXQ=')
+
+    def render_requests(self):
+        return [r for r in self.server.requests if 'format' not in r[2]]
+
+    def test_manifest(self):
+        self.cache_graphite()
+
+        collection_dir = join(self.media_root.name, 'graph_sprite', 'os')
+        with open(join(collection_dir, 'manifest.json')) as fd:
+            manifest = json.load(fd)
+        self.assertEqual(sorted(manifest), ['test1', 'test2'])
+        self.assertEqual(
+            manifest['test1']['object_id'],
+            Query({'hostname': 'test1'}).get().object_id,
+        )
+
+    def test_max_age(self):
+        self.cache_graphite()
+        self.server.requests.clear()
+
+        self.cache_graphite('--max-age=3600')
+        self.assertEqual(self.render_requests(), [])
+        # The numerics are fetched anyway.
+        self.assertEqual(len(self.server.requests), 2)
+
+        Template.objects.update(params='target=cpu.{hostname}.total')
+        self.cache_graphite('--max-age=3600')
+        self.assertEqual(len(self.render_requests()), 4)
+
+    def test_only_servers(self):
+        self.cache_graphite('--only-servers', 'test1')
+
+        collection_dir = join(self.media_root.name, 'graph_sprite', 'os')
+        self.assertEqual(sorted(listdir(collection_dir)), [
+            'manifest.json', 'test1.png'
+        ])
+
+    def test_orphans(self):
+        collection_dir = join(self.media_root.name, 'graph_sprite', 'os')
+        makedirs(collection_dir)
+        open(join(collection_dir, 'test3.png'), 'w').close()
+
+        self.cache_graphite('--only-servers', 'test1')
+        self.assertIn('test3.png', listdir(collection_dir))
+
+        Query({'hostname': 'test2'}, ['state']).update(state='retired').commit(
+            user=User.objects.first()
+        )
+        self.cache_graphite()
+        self.assertEqual(sorted(listdir(collection_dir)), [
+            'manifest.json', 'test1.png'
+        ])
+
+    def test_orphans_graphite_error(self):
+        self.cache_graphite()
+        collection_dir = join(self.media_root.name, 'graph_sprite', 'os')
+        with open(join(collection_dir, 'manifest.json')) as fd:
+            entry = json.load(fd)['test1']
+
+        graph_table = Collection.graph_table
+
+        def failing_graph_table(collection, server, *args):
+            if server['hostname'] == 'test1':
+                raise GraphiteError('Timeout')
+            return graph_table(collection, server, *args)
+
+        with mock.patch.object(
+            Collection, 'graph_table', failing_graph_table
+        ):
+            self.cache_graphite('--max-age=3600')
+        self.assertEqual(sorted(listdir(collection_dir)), [
+            'manifest.json', 'test1.png', 'test2.png'
+        ])
+        with open(join(collection_dir, 'manifest.json')) as fd:
+            self.assertEqual(json.load(fd)['test1'], entry)
+
+    def test_numerics_lock(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.cache_graphite()
+        statements = [q['sql'].split(' ', 3)[:3] for q in queries]
+
+        # The commits are locked out before writing the numerics.
+        lock = statements.index(['LOCK', 'TABLE', 'serverdb_changecommit'])
+        self.assertEqual(statements[lock + 1][:2], ['WITH', 'new'])
+
+    def test_numerics_update(self):
+        self.cache_graphite()
+        self.server.value = 5
+        self.cache_graphite('--flush-interval=0')
+
+        self.assertEqual(
+            [
+                sa.get_value()
+                for sa in ServerNumberAttribute.objects.filter(
+                    attribute_id='load'
+                )
+            ],
+            [5, 5],
+        )
+
+    def test_connection_reuse(self):
+        self.cache_graphite('--workers=1', '--processes=1')
+
+        self.assertEqual(
+            len({r[0] for r in self.server.requests}), 1
+        )
+
+    def test_graphite_error(self):
+        self.server.status = 500
+        self.cache_graphite('--workers=2', '--processes=1')
+
+        collection_dir = join(self.media_root.name, 'graph_sprite', 'os')
+        with Image.open(join(collection_dir, 'test1.png')) as sprite:
+            self.assertEqual(sprite.getpixel((0, 0)), (255, 255, 255))
+        self.assertFalse(
+            ServerNumberAttribute.objects.filter(attribute_id='load').exists()
+        )
@@ -0,0 +1,152 @@
+"""Serveradmin - Graphite model tests
+
+The benchmark of rendering the graph tables of many servers only runs
+with SERVERADMIN_BENCHMARK set to the number of servers.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import os
+import time
+from unittest import skipUnless
+
+from django.test import TestCase
+
+from serveradmin.graphite.models import (
+    AttributeFormatter,
+    Collection,
+    Template,
+    Variation,
+    compile_params,
+)
+
+BENCHMARK_SIZE = int(os.environ.get('SERVERADMIN_BENCHMARK') or 0)
+
+
+class TestCompiledParams(TestCase):
+    def setUp(self):
+        self.server = {'hostname': 'web1.example.com', 'num_cpu': 4}
+        self.collection = Collection.objects.create(
+            name='test', params='width=100&\nheight=50'
+        )
+        for index in range(2):
+            Template.objects.create(
+                collection=self.collection,
+                name='template{}'.format(index),
+                params='target={hostname}.cpu' + str(index),
+                sort_order=index,
+            )
+            Variation.objects.create(
+                collection=self.collection,
+                name='variation{}'.format(index),
+                params='from=-{summarize_interval}',
+                summarize_interval='{}h'.format(index + 1),
+                sort_order=index,
+            )
+
+    def test_render(self):
+        for params in (
+            'target={hostname}&cpus={num_cpu}',
+            'target={{literal}}{missing}',
+            'target={hostname:>20}&{hostname!r}&{0}',
+            'id={foreach_id}',
+            '',
+        ):
+            self.assertEqual(
+                AttributeFormatter({'foreach_id': 'cpu0'}).render(
+                    compile_params(params), self.server
+                ),
+                AttributeFormatter({'foreach_id': 'cpu0'}).vformat(
+                    params, (), self.server
+                ),
+            )
+
+    def test_graph_table(self):
+        collection = Collection.objects.get(pk=self.collection.pk)
+        self.assertEqual(collection.graph_table(self.server), [
+            ('template0', [
+                ('variation0', (
+                    'width=100&height=50&from=-1h&target=web1_example_com.cpu0'
+                )),
+                ('variation1', (
+                    'width=100&height=50&from=-2h&target=web1_example_com.cpu0'
+                )),
+            ]),
+            ('template1', [
+                ('variation0', (
+                    'width=100&height=50&from=-1h&target=web1_example_com.cpu1'
+                )),
+                ('variation1', (
+                    'width=100&height=50&from=-2h&target=web1_example_com.cpu1'
+                )),
+            ]),
+        ])
+        self.assertEqual(collection.graph_column(self.server, 'from=-1d'), [
+            ('template0', (
+                'width=100&height=50&target=web1_example_com.cpu0&from=-1d'
+            )),
+            ('template1', (
+                'width=100&height=50&target=web1_example_com.cpu1&from=-1d'
+            )),
+        ])
+
+    def test_save(self):
+        collection = Collection.objects.get(pk=self.collection.pk)
+        with self.assertNumQueries(2):
+            collection.graph_table(self.server)
+            collection.graph_table({'hostname': 'web2'})
+
+        collection.params = 'width=200'
+        collection.save()
+        self.assertEqual(
+            collection.graph_table(self.server)[0][1][0][1],
+            'width=200&from=-1h&target=web1_example_com.cpu0',
+        )
+
+
+@skipUnless(BENCHMARK_SIZE, 'SERVERADMIN_BENCHMARK is not set')
+class BenchmarkCompiledParams(TestCase):
+    def setUp(self):
+        self.collection = Collection.objects.create(name='test', params=(
+            'width=500&height=300&lineMode=connected'
+        ))
+        for index in range(10):
+            Template.objects.create(
+                collection=self.collection,
+                name='template{}'.format(index),
+                params=(
+                    'target=alias(summarize(servers.{{hostname}}.system.'
+                    'metric{},"{{summarize_interval}}","avg"),"{{hostname}}")'
+                ).format(index),
+                sort_order=index,
+            )
+        for index in range(5):
+            Variation.objects.create(
+                collection=self.collection,
+                name='variation{}'.format(index),
+                params='from=-{}d'.format(index + 1),
+                summarize_interval='{}min'.format(index + 1),
+                sort_order=index,
+            )
+
+    def test_benchmark(self):
+        collection = Collection.objects.get(pk=self.collection.pk)
+        servers = [
+            {'hostname': 'host{}.example.com'.format(index)}
+            for index in range(BENCHMARK_SIZE)
+        ]
+        collection.graph_table(servers[0])
+        start = time.monotonic()
+        for server in servers:
+            graph_table = collection.graph_table(server)
+        duration = time.monotonic() - start
+
+        # Every graph of the last server is rendered for it
+        urls = [u for t, v in graph_table for n, u in v]
+        self.assertEqual(len(urls), 50)
+        self.assertTrue(all(
+            'host{}_example_com'.format(BENCHMARK_SIZE - 1) in u for u in urls
+        ))
+        print('{} graphs in {:.3f} seconds, {:.1f} microseconds each'.format(
+            len(servers) * 50, duration, duration / len(servers) / 50 * 10**6
+        ))
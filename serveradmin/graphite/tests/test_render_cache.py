@@ -0,0 +1,175 @@
+"""Serveradmin - Graphite render cache tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import walk
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from serveradmin.graphite.client import GraphiteError
+from serveradmin.graphite.render_cache import (
+    MAX_RENDER_TTL,
+    MIN_RENDER_TTL,
+    RenderCache,
+    get_ttl,
+    normalize_params,
+    parse_relative_time,
+)
+
+
+class RenderStub(BaseHTTPRequestHandler):
+    """Respond with the targets and the number of the request in 100 bytes"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append(parse_qs(urlsplit(self.path).query))
+        body = '{} {}'.format(
+            ','.join(self.server.requests[-1].get('target', [])),
+            len(self.server.requests),
+        ).ljust(100).encode()
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+class TestRenderCache(TestCase):
+    fixtures = ['auth_user.json']
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RenderStub)
+        self.server.requests = []
+        self.server.status = 200
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.directory = TemporaryDirectory()
+        self.clock = Clock()
+        self.cache = RenderCache(self.directory.name, 1024, 2, self.clock)
+        settings_override = override_settings(
+            GRAPHITE_URL='http://127.0.0.1:{}'.format(
+                self.server.server_address[1]
+            ),
+            GRAPHITE_USER=None,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def read(self, params):
+        with self.cache.open(params) as fd:
+            return fd.read().decode().rstrip()
+
+    def get_files(self):
+        return sorted(
+            name
+            for path, dir_names, file_names in walk(self.directory.name)
+            for name in file_names
+        )
+
+    def wait_for_requests(self, count):
+        for retry in range(100):
+            if len(self.server.requests) >= count:
+                if not self.cache._in_flight:
+                    return
+            time.sleep(0.05)
+        self.fail('Graphite got {} requests instead of {}'.format(
+            len(self.server.requests), count
+        ))
+
+    def test_normalize_params(self):
+        self.assertEqual(
+            normalize_params('width=10&target=b&from=-1h&target=a'),
+            'from=-1h&target=b&target=a&width=10',
+        )
+        self.assertEqual(self.read('target=a&from=-1h'), 'a 1')
+        self.assertEqual(self.read('from=-1h&target=a'), 'a 1')
+        self.assertEqual(self.read('target=b&target=a'), 'b,a 2')
+        self.assertEqual(self.read('target=a&target=b'), 'a,b 3')
+
+    def test_ttl(self):
+        self.assertEqual(parse_relative_time('now'), 0)
+        self.assertEqual(parse_relative_time('-3days'), -3 * 24 * 60 * 60)
+        self.assertEqual(parse_relative_time('now-5min'), -5 * 60)
+        self.assertIsNone(parse_relative_time('20210101'))
+        self.assertEqual(get_ttl(''), 24 * 60 * 60 // 300)
+        self.assertEqual(get_ttl('from=-1h'), MIN_RENDER_TTL)
+        self.assertEqual(get_ttl('from=-30d'), MAX_RENDER_TTL)
+        self.assertEqual(get_ttl('from=-2d&until=-1d'), 24 * 60 * 60 // 300)
+        self.assertEqual(get_ttl('until=20210101'), MAX_RENDER_TTL)
+        self.assertEqual(get_ttl('from=20210101'), MIN_RENDER_TTL)
+
+    def test_stale(self):
+        self.assertEqual(self.read('target=a&from=-1h'), 'a 1')
+        self.clock.now += MIN_RENDER_TTL - 1
+        self.assertEqual(self.read('target=a&from=-1h'), 'a 1')
+        self.assertEqual(len(self.server.requests), 1)
+
+        # The stale graph is served while it is refreshed
+        self.clock.now += 1
+        self.assertEqual(self.read('target=a&from=-1h'), 'a 1')
+        self.wait_for_requests(2)
+        self.assertEqual(self.read('target=a&from=-1h'), 'a 2')
+
+        # The graph is fetched again when it is too old to be served
+        self.clock.now += MIN_RENDER_TTL * 2
+        self.assertEqual(self.read('target=a&from=-1h'), 'a 3')
+
+    def test_error(self):
+        self.server.status = 500
+        with self.assertRaises(GraphiteError):
+            self.cache.open('target=a')
+        self.assertEqual(self.get_files(), [])
+
+        self.server.status = 200
+        self.assertEqual(self.read('target=a'), 'a 2')
+
+    def test_evict(self):
+        # Every graph is 100 bytes, so 3 of them fit into the cache.
+        self.cache.max_size = 350
+        for target in ('a', 'b', 'c', 'a', 'd'):
+            self.clock.now += 1
+            self.read('target=' + target)
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(len(self.get_files()), 3)
+
+        # The least recently used graph was evicted.
+        for target in ('a', 'c', 'd'):
+            self.read('target=' + target)
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.read('target=b'), 'b 5')
+
+    def test_view(self):
+        self.client.force_login(User.objects.first())
+        with mock.patch('serveradmin.graphite.views.render_cache', self.cache):
+            response = self.client.get('/graphite/graph?target=a')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(b''.join(response.streaming_content).rstrip(), b'a 1')
+
+        self.server.status = 500
+        with mock.patch('serveradmin.graphite.views.render_cache', self.cache):
+            response = self.client.get('/graphite/graph?target=b')
+        self.assertEqual(response.status_code, 500)
@@ -0,0 +1,93 @@
+"""Serveradmin - Graphite view tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from serveradmin.dataset import Query
+from serveradmin.graphite.models import (
+    GRAPHITE_ATTRIBUTE_ID,
+    Collection,
+    Template,
+    Variation,
+    get_attribute_ids,
+)
+from serveradmin.serverdb.models import (
+    Attribute,
+    Servertype,
+    ServertypeAttribute,
+)
+
+
+class TestGraphViews(TransactionTestCase):
+    fixtures = ['auth_user.json']
+
+    def setUp(self):
+        any_value = {'regexp': r'\A.*\Z'}
+        servertype = Servertype.objects.create(
+            servertype_id='test', ip_addr_type='null'
+        )
+        for attribute in Attribute.objects.bulk_create([
+            Attribute(
+                attribute_id=GRAPHITE_ATTRIBUTE_ID, type='string', multi=True,
+                **any_value
+            ),
+            Attribute(attribute_id='os', type='string', **any_value),
+            Attribute(attribute_id='unused', type='string', **any_value),
+        ]):
+            ServertypeAttribute.objects.create(
+                servertype=servertype, attribute=attribute
+            )
+        for hostname in ('test1', 'test2'):
+            server = Query().new_object('test')
+            server['hostname'] = hostname
+            server[GRAPHITE_ATTRIBUTE_ID].add('os')
+            server['os'] = 'bullseye'
+            server['unused'] = 'value'
+            server.commit(user=User.objects.first())
+
+        for overview in (False, True):
+            collection = Collection.objects.create(
+                name='os', overview=overview, params='width=10'
+            )
+            Template.objects.create(
+                collection=collection, name='CPU',
+                params='target={os}.{hostname}.{missing}',
+            )
+            Variation.objects.create(
+                collection=collection, name='Daily',
+                params='from=-{summarize_interval}', summarize_interval='1d',
+            )
+        self.client.force_login(User.objects.first())
+
+    def test_attribute_ids(self):
+        self.assertEqual(get_attribute_ids(Collection.objects.all()), [
+            GRAPHITE_ATTRIBUTE_ID, 'hostname', 'os'
+        ])
+
+    def test_graph_table(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/graphite/graph_table?hostname=test1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['graph_table'], [
+            ('CPU', [('Daily', 'width=10&from=-1d&target=bullseye.test1.')]),
+        ])
+        self.assertFalse(any('unused' in q['sql'] for q in queries))
+
+    def test_graph_popup(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                '/resources/graph_popup?hostname=test1&graph=0'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context['image'],
+            '/graphite/graph?width=10&from=-1d&target=bullseye.test1.',
+        )
+        self.assertEqual(sum(
+            q['sql'].startswith('SELECT server.server_id') for q in queries
+        ), 1)
@@ -2,18 +2,17 @@
 
 Copyright (c) 2019 InnoGames GmbH
 """
+from os import fstat
 from urllib.parse import urlencode
-from urllib.request import (
-    HTTPBasicAuthHandler,
-    HTTPPasswordMgrWithDefaultRealm,
-    build_opener
-)
+from wsgiref.util import FileWrapper
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import (
-    HttpResponse, HttpResponseBadRequest, HttpResponseServerError
+    HttpResponseBadRequest,
+    HttpResponseServerError,
+    StreamingHttpResponse,
 )
 from django.template.response import TemplateResponse
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -25,6 +24,14 @@ from serveradmin.graphite.models import (
     GRAPHITE_ATTRIBUTE_ID,
     Collection,
     format_attribute_value,
+    get_attribute_ids,
+)
+from serveradmin.graphite.render_cache import RenderCache
+
+render_cache = RenderCache(
+    settings.GRAPHITE_RENDER_CACHE_DIR,
+    settings.GRAPHITE_RENDER_CACHE_SIZE,
+    settings.GRAPHITE_RENDER_CONCURRENCY,
 )
 
 
@@ -43,11 +50,22 @@ def graph_table(request):
     if len(hostnames) == 0 and len(object_ids) == 0:
         return HttpResponseBadRequest('No hostname or object_id provided')
 
+    # The collections are fetched in advance to query only the attributes
+    # their graphs need.
+    all_collections = list(
+        Collection.objects.order_by('overview', 'sort_order')
+        .prefetch_related('template_set', 'variation_set')
+    )
+    attribute_ids = get_attribute_ids(all_collections)
+
     # For convenience we will cache the servers in a dictionary.
-    servers = {s['hostname']: s for s in
-               Query({'hostname': Any(*hostnames)}, None)}
-    servers.update({s['hostname']: s for s in
-                    Query({'object_id': Any(*object_ids)}, None)})
+    servers = {}
+    if hostnames:
+        servers.update({s['hostname']: s for s in
+                        Query({'hostname': Any(*hostnames)}, attribute_ids)})
+    if object_ids:
+        servers.update({s['hostname']: s for s in
+                        Query({'object_id': Any(*object_ids)}, attribute_ids)})
 
     if len(servers) != len(hostnames) + len(object_ids):
         messages.error(
@@ -59,7 +77,7 @@ def graph_table(request):
     # If there are two collections with same match, use only the one which
     # is not an overview.
     collections = []
-    for collection in Collection.objects.order_by('overview', 'sort_order'):
+    for collection in all_collections:
         if any(collection.name == c.name for c in collections):
             continue
         for hostname in servers.keys():
@@ -139,18 +157,6 @@ def graph(request):
     Instead, here we download the graph using our credentials and pass
     it to the user.
     """
-    password_mgr = HTTPPasswordMgrWithDefaultRealm()
-    password_mgr.add_password(
-        None,
-        settings.GRAPHITE_URL,
-        settings.GRAPHITE_USER,
-        settings.GRAPHITE_PASSWORD,
-    )
-    auth_handler = HTTPBasicAuthHandler(password_mgr)
-    url = '{0}/render?{1}'.format(
-        settings.GRAPHITE_URL, request.GET.urlencode()
-    )
-
     # If the Graphite server fails, we would return proper server error
     # to the user instead of failing.  This is not really a matter for
     # the user as they would get a 500 in any case, but it is a matter for
@@ -158,7 +164,13 @@ def graph(request):
     # errors are more likely to happen.  Graphite has the tendency to return
     # empty result with 200 instead of proper error codes.
     try:
-        with build_opener(auth_handler).open(url) as response:
-            return HttpResponse(response.read(), content_type='image/png')
+        fd = render_cache.open(request.GET.urlencode())
     except IOError as error:
         return HttpResponseServerError(str(error))
+
+    # The file is streamed with its size taken from the descriptor, as its
+    # path may already be replaced by a newer graph.
+    response = StreamingHttpResponse(FileWrapper(fd), content_type='image/png')
+    response['Content-Length'] = fstat(fd.fileno()).st_size
+
+    return response
@@ -0,0 +1,16 @@
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'HOST': '127.0.0.1',
+        'PORT': '5432',
+        'NAME': 'serveradmin',
+        'USER': 'serveradmin',
+        'PASSWORD': 'serveradmin',
+        'OPTIONS': {
+            'connect_timeout': 1,
+            'client_encoding': 'UTF8',
+        },
+    },
+}
+SECRET_KEY = 'TEST'
+LOGGING = {}
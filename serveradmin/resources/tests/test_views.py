@@ -0,0 +1,99 @@
+"""Serveradmin - Resources view tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from serveradmin.dataset import Query
+from serveradmin.graphite.models import GRAPHITE_ATTRIBUTE_ID, Collection
+from serveradmin.serverdb.models import (
+    Attribute,
+    Servertype,
+    ServertypeAttribute,
+)
+
+
+class TestIndex(TransactionTestCase):
+    fixtures = ['auth_user.json']
+
+    def setUp(self):
+        any_value = {'regexp': r'\A.*\Z'}
+        hv = Servertype.objects.create(servertype_id='hv', ip_addr_type='null')
+        vm = Servertype.objects.create(servertype_id='vm', ip_addr_type='null')
+        graphs = Attribute.objects.create(
+            attribute_id=GRAPHITE_ATTRIBUTE_ID, type='string', multi=True,
+            **any_value
+        )
+        hypervisor = Attribute.objects.create(
+            attribute_id='hypervisor', type='relation',
+            target_servertype=hv, **any_value
+        )
+        vms = Attribute.objects.create(
+            attribute_id='vms', type='reverse', multi=True, readonly=True,
+            reversed_attribute=hypervisor, **any_value
+        )
+        for servertype, attribute in (
+            (hv, graphs), (hv, vms), (vm, graphs), (vm, hypervisor)
+        ):
+            ServertypeAttribute.objects.create(
+                servertype=servertype, attribute=attribute
+            )
+
+        for hostname in ('hv1', 'hv2', 'hv3'):
+            self.create('hv', hostname)
+        self.create('vm', 'vm1', hypervisor='hv1')
+        self.create('vm', 'vm2', hypervisor='hv2')
+        self.create('vm', 'vm3', hypervisor='hv2')
+        self.create('vm', 'vm4')
+
+        collection = Collection.objects.create(name='os', overview=True)
+        collection.relation_set.create(attribute=vms)
+        self.client.force_login(User.objects.first())
+
+    def create(self, servertype, hostname, **attributes):
+        obj = Query().new_object(servertype)
+        obj['hostname'] = hostname
+        obj[GRAPHITE_ATTRIBUTE_ID] = {'os'}
+        for attribute_id, value in attributes.items():
+            obj[attribute_id] = value
+        obj.commit(user=User.objects.first())
+
+    def get_page(self, term, page, queries=1):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get('/resources/', {
+                'term': term, 'per_page': 2, 'page': page,
+            })
+        self.assertEqual(response.status_code, 200)
+        hosts = response.context['hosts']
+
+        # The count and the page are fetched at once
+        self.assertEqual(sum(
+            q['sql'].startswith('WITH related AS') for q in captured
+        ), queries)
+
+        return hosts.paginator.count, [h['hostname'] for h in hosts]
+
+    def test_pages(self):
+        self.assertEqual(self.get_page('servertype=vm', 1), (3, [
+            'hv1', 'hv2'
+        ]))
+        self.assertEqual(self.get_page('servertype=vm', 2), (3, ['vm4']))
+
+        # The page is reset when it doesn't exist anymore
+        self.assertEqual(self.get_page('servertype=hv', 3, queries=2), (3, [
+            'hv1', 'hv2'
+        ]))
+
+    def test_matched_hostnames(self):
+        response = self.client.get('/resources/', {'term': 'vm3'})
+        self.assertEqual(
+            [h['hostname'] for h in response.context['hosts']], ['hv2']
+        )
+        self.assertEqual(response.context['matched_hostnames'], ['vm3'])
+
+        response = self.client.get('/resources/', {'term': 'servertype=hv'})
+        self.assertEqual(response.context['matched_hostnames'], [])
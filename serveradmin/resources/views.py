@@ -3,8 +3,6 @@
 Copyright (c) 2019 InnoGames GmbH
 """
 
-from collections import OrderedDict
-
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import SuspiciousOperation
@@ -15,11 +13,55 @@ from django.urls import reverse
 from django.utils.text import slugify
 from django.views.decorators.csrf import ensure_csrf_cookie
 
-from adminapi.filters import Any
+from adminapi.filters import All, Any, BaseFilter
 from adminapi.parse import parse_query
 from serveradmin.dataset import Query
-from serveradmin.graphite.models import GRAPHITE_ATTRIBUTE_ID, Collection
+from serveradmin.graphite.models import (
+    GRAPHITE_ATTRIBUTE_ID,
+    Collection,
+    get_attribute_ids,
+)
 from serveradmin.graphite.views import graph
+from serveradmin.serverdb.query_executer import execute_related_page
+
+
+class RelatedHosts:
+    """Lazy list of the hosts of the servers matching the query
+
+    The hosts are the hypervisors of the matching servers, or the matching
+    servers themselves, if they don't have any.  Only the slices the
+    paginator asks for are materialized.  The expected page is fetched
+    together with the count.  See execute_related_page() for the details.
+    """
+
+    def __init__(self, filters, page_filters, restrict, offset, limit):
+        self._filters = filters
+        self._page_filters = page_filters
+        self._restrict = restrict
+        self._offset = offset
+        self._limit = limit
+        self._pages = {}    # Counts, hosts and limits by the offsets
+
+    def count(self):
+        return self._get_page(self._offset, self._limit)[0]
+
+    def __getitem__(self, key):
+        limit = key.stop - key.start
+        return self._get_page(key.start, limit)[1][:limit]
+
+    def _get_page(self, offset, limit):
+        if self._filters is None:
+            return 0, []
+
+        # The paginator asks for a shorter slice for the last page
+        limit = max(limit, self._limit)
+        if offset not in self._pages or self._pages[offset][2] < limit:
+            self._pages[offset] = execute_related_page(
+                self._filters, 'hypervisor', self._page_filters,
+                self._restrict, offset, limit,
+            ) + (limit, )
+
+        return self._pages[offset][:2]
 
 
 @login_required     # NOQA: C901
@@ -46,25 +88,15 @@ def index(request):
     }
 
     # TODO: Generalize this part using the relations
-    hostnames = []
-    matched_hostnames = []
     if term:
-        query_args = parse_query(term)
-        # @TODO: This is the slowest part here unfortunately the Query object
-        # does not support pagination yet so there is nothing to speed this
-        # up right now.
-        host_query = Query(query_args, ['hostname', 'hypervisor'])
-        for host in host_query:
-            matched_hostnames.append(host['hostname'])
-            if host.get('hypervisor'):
-                hostnames.append(host['hypervisor'])
-            else:
-                # If it's not guest, it might be a server, so we add it
-                hostnames.append(host['hostname'])
-
-        understood = repr(host_query)
+        query_args = {
+            a: f if isinstance(f, BaseFilter) else BaseFilter(f)
+            for a, f in parse_query(term).items()
+        }
+        understood = repr(Query(query_args, ['hostname', 'hypervisor']))
         request.session['term'] = term
     else:
+        query_args = None
         understood = repr(Query({}))
 
     variations = list(current_collection.variation_set.all())
@@ -93,6 +125,7 @@ def index(request):
             'visible': slugify(numeric) in columns_selected,
         })
         attribute_ids.append(numeric.attribute_id)
+    relation_ids = []
     for relation in current_collection.relation_set.all():
         columns.append({
             'name': str(relation),
@@ -100,13 +133,7 @@ def index(request):
             'visible': slugify(relation) in columns_selected,
         })
         attribute_ids.append(relation.attribute_id)
-
-    hosts = OrderedDict()
-    filters = {GRAPHITE_ATTRIBUTE_ID: collection.name}
-    if len(hostnames) > 0:
-        filters['hostname'] = Any(*hostnames)
-        for server in Query(filters, attribute_ids):
-            hosts[server['hostname']] = dict(server)
+        relation_ids.append(relation.attribute_id)
 
     page = abs(int(request.GET.get('page', 1)))
     per_page = int(request.GET.get(
@@ -115,8 +142,17 @@ def index(request):
     # Save settings in session
     request.session['resources_per_page'] = per_page
 
+    # The hosts are the hypervisors of the matching guests and the other
+    # matching servers.  Only the hosts on the page are materialized.
+    hosts = RelatedHosts(
+        query_args,
+        {GRAPHITE_ATTRIBUTE_ID: BaseFilter(current_collection.name)},
+        attribute_ids,
+        (page - 1) * per_page,
+        per_page,
+    )
     try:
-        hosts_pager = Paginator(list(hosts.values()), per_page)
+        hosts_pager = Paginator(hosts, per_page)
 
         # Term or data in DB has changed
         if page > hosts_pager.num_pages:
@@ -126,13 +162,17 @@ def index(request):
     except (PageNotAnInteger, EmptyPage):
         raise SuspiciousOperation('{} is not a valid!'.format(page))
 
-    sprite_url = settings.MEDIA_URL + 'graph_sprite/' + collection.name
+    sprite_url = (
+        settings.MEDIA_URL + 'graph_sprite/' + current_collection.name
+    )
     template_info.update({
         'columns': columns,
         'hosts': hosts_pager,
         'page': page,
         'per_page': per_page,
-        'matched_hostnames': matched_hostnames,
+        'matched_hostnames': _get_matched_hostnames(
+            query_args, hosts_pager, relation_ids
+        ),
         'understood': understood,
         'error': None,
         'sprite_url': sprite_url,
@@ -141,6 +181,31 @@ def index(request):
     return TemplateResponse(request, 'resources/index.html', template_info)
 
 
+def _get_matched_hostnames(query_args, hosts, relation_ids):
+    """Get the related servers of the hosts matching the query
+
+    They are highlighted on the page.
+    """
+    related_hostnames = set()
+    for host in hosts:
+        for attribute_id in relation_ids:
+            value = host.get(attribute_id)
+            if isinstance(value, str):
+                related_hostnames.add(value)
+            elif value:
+                related_hostnames.update(value)
+    if not related_hostnames:
+        return []
+
+    filters = dict(query_args)
+    hostname_filter = Any(*related_hostnames)
+    if 'hostname' in filters:
+        hostname_filter = All(filters['hostname'], hostname_filter)
+    filters['hostname'] = hostname_filter
+
+    return [s['hostname'] for s in Query(filters)]
+
+
 @login_required
 def graph_popup(request):
     try:
@@ -149,16 +214,21 @@ def graph_popup(request):
     except KeyError:
         return HttpResponseBadRequest('Hostname and graph not supplied')
 
-    # It would be more efficient to filter the collections on the database,
-    # but we don't bother because they are unlikely to be more than a few
-    # marked as overview.
-    for collection in Collection.objects.filter(overview=True):
-        servers = list(Query({
-            GRAPHITE_ATTRIBUTE_ID: collection.name,
-            'hostname': hostname,
-        }))
-        if servers:
-            table = collection.graph_table(servers[0])
+    # The server is queried once with the attributes all of the overview
+    # collections need, as they are unlikely to be more than a few.
+    collections = list(
+        Collection.objects.filter(overview=True)
+        .prefetch_related('template_set', 'variation_set')
+    )
+    servers = list(Query(
+        {'hostname': hostname}, get_attribute_ids(collections)
+    ))
+    if servers:
+        server = servers[0]
+        for collection in collections:
+            if collection.name not in server.get(GRAPHITE_ATTRIBUTE_ID, ()):
+                continue
+            table = collection.graph_table(server)
             params = [v2 for k1, v1 in table for k2, v2 in v1][int(graph_id)]
             url = reverse(graph) + '?' + params
 
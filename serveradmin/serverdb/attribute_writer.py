@@ -0,0 +1,186 @@
+"""Serveradmin - Attribute Writer
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+
+from serveradmin.serverdb.models import (
+    Server,
+    ServerAttribute,
+    ServerBooleanAttribute,
+    ServerInetAttribute,
+    ServerRelationAttribute,
+    validate_inet_values,
+)
+
+
+# The servers and the attributes are known to exist, so there is no need
+# to validate them with a query for every value.
+_KNOWN_FIELDS = ['server', 'attribute']
+
+
+class AttributeWriter:
+    """Collect the attribute changes of a commit to write them in bulk
+
+    The values are validated as far as possible without the database when
+    they are added.  The removals and the additions are then written with
+    a single statement per attribute type table.  The removals have to be
+    flushed first, so that the values can move between the objects and
+    the attributes within a commit.
+    """
+
+    def __init__(self):
+        self._removals = {}
+        self._additions = {}
+        self._relations = []
+
+    def add(self, server, attribute, value):
+        model = ServerAttribute.get_model(attribute.type)
+        if model is ServerRelationAttribute:
+            # The relation targets are looked up all at once later.
+            self._relations.append((server, attribute, value))
+            return
+        if model is ServerBooleanAttribute:
+            if not value:
+                return
+            server_attribute = model(server=server, attribute=attribute)
+            key = server.server_id, attribute.pk
+        else:
+            server_attribute = model(server=server, attribute=attribute)
+            server_attribute.set_value(value)
+            server_attribute.clean_fields(exclude=_KNOWN_FIELDS)
+            if model is ServerInetAttribute:
+                server_attribute.clean_ip_addr()
+            key = server.server_id, attribute.pk, server_attribute.value
+
+        self._additions.setdefault(model, {})[key] = server_attribute
+
+    def remove(self, server, attribute, value=None):
+        """Remove the given value or all values of the attribute"""
+        model = ServerAttribute.get_model(attribute.type)
+        self._removals.setdefault(model, []).append(
+            (server, attribute, value)
+        )
+
+    def flush_removals(self):
+        for model, removals in self._removals.items():
+            whole_rows = set()
+            value_rows = set()
+            for server_id, attribute_id, value in _prepare_removals(
+                model, removals
+            ):
+                if value is None:
+                    whole_rows.add((server_id, attribute_id))
+                else:
+                    value_rows.add((server_id, attribute_id, value))
+
+            _delete_rows(model, ('server_id', 'attribute_id'), whole_rows)
+            _delete_rows(
+                model, ('server_id', 'attribute_id', 'value'), value_rows
+            )
+        self._removals = {}
+
+    def flush_additions(self):
+        self._add_relations()
+
+        # The inet values are validated against the database, so this can
+        # only run after the removals.
+        validate_inet_values(
+            (sa.server, sa.attribute_id, sa.value)
+            for sa in self._additions.get(ServerInetAttribute, {}).values()
+        )
+
+        # The values may already exist, if they were added to the multi
+        # attributes again.  We can safely ignore them.
+        for model, additions in self._additions.items():
+            model.objects.bulk_create(
+                additions.values(), ignore_conflicts=True
+            )
+        self._additions = {}
+
+    def _add_relations(self):
+        """Look up the relation targets with a single query to add them"""
+        if not self._relations:
+            return
+
+        targets = {
+            s.hostname: s
+            for s in Server.objects.filter(
+                hostname__in={v for s, a, v in self._relations}
+            ).only('server_id', 'hostname', 'servertype_id')
+        }
+
+        # We report all of the violations at once.  The dictionary is
+        # used as an ordered set.
+        messages = {}
+        for server, attribute, value in self._relations:
+            target = targets.get(value)
+            if target is None:
+                messages[
+                    'No server with hostname "{0}" exist.'.format(value)
+                ] = None
+                continue
+            if target.servertype_id != attribute.target_servertype_id:
+                messages[
+                    'Attribute "{0}" has to be from servertype "{1}".'
+                    .format(attribute, attribute.target_servertype_id)
+                ] = None
+                continue
+
+            key = server.server_id, attribute.pk, target.server_id
+            self._additions.setdefault(ServerRelationAttribute, {})[key] = (
+                ServerRelationAttribute(
+                    server=server, attribute=attribute, value=target
+                )
+            )
+        if messages:
+            raise ValidationError(list(messages))
+
+        self._relations = []
+
+
+def _prepare_removals(model, removals):
+    """Convert the values to remove to their database representation
+
+    The values which cannot be valid for the attribute are skipped,
+    as they cannot exist to be removed.
+    """
+    if model is ServerRelationAttribute:
+        server_ids = dict(
+            Server.objects
+            .filter(hostname__in={v for s, a, v in removals if v is not None})
+            .values_list('hostname', 'server_id')
+        )
+
+    for server, attribute, value in removals:
+        if value is not None:
+            if model is ServerRelationAttribute:
+                if value not in server_ids:
+                    continue
+                value = server_ids[value]
+            else:
+                server_attribute = model(server=server, attribute=attribute)
+                server_attribute.value = value
+                try:
+                    server_attribute.clean_fields(exclude=_KNOWN_FIELDS)
+                except ValidationError:
+                    continue
+                value = model._meta.get_field('value').get_db_prep_value(
+                    server_attribute.value, connection
+                )
+
+        yield server.server_id, attribute.pk, value
+
+
+def _delete_rows(model, columns, rows):
+    if not rows:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'DELETE FROM {} WHERE ({}) IN %s'
+            .format(model._meta.db_table, ', '.join(columns)),
+            [tuple(rows)],
+        )
@@ -0,0 +1,104 @@
+"""Serveradmin - Change log partition maintenance
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+
+from serveradmin.serverdb.partitions import (
+    archive_partition,
+    create_partitions,
+    get_month,
+    get_next_month,
+    get_partition_months,
+    restore_partition,
+)
+
+
+class Command(BaseCommand):
+    """Create, archive and restore the monthly partitions of the change log
+
+    This should run regularly to create the partitions of the upcoming
+    months before they are needed.  The old months can be archived to
+    compressed files in a directory and restored from them for audits.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action', choices=['create', 'archive', 'restore'],
+        )
+        parser.add_argument(
+            '--months', type=int, default=2,
+            help='Number of upcoming months to create the partitions of',
+        )
+        parser.add_argument(
+            '--keep-months', type=int,
+            help='Number of past months to keep when archiving',
+        )
+        parser.add_argument(
+            '--month', type=_parse_month,
+            help='Month to restore formatted as YYYY-MM',
+        )
+        parser.add_argument(
+            '--directory',
+            help='Directory to keep the archived partitions in',
+        )
+
+    def handle(self, *args, **options):
+        action = options['action']
+        if action != 'create' and not options['directory']:
+            raise CommandError('--directory is required to ' + action)
+
+        if action == 'create':
+            self.create(options['months'])
+        elif action == 'archive':
+            if options['keep_months'] is None:
+                raise CommandError('--keep-months is required to archive')
+            self.archive(options['keep_months'], options['directory'])
+        else:
+            if not options['month']:
+                raise CommandError('--month is required to restore')
+            self.restore(options['month'], options['directory'])
+
+    def create(self, months):
+        first_month = last_month = get_month(now())
+        for _ in range(months):
+            last_month = get_next_month(last_month)
+        create_partitions(first_month, last_month)
+        self.stdout.write(self.style.SUCCESS(
+            'Partitions exist until {:%Y-%m}'.format(last_month)
+        ))
+
+    def archive(self, keep_months, directory):
+        months = get_partition_months()
+        current_month = get_month(now())
+        for month in months:
+            if _months_between(month, current_month) <= keep_months:
+                break
+            archive_partition(month, directory)
+            self.stdout.write(self.style.SUCCESS(
+                'Archived {:%Y-%m}'.format(month)
+            ))
+
+    def restore(self, month, directory):
+        if month in get_partition_months():
+            raise CommandError('{:%Y-%m} is not archived'.format(month))
+        try:
+            restore_partition(month, directory)
+        except FileNotFoundError as error:
+            raise CommandError(str(error))
+        self.stdout.write(self.style.SUCCESS(
+            'Restored {:%Y-%m}'.format(month)
+        ))
+
+
+def _parse_month(value):
+    return get_month(datetime.strptime(value, '%Y-%m'))
+
+
+def _months_between(first, last):
+    return (last.year - first.year) * 12 + last.month - first.month
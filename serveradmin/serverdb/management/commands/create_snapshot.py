@@ -0,0 +1,37 @@
+"""Serveradmin - Inventory snapshots
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.core.management.base import BaseCommand
+
+from serveradmin.serverdb.models import InventorySnapshot
+from serveradmin.serverdb.snapshots import create_snapshot
+
+
+class Command(BaseCommand):
+    """Take a snapshot of the inventory for the queries about the past
+
+    This should run regularly.  The queries about the past replay the
+    changes since the last snapshot before the time, so the interval of
+    the snapshots bounds their cost.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep', type=int,
+            help='Number of the latest snapshots to keep',
+        )
+
+    def handle(self, *args, **options):
+        snapshot = create_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            'Snapshot as of commit {} taken'.format(snapshot.commit_id)
+        ))
+
+        if options['keep'] is not None:
+            InventorySnapshot.objects.exclude(pk__in=list(
+                InventorySnapshot.objects.order_by('-commit_id')
+                .values_list('pk', flat=True)[:options['keep']]
+            )).delete()
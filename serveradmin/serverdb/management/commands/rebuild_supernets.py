@@ -0,0 +1,24 @@
+"""Serveradmin - Network hierarchy
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.core.management.base import BaseCommand
+
+from serveradmin.serverdb.models import ServerSupernet
+
+
+class Command(BaseCommand):
+    """Rebuild the supernets of all servers
+
+    The supernets are maintained by the commits and on saving the servers.
+    This repairs them after the intern_ips were changed in any other way
+    like on the database directly.
+    """
+    help = __doc__
+
+    def handle(self, *args, **options):
+        count = ServerSupernet.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            '{} supernets of the servers rebuilt'.format(count)
+        ))
@@ -0,0 +1,42 @@
+import django.contrib.postgres.fields.jsonb
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+import serveradmin.serverdb.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('serverdb', '0008_hostname_length_254'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='changeadd',
+            name='attributes_json',
+            field=django.contrib.postgres.fields.jsonb.JSONField(encoder=serveradmin.serverdb.models.ChangeJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name='changedelete',
+            name='attributes_json',
+            field=django.contrib.postgres.fields.jsonb.JSONField(encoder=serveradmin.serverdb.models.ChangeJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name='changeupdate',
+            name='updates_json',
+            field=django.contrib.postgres.fields.jsonb.JSONField(encoder=serveradmin.serverdb.models.ChangeJSONEncoder),
+        ),
+        migrations.AddIndex(
+            model_name='changeadd',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['attributes_json'], name='changeadd_attributes_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='changedelete',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['attributes_json'], name='changedelete_attributes_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='changeupdate',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['updates_json'], name='changeupdate_updates_gin'),
+        ),
+    ]
@@ -0,0 +1,81 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('serverdb', '0009_change_jsonb'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='changeadd',
+            name='change_on',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='changedelete',
+            name='change_on',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='changeupdate',
+            name='change_on',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunSQL(
+            [
+                'UPDATE {0} AS change SET change_on = commit.change_on '
+                'FROM serverdb_changecommit AS commit '
+                'WHERE commit.id = change.commit_id'.format(table)
+                for table in (
+                    'serverdb_changeadd',
+                    'serverdb_changedelete',
+                    'serverdb_changeupdate',
+                )
+            ],
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='changeadd',
+            name='change_on',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='changedelete',
+            name='change_on',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='changeupdate',
+            name='change_on',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='changeadd',
+            name='server_id',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='changedelete',
+            name='server_id',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='changeupdate',
+            name='server_id',
+            field=models.IntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name='changeadd',
+            index=models.Index(fields=['server_id', 'change_on'], name='changeadd_server_change_on'),
+        ),
+        migrations.AddIndex(
+            model_name='changedelete',
+            index=models.Index(fields=['server_id', 'change_on'], name='changedelete_server_change_on'),
+        ),
+        migrations.AddIndex(
+            model_name='changeupdate',
+            index=models.Index(fields=['server_id', 'change_on'], name='changeupdate_server_change_on'),
+        ),
+    ]
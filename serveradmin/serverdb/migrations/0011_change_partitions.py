@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+
+from django.db import migrations
+from django.utils.timezone import now
+
+# The change tables with their JSON columns
+CHANGE_TABLES = [
+    ('serverdb_changeadd', 'changeadd', 'attributes_json'),
+    ('serverdb_changeupdate', 'changeupdate', 'updates_json'),
+    ('serverdb_changedelete', 'changedelete', 'attributes_json'),
+]
+
+
+def partition_tables_sql(table, prefix, json_column):
+    return [
+        'ALTER TABLE {0} RENAME TO {0}_unpartitioned'.format(table),
+        'ALTER TABLE {0}_unpartitioned '
+        'RENAME CONSTRAINT {0}_pkey TO {0}_unpartitioned_pkey'.format(table),
+        'DROP INDEX {0}_server_change_on'.format(prefix),
+        'DROP INDEX {0}_{1}_gin'.format(prefix, json_column.split('_')[0]),
+        'CREATE TABLE {0} ('
+        "   id integer NOT NULL DEFAULT nextval('{0}_id_seq'),"
+        '   commit_id integer NOT NULL,'
+        '   change_on timestamp with time zone NOT NULL,'
+        '   server_id integer NOT NULL,'
+        '   {1} jsonb NOT NULL,'
+        # The partition key has to be a part of the unique constraints.
+        '   PRIMARY KEY (id, change_on),'
+        '   UNIQUE (commit_id, server_id, change_on)'
+        ') PARTITION BY RANGE (change_on)'.format(table, json_column),
+        'ALTER SEQUENCE {0}_id_seq OWNED BY {0}.id'.format(table),
+        'ALTER TABLE {0} '
+        'ADD CONSTRAINT {0}_commit_id_fkey '
+        '   FOREIGN KEY (commit_id) REFERENCES serverdb_changecommit (id)'
+        '   DEFERRABLE INITIALLY DEFERRED'.format(table),
+        'CREATE INDEX {0}_commit_id ON {0} (commit_id)'.format(table),
+        'CREATE INDEX {0}_server_change_on '
+        'ON {1} (server_id, change_on)'.format(prefix, table),
+        'CREATE INDEX {0}_{1}_gin '
+        'ON {2} USING gin ({3})'
+        .format(prefix, json_column.split('_')[0], table, json_column),
+        # The changes without a partition for their month end up here.
+        'CREATE TABLE {0}_default PARTITION OF {0} DEFAULT'.format(table),
+    ]
+
+
+def copy_changes_sql(table, prefix, json_column):
+    return [
+        'INSERT INTO {0} (id, commit_id, change_on, server_id, {1}) '
+        'SELECT id, commit_id, change_on, server_id, {1} '
+        'FROM {0}_unpartitioned'.format(table, json_column),
+        'DROP TABLE {0}_unpartitioned'.format(table),
+    ]
+
+
+def get_month(value):
+    return date(value.year, value.month, 1)
+
+
+def get_next_month(month):
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+    return date(month.year, month.month + 1, 1)
+
+
+def create_partitions_sql(table, first_month, last_month):
+    """Create the partitions between the months inclusively
+
+    The new tables are still empty at this point, so the partitions can
+    be created directly.  The SQL is kept here instead of using the code
+    of the partitions module, so that this migration doesn't change with
+    it.
+    """
+    month = first_month
+    while month <= last_month:
+        next_month = get_next_month(month)
+        yield (
+            'CREATE TABLE {0}_y{1:04}m{2:02} PARTITION OF {0} '
+            "FOR VALUES FROM ('{3}T00:00:00+00:00') "
+            "TO ('{4}T00:00:00+00:00')"
+            .format(
+                table, month.year, month.month,
+                month.isoformat(), next_month.isoformat(),
+            )
+        )
+        month = next_month
+
+
+def forwards_func(apps, schema_editor):
+    """Create the partitions for the existing and the upcoming months"""
+    ChangeCommit = apps.get_model('serverdb', 'ChangeCommit')
+    first_commit = ChangeCommit.objects.order_by('change_on').first()
+    last_month = get_month(now() + timedelta(days=62))
+    if first_commit:
+        first_month = get_month(first_commit.change_on)
+    else:
+        first_month = get_month(now())
+    for table, prefix, json_column in CHANGE_TABLES:
+        for sql in create_partitions_sql(table, first_month, last_month):
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('serverdb', '0010_change_server_change_on'),
+    ]
+
+    operations = [
+        migrations.RunSQL([
+            sql
+            for args in CHANGE_TABLES
+            for sql in partition_tables_sql(*args)
+        ]),
+        migrations.RunPython(forwards_func),
+        migrations.RunSQL([
+            sql for args in CHANGE_TABLES for sql in copy_changes_sql(*args)
+        ]),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('serverdb', '0011_change_partitions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventorySnapshot',
+            fields=[
+                ('commit_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('change_on', models.DateTimeField(db_index=True)),
+                ('objects_json', models.BinaryField()),
+            ],
+        ),
+    ]
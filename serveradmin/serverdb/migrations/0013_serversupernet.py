@@ -0,0 +1,38 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('serverdb', '0012_inventorysnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServerSupernet',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('server', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='serverdb.Server')),
+                ('servertype', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='serverdb.Servertype')),
+                ('supernet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='serverdb.Server')),
+            ],
+            options={
+                'db_table': 'server_supernet',
+                'unique_together': {('server', 'servertype')},
+            },
+        ),
+        migrations.RunSQL(
+            'INSERT INTO server_supernet '
+            '   (server_id, servertype_id, supernet_id) '
+            'SELECT server.server_id, supernet.servertype_id, '
+            '   supernet.server_id '
+            'FROM server '
+            '   JOIN server AS supernet '
+            '       ON supernet.intern_ip >>= server.intern_ip '
+            '   JOIN servertype '
+            '       ON servertype.servertype_id = supernet.servertype_id '
+            "WHERE servertype.ip_addr_type = 'network'",
+            migrations.RunSQL.noop,
+        ),
+    ]
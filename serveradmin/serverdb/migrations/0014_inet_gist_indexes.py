@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('serverdb', '0013_serversupernet'),
+    ]
+
+    operations = [
+        # The containment operators on inet values can only use GiST
+        # indexes.  The exclusion constraint on intern_ip is partial, so the
+        # planner cannot use it for the queries of all servertypes.
+        migrations.RunSQL(
+            'CREATE INDEX server_intern_ip_gist '
+            'ON server USING gist (intern_ip inet_ops)',
+            'DROP INDEX server_intern_ip_gist',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX server_inet_attribute_value_gist '
+            'ON server_inet_attribute USING gist (attribute_id, value inet_ops)',
+            'DROP INDEX server_inet_attribute_value_gist',
+        ),
+    ]
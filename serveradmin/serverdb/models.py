@@ -5,23 +5,27 @@ Copyright (c) 2021 InnoGames GmbH
 
 import re
 import json
+import zlib
 import netfields
 
-from typing import Union
+from operator import itemgetter
+from typing import Iterable, Optional, Tuple, Union
 
-from django.db.models import Q
 from netaddr import EUI
 from distutils.util import strtobool
 from ipaddress import ip_network, IPv4Interface, IPv6Interface, ip_interface
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import connection, models, transaction
 from django.utils.timezone import now
 from django.utils.translation import gettext as _
 
 from adminapi.datatype import STR_BASED_DATATYPES
+from adminapi.request import json_encode_extra
 from serveradmin.apps.models import Application
 
 
@@ -71,8 +75,8 @@ def get_choices(types):
     return zip(*([types] * 2))
 
 
-# TODO: Make validators out of the methods is_ip_address, is_unique and
-#       is_network and attach them to the model fields validators.
+# TODO: Make validators out of the methods is_ip_address and is_network
+#       and attach them to the model fields validators.
 def is_ip_address(ip_interface: Union[IPv4Interface, IPv6Interface]) -> None:
     """Validate if IPv4/IPv6 address
 
@@ -89,32 +93,6 @@ def is_ip_address(ip_interface: Union[IPv4Interface, IPv6Interface]) -> None:
             'Netmask length must be {0}'.format(max_prefix_length))
 
 
-def is_unique_ip(ip_interface: Union[IPv4Interface, IPv6Interface],
-                 object_id: int) -> None:
-    """Validate if IPv4/IPv6 address is unique
-
-    Raises a ValidationError if intern_ip or any other attribute of type inet
-    with this ip_address already exists.
-
-    :param ip_interface:
-    :return:
-    """
-
-    # We avoid querying the duplicate hosts here and giving the user
-    # detailed information because checking with exists is cheaper than
-    # querying the server and this is a validation and should be fast.
-    has_duplicates = (
-        Server.objects.filter(intern_ip=ip_interface).exclude(
-            Q(servertype__ip_addr_type='network') |
-            Q(server_id=object_id)
-        ).exists() or
-        ServerInetAttribute.objects.filter(value=ip_interface).exclude(
-            server__servertype__ip_addr_type='network').exists())
-    if has_duplicates:
-        raise ValidationError(
-            'An object with {0} already exists'.format(str(ip_interface)))
-
-
 def is_network(ip_interface: Union[IPv4Interface, IPv6Interface]) -> None:
     """Validate if IPv4/IPv6 interface is a network
 
@@ -146,34 +124,173 @@ def inet_to_python(obj: object) -> Union[IPv4Interface, IPv6Interface]:
         raise ValidationError(str(error))
 
 
-def network_overlaps(ip_interface: Union[IPv4Interface, IPv6Interface],
-                     servertype_id: str, object_id: int) -> None:
-    """Validate if network overlaps with other objects of the servertype_id
+def validate_inet_values(values: Iterable[Tuple[
+    'Server', Optional[str], Union[IPv4Interface, IPv6Interface]
+]]) -> None:
+    """Validate if IPv4/IPv6 addresses are unique and networks don't overlap
 
-    Raises a ValidationError if the ip network overlaps with any other existing
-    objects network of the given servertype.
+    The values are given as (server, attribute_id, ip_interface) tuples with
+    None as the attribute_id for intern_ip.  They are validated against each
+    other and against the database with a single query per check.  The
+    addresses of hosts must be unique across all objects except networks.
+    The networks must not overlap with other objects of the same servertype.
+    The inet attributes of an object may have its own intern_ip.
 
-    :param ip_interface:
-    :param servertype_id:
-    :param object_id:
+    Raises a ValidationError with a message for every violating value.
+
+    :param values:
     :return:
     """
 
-    overlaps = (
-        Server.objects.filter(
-            servertype=servertype_id,
-            intern_ip__net_overlaps=ip_interface
-        ).exclude(
-            server_id=object_id
-        ).exists() or
-        ServerInetAttribute.objects.filter(
-            server__servertype=servertype_id,
-            value__net_overlaps=ip_interface).exists()
+    values = list(values)
+    hosts = [v for v in values if v[0].servertype.ip_addr_type == 'host']
+    networks = [
+        v for v in values if v[0].servertype.ip_addr_type == 'network'
+    ]
+
+    colliding = _get_colliding_values(values)
+    messages = []
+    for value in _get_inet_violations(hosts, colliding, _UNIQUE_IP_SQL):
+        messages.append('{0}: An object with {1} already exists'.format(
+            value[0].hostname, str(value[2])
+        ))
+    for value in _get_inet_violations(
+        networks, colliding, _NETWORK_OVERLAPS_SQL
+    ):
+        messages.append(
+            '{0}: {1} overlaps with network of another object'.format(
+                value[0].hostname, str(value[2])
+            )
+        )
+    if messages:
+        raise ValidationError(messages)
+
+
+# The candidates are passed as arrays to run a single query for all of them.
+# Both queries return the index of the candidate together with the server_id
+# and the attribute_id of the value it collides with.
+_UNIQUE_IP_SQL = (
+    'SELECT candidate.index, server.server_id, NULL'
+    ' FROM unnest(%(values)s::inet[])'
+    '   WITH ORDINALITY AS candidate (value, index)'
+    ' JOIN server ON server.intern_ip = candidate.value'
+    ' JOIN servertype USING (servertype_id)'
+    " WHERE servertype.ip_addr_type != 'network'"
+    ' UNION ALL '
+    'SELECT candidate.index, server.server_id, attribute.attribute_id'
+    ' FROM unnest(%(values)s::inet[])'
+    '   WITH ORDINALITY AS candidate (value, index)'
+    ' JOIN server_inet_attribute AS attribute'
+    '   ON attribute.value = candidate.value'
+    ' JOIN server USING (server_id)'
+    ' JOIN servertype USING (servertype_id)'
+    " WHERE servertype.ip_addr_type != 'network'"
+)
+_NETWORK_OVERLAPS_SQL = (
+    'SELECT candidate.index, server.server_id, NULL'
+    ' FROM unnest(%(values)s::inet[], %(servertype_ids)s::text[])'
+    '   WITH ORDINALITY AS candidate (value, servertype_id, index)'
+    ' JOIN server ON'
+    '   server.servertype_id = candidate.servertype_id AND'
+    '   server.intern_ip && candidate.value'
+    ' UNION ALL '
+    'SELECT candidate.index, server.server_id, attribute.attribute_id'
+    ' FROM unnest(%(values)s::inet[], %(servertype_ids)s::text[])'
+    '   WITH ORDINALITY AS candidate (value, servertype_id, index)'
+    ' JOIN server ON server.servertype_id = candidate.servertype_id'
+    ' JOIN server_inet_attribute AS attribute ON'
+    '   attribute.server_id = server.server_id AND'
+    '   attribute.value && candidate.value'
+)
+
+
+def _get_inet_violations(candidates, colliding, sql):
+    """Yield the candidates colliding with the values or the database
+
+    The colliding argument is the set of the ids of the values colliding
+    with each other.
+    """
+    if not candidates:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {
+            'values': [str(v[2]) for v in candidates],
+            'servertype_ids': [v[0].servertype_id for v in candidates],
+        })
+        collisions = {}
+        for index, server_id, attribute_id in cursor.fetchall():
+            collisions.setdefault(index - 1, []).append(
+                (server_id, attribute_id)
+            )
+
+    for index, candidate in enumerate(candidates):
+        server, attribute_id = candidate[:2]
+        if id(candidate) in colliding or any(
+            not _is_same_object(server.server_id, attribute_id, *collision)
+            for collision in collisions.get(index, [])
+        ):
+            yield candidate
+
+
+def _get_colliding_values(values):
+    """Get the ids of the values colliding with each other
+
+    The addresses of the objects other than networks are indexed, so that
+    only the equal ones are compared.  The networks are grouped by their
+    servertypes and sorted by their addresses.  They are either nested or
+    disjoint, so a network can only overlap with the ones containing it
+    among the networks before it.  These are kept on a stack.
+    """
+    colliding = set()
+    addresses = {}
+    networks = {}
+    for value in values:
+        if value[0].servertype.ip_addr_type != 'network':
+            addresses.setdefault(value[2], []).append(value)
+        else:
+            network = value[2].network
+            networks.setdefault(
+                (value[0].servertype_id, network.version), []
+            ).append((
+                int(network.network_address),
+                network.prefixlen,
+                int(network.broadcast_address),
+                value,
+            ))
+
+    for group in addresses.values():
+        for index, value in enumerate(group):
+            _add_collisions(colliding, value, group[:index])
+
+    for group in networks.values():
+        group.sort(key=itemgetter(0, 1))
+        stack = []
+        for start, prefixlen, end, value in group:
+            while stack and stack[-1][0] < start:
+                stack.pop()
+            _add_collisions(colliding, value, (v for e, v in stack))
+            stack.append((end, value))
+
+    return colliding
+
+
+def _add_collisions(colliding, value, others):
+    for other in others:
+        if not _is_same_object(value[0], value[1], *other[:2]):
+            colliding.add(id(value))
+            colliding.add(id(other))
+
+
+def _is_same_object(server, attribute_id, other_server, other_attribute_id):
+    # The value itself, or the intern_ip and an inet attribute of the same
+    # object.  The servers are compared as objects for the ones not yet in
+    # the database, and as ids for the ones found in the database.
+    return server == other_server and server is not None and (
+        attribute_id is None or
+        other_attribute_id is None or
+        attribute_id == other_attribute_id
     )
-    if overlaps:
-        raise ValidationError(
-            '{0} overlaps with network of another object'.format(
-                str(ip_interface)))
 
 
 class Servertype(models.Model):
@@ -425,15 +542,26 @@ class Server(models.Model):
     def __str__(self):
         return self.hostname
 
-    def get_supernet(self, servertype):
-        return Server.objects.get(
-            servertype=servertype,
-            intern_ip__net_contains_or_equals=self.intern_ip,
-        )
+    def save(self, *args, **kwargs):
+        super(Server, self).save(*args, **kwargs)
+
+        # The query committer saves the servers in bulk and updates their
+        # supernets itself.  This covers the servers saved one by one like
+        # on the admin.
+        network_ids = []
+        if self.servertype.ip_addr_type == 'network':
+            network_ids.append(self.server_id)
+        ServerSupernet.update([self.server_id], network_ids)
 
     def clean(self):
         super(Server, self).clean()
 
+        self.clean_ip_addr()
+        if self.intern_ip is not None:
+            validate_inet_values([(self, None, self.intern_ip)])
+
+    def clean_ip_addr(self):
+        """Validate the intern_ip without querying the database"""
         ip_addr_type = self.servertype.ip_addr_type
         if ip_addr_type == 'null':
             if self.intern_ip is not None:
@@ -452,15 +580,10 @@ class Server(models.Model):
             if type(self.intern_ip) not in [IPv4Interface, IPv6Interface]:
                 self.intern_ip = inet_to_python(self.intern_ip)
 
-            if ip_addr_type == 'host':
-                is_ip_address(self.intern_ip)
-                is_unique_ip(self.intern_ip, self.server_id)
-            elif ip_addr_type == 'loadbalancer':
+            if ip_addr_type in ('host', 'loadbalancer'):
                 is_ip_address(self.intern_ip)
             elif ip_addr_type == 'network':
                 is_network(self.intern_ip)
-                network_overlaps(self.intern_ip, self.servertype.servertype_id,
-                                 self.server_id)
 
     def get_attributes(self, attribute):
         model = ServerAttribute.get_model(attribute.type)
@@ -474,6 +597,91 @@ class Server(models.Model):
         server_attribute.save_value(value)
 
 
+class ServerSupernet(models.Model):
+    """The networks containing the servers by their servertypes
+
+    The networks of the same servertype don't overlap with each other, so
+    a server can only be in a single one of every network servertype.
+    The supernet attributes and the ContainedOnlyBy filters are joined to
+    this table instead of searching the containing networks.  It is kept
+    up to date by the query committer and Server.save().  The rows are
+    deleted together with the servers and the networks.  It has to be
+    rebuilt after changing the intern_ips in any other way.
+    """
+    server = models.ForeignKey(
+        Server, db_index=False, on_delete=models.CASCADE, related_name='+'
+    )
+    servertype = models.ForeignKey(
+        Servertype, db_index=False, on_delete=models.CASCADE
+    )
+    supernet = models.ForeignKey(
+        Server, on_delete=models.CASCADE, related_name='+'
+    )
+
+    class Meta:
+        app_label = 'serverdb'
+        db_table = 'server_supernet'
+        unique_together = [['server', 'servertype']]
+
+    insert_sql = (
+        'INSERT INTO server_supernet '
+        '   (server_id, servertype_id, supernet_id) '
+        'SELECT server.server_id, supernet.servertype_id, '
+        '   supernet.server_id '
+        'FROM server '
+        '   JOIN server AS supernet '
+        '       ON supernet.intern_ip >>= server.intern_ip '
+        '   JOIN servertype '
+        '       ON servertype.servertype_id = supernet.servertype_id '
+        "WHERE servertype.ip_addr_type = 'network'"
+    )
+
+    @staticmethod
+    def rebuild():
+        """Rebuild the supernets of all servers"""
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('LOCK TABLE server_supernet IN EXCLUSIVE MODE')
+            cursor.execute('DELETE FROM server_supernet')
+            cursor.execute(ServerSupernet.insert_sql)
+            return cursor.rowcount
+
+    @staticmethod
+    def update(server_ids, network_ids):
+        """Update the supernets of the servers and the subnets of networks
+
+        The networks have to be among the servers.  The intern_ips have to
+        be up to date and validated at this point.
+        """
+        if not server_ids:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'DELETE FROM server_supernet '
+                'WHERE server_id = ANY(%s) OR supernet_id = ANY(%s)',
+                [list(server_ids), list(network_ids)],
+            )
+            cursor.execute(
+                ServerSupernet.insert_sql + ' AND server.server_id = ANY(%s)',
+                [list(server_ids)],
+            )
+            if network_ids:
+                # The subnets which are among the servers are already
+                # inserted above.
+                cursor.execute(
+                    'INSERT INTO server_supernet '
+                    '   (server_id, servertype_id, supernet_id) '
+                    'SELECT server.server_id, supernet.servertype_id, '
+                    '   supernet.server_id '
+                    'FROM server AS supernet '
+                    '   JOIN server '
+                    '       ON server.intern_ip <<= supernet.intern_ip '
+                    'WHERE supernet.server_id = ANY(%s) '
+                    'ON CONFLICT DO NOTHING',
+                    [list(network_ids)],
+                )
+
+
 class ServerAttribute(models.Model):
     server = models.ForeignKey(
         Server, db_index=False, on_delete=models.CASCADE
@@ -490,9 +698,13 @@ class ServerAttribute(models.Model):
     def get_value(self):
         return self.value
 
-    def save_value(self, value):
+    def set_value(self, value):
+        """Set the value after the checks that don't need the database"""
         # Normally, there shouldn't be any transformation necessary.
         self.value = value
+
+    def save_value(self, value):
+        self.set_value(value)
         self.full_clean()
         self.save()
 
@@ -531,7 +743,7 @@ class ServerStringAttribute(ServerAttribute):
         unique_together = [['server', 'attribute', 'value']]
         index_together = [['attribute', 'value']]
 
-    def save_value(self, value):
+    def set_value(self, value):
         for char in '\'"':
             if char in value:
                 raise ValidationError(
@@ -545,7 +757,7 @@ class ServerStringAttribute(ServerAttribute):
                     .format(value, datatype.__name__)
                 )
 
-        super().save_value(value)
+        super().set_value(value)
 
 
 class ServerRelationAttributeManager(models.Manager):
@@ -578,9 +790,7 @@ class ServerRelationAttribute(ServerAttribute):
         unique_together = [['server', 'attribute', 'value']]
         index_together = [['attribute', 'value']]
 
-    def save_value(self, value):
-        target_servertype = self.attribute.target_servertype
-
+    def set_value(self, value):
         try:
             target_server = Server.objects.get(hostname=value)
         except Server.DoesNotExist:
@@ -588,13 +798,13 @@ class ServerRelationAttribute(ServerAttribute):
                 'No server with hostname "{0}" exist.'.format(value)
             )
 
-        if target_server.servertype != target_servertype:
+        if target_server.servertype_id != self.attribute.target_servertype_id:
             raise ValidationError(
                 'Attribute "{0}" has to be from servertype "{1}".'
                 .format(self.attribute, self.attribute.target_servertype)
             )
 
-        ServerAttribute.save_value(self, target_server)
+        super().set_value(target_server)
 
 
 class ServerBooleanAttribute(ServerAttribute):
@@ -661,6 +871,11 @@ class ServerInetAttribute(ServerAttribute):
     def clean(self):
         super(ServerAttribute, self).clean()
 
+        self.clean_ip_addr()
+        validate_inet_values([(self.server, self.attribute_id, self.value)])
+
+    def clean_ip_addr(self):
+        """Validate the value without querying the database"""
         if type(self.value) not in [IPv4Interface, IPv6Interface]:
             self.value = inet_to_python(self.value)
 
@@ -674,15 +889,10 @@ class ServerInetAttribute(ServerAttribute):
             raise ValidationError(
                 _('%(attribute_id)s must be null'), code='invalid value',
                 params={'attribute_id': self.attribute_id})
-        elif ip_addr_type == 'host':
-            is_ip_address(self.value)
-            is_unique_ip(self.value, self.server.server_id)
-        elif ip_addr_type == 'loadbalancer':
+        elif ip_addr_type in ('host', 'loadbalancer'):
             is_ip_address(self.value)
         elif ip_addr_type == 'network':
             is_network(self.value)
-            network_overlaps(self.value, self.server.servertype_id,
-                             self.server.server_id)
 
 
 class ServerMACAddressAttribute(ServerAttribute):
@@ -750,6 +960,13 @@ class Change(models.Model):
         return str(self.change_on)
 
 
+class ChangeJSONEncoder(json.JSONEncoder):
+    """Encode the attribute values the same way as the adminapi"""
+
+    def default(self, obj):
+        return json_encode_extra(obj)
+
+
 class ChangeCommit(models.Model):
     change_on = models.DateTimeField(default=now, db_index=True)
     user = models.ForeignKey(User, null=True, on_delete=models.PROTECT)
@@ -764,16 +981,28 @@ class ChangeCommit(models.Model):
 
 class ChangeDelete(models.Model):
     commit = models.ForeignKey(ChangeCommit, on_delete=models.CASCADE)
-    server_id = models.IntegerField(db_index=True)
-    attributes_json = models.TextField()
+    # Denormalized from the commit to page through the history of a server
+    # with the index
+    change_on = models.DateTimeField()
+    server_id = models.IntegerField()
+    attributes_json = JSONField(encoder=ChangeJSONEncoder)
 
     class Meta:
         app_label = 'serverdb'
         unique_together = [['commit', 'server_id']]
+        indexes = [
+            models.Index(
+                fields=['server_id', 'change_on'],
+                name='changedelete_server_change_on',
+            ),
+            GinIndex(
+                fields=['attributes_json'], name='changedelete_attributes_gin'
+            ),
+        ]
 
     @property
     def attributes(self):
-        return json.loads(self.attributes_json)
+        return self.attributes_json
 
     def __str__(self):
         return '{0}: {1}'.format(str(self.commit), self.server_id)
@@ -781,16 +1010,24 @@ class ChangeDelete(models.Model):
 
 class ChangeUpdate(models.Model):
     commit = models.ForeignKey(ChangeCommit, on_delete=models.CASCADE)
-    server_id = models.IntegerField(db_index=True)
-    updates_json = models.TextField()
+    change_on = models.DateTimeField()
+    server_id = models.IntegerField()
+    updates_json = JSONField(encoder=ChangeJSONEncoder)
 
     class Meta:
         app_label = 'serverdb'
         unique_together = [['commit', 'server_id']]
+        indexes = [
+            models.Index(
+                fields=['server_id', 'change_on'],
+                name='changeupdate_server_change_on',
+            ),
+            GinIndex(fields=['updates_json'], name='changeupdate_updates_gin'),
+        ]
 
     @property
     def updates(self):
-        return json.loads(self.updates_json)
+        return self.updates_json
 
     def __str__(self):
         return '{0}: {1}'.format(str(self.commit), self.server_id)
@@ -798,16 +1035,56 @@ class ChangeUpdate(models.Model):
 
 class ChangeAdd(models.Model):
     commit = models.ForeignKey(ChangeCommit, on_delete=models.CASCADE)
-    server_id = models.IntegerField(db_index=True)
-    attributes_json = models.TextField()
+    change_on = models.DateTimeField()
+    server_id = models.IntegerField()
+    attributes_json = JSONField(encoder=ChangeJSONEncoder)
 
     class Meta:
         app_label = 'serverdb'
         unique_together = [['commit', 'server_id']]
+        indexes = [
+            models.Index(
+                fields=['server_id', 'change_on'],
+                name='changeadd_server_change_on',
+            ),
+            GinIndex(
+                fields=['attributes_json'], name='changeadd_attributes_gin'
+            ),
+        ]
 
     @property
     def attributes(self):
-        return json.loads(self.attributes_json)
+        return self.attributes_json
 
     def __str__(self):
         return '{0}: {1}'.format(str(self.commit), self.server_id)
+
+
+class InventorySnapshot(models.Model):
+    """Compressed state of all of the objects as of a commit
+
+    The queries about the past start from the snapshot before the time
+    and replay only the changes after it.  The commit is not a foreign key,
+    because the commits can be archived with the change log partitions.
+    """
+    commit_id = models.IntegerField(primary_key=True)
+    change_on = models.DateTimeField(db_index=True)
+    objects_json = models.BinaryField()
+
+    class Meta:
+        app_label = 'serverdb'
+
+    def get_objects(self):
+        """Get the objects indexed by their ids"""
+        return {
+            obj['object_id']: obj
+            for obj in json.loads(zlib.decompress(self.objects_json))
+        }
+
+    def set_objects(self, objects):
+        self.objects_json = zlib.compress(
+            json.dumps(list(objects), cls=ChangeJSONEncoder).encode()
+        )
+
+    def __str__(self):
+        return str(self.change_on)
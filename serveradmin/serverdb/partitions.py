@@ -0,0 +1,181 @@
+"""Serveradmin - Change Log Partitions
+
+The changes are stored on tables partitioned by the month of their time.
+The old months can be detached and archived to files to keep the tables
+and their indexes small, and restored from the files again.  The commits
+are kept on a single table, as they are small and referenced by the
+changes, but they are archived together with their month.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import gzip
+import re
+from datetime import date, datetime, timezone
+from os import replace
+from os.path import exists, join
+
+from django.db import connection, transaction
+
+CHANGE_TABLES = [
+    'serverdb_changeadd',
+    'serverdb_changeupdate',
+    'serverdb_changedelete',
+]
+COMMIT_TABLE = 'serverdb_changecommit'
+
+_partition_name_re = re.compile(r'_y(\d{4})m(\d{2})\Z')
+
+
+def get_month(value):
+    return date(value.year, value.month, 1)
+
+
+def get_next_month(month):
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+    return date(month.year, month.month + 1, 1)
+
+
+def get_partition_name(table, month):
+    return '{}_y{:04}m{:02}'.format(table, month.year, month.month)
+
+
+def get_archive_path(directory, table, month):
+    return join(directory, get_partition_name(table, month) + '.csv.gz')
+
+
+def get_partition_months():
+    """Get the months with partitions in order"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname '
+            'FROM pg_inherits '
+            '    JOIN pg_class AS parent ON parent.oid = inhparent '
+            '    JOIN pg_class AS child ON child.oid = inhrelid '
+            'WHERE parent.relname = %s',
+            [CHANGE_TABLES[0]],
+        )
+        names = [name for name, in cursor.fetchall()]
+
+    months = []
+    for name in names:
+        match = _partition_name_re.search(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+
+    return sorted(months)
+
+
+def create_partitions(first_month, last_month):
+    """Create the missing partitions between the months inclusively"""
+    month = first_month
+    while month <= last_month:
+        create_partition(month)
+        month = get_next_month(month)
+
+
+@transaction.atomic
+def create_partition(month):
+    """Create the partitions of the month on all of the change tables
+
+    The changes of the month may already be on the default partitions,
+    if they were added before the partitions were created.  They are moved
+    to the new partitions before attaching them.
+    """
+    start, end = _get_range(month)
+    with connection.cursor() as cursor:
+        for table in CHANGE_TABLES:
+            name = get_partition_name(table, month)
+            cursor.execute('SELECT to_regclass(%s)', [name])
+            if cursor.fetchone()[0] is not None:
+                continue
+
+            cursor.execute(
+                'CREATE TABLE {0} (LIKE {1} INCLUDING DEFAULTS)'
+                .format(name, table)
+            )
+            cursor.execute(
+                'WITH moved AS ('
+                '    DELETE FROM {1}_default'
+                '    WHERE change_on >= %s AND change_on < %s'
+                '    RETURNING *'
+                ') '
+                'INSERT INTO {0} SELECT * FROM moved'
+                .format(name, table),
+                [start, end],
+            )
+            cursor.execute(
+                'ALTER TABLE {0} ATTACH PARTITION {1} '
+                "FOR VALUES FROM ('{2}') TO ('{3}')"
+                .format(table, name, start.isoformat(), end.isoformat())
+            )
+
+
+def archive_partition(month, directory):
+    """Detach the partitions of the month and move them to the directory
+
+    The files are written under temporary names first, so that only the
+    complete archives of the removed months appear in the directory.
+    """
+    start, end = _get_range(month)
+    paths = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for table in CHANGE_TABLES:
+            name = get_partition_name(table, month)
+            path = get_archive_path(directory, table, month)
+            cursor.execute(
+                'ALTER TABLE {0} DETACH PARTITION {1}'.format(table, name)
+            )
+            with gzip.open(path + '.tmp', 'wt') as fd:
+                cursor.copy_expert('COPY {0} TO STDOUT'.format(name), fd)
+            cursor.execute('DROP TABLE {0}'.format(name))
+            paths.append(path)
+
+        path = get_archive_path(directory, COMMIT_TABLE, month)
+        with gzip.open(path + '.tmp', 'wt') as fd:
+            cursor.copy_expert(
+                cursor.mogrify(
+                    'COPY ('
+                    '    DELETE FROM {0}'
+                    '    WHERE change_on >= %s AND change_on < %s'
+                    '    RETURNING *'
+                    ') TO STDOUT'
+                    .format(COMMIT_TABLE),
+                    [start, end],
+                ).decode(),
+                fd,
+            )
+        paths.append(path)
+
+    for path in paths:
+        replace(path + '.tmp', path)
+
+
+@transaction.atomic
+def restore_partition(month, directory):
+    """Restore the archived partitions of the month from the directory"""
+    paths = {
+        table: get_archive_path(directory, table, month)
+        for table in [COMMIT_TABLE] + CHANGE_TABLES
+    }
+    for path in paths.values():
+        if not exists(path):
+            raise FileNotFoundError('Archive "{}" does not exist'.format(path))
+
+    create_partition(month)
+    with connection.cursor() as cursor:
+        for table, path in paths.items():
+            if table != COMMIT_TABLE:
+                table = get_partition_name(table, month)
+            with gzip.open(path, 'rt') as fd:
+                cursor.copy_expert('COPY {0} FROM STDIN'.format(table), fd)
+
+
+def _get_range(month):
+    return (
+        datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+        datetime(
+            *get_next_month(month).timetuple()[:3], tzinfo=timezone.utc
+        ),
+    )
@@ -3,7 +3,6 @@
 Copyright (c) 2019 InnoGames GmbH
 """
 
-import json
 import logging
 from itertools import chain
 
@@ -13,12 +12,14 @@ from django.dispatch.dispatcher import Signal
 
 from adminapi.dataset import DatasetCommit
 from adminapi.request import json_encode_extra
+from serveradmin.serverdb.attribute_writer import AttributeWriter
 from serveradmin.serverdb.models import (
     Servertype,
     Attribute,
     Server,
-    ServerAttribute,
     ServerRelationAttribute,
+    ServerSupernet,
+    validate_inet_values,
     ChangeAdd,
     ChangeCommit,
     ChangeUpdate,
@@ -66,18 +67,25 @@ def commit_query(created=[], changed=[], deleted=[], app=None, user=None):
         commit_query, created=created, changed=changed, deleted=deleted
     )
 
-    # TODO: Find out which attributes we actually need
     attribute_lookup = {a.pk: a for a in Attribute.objects.all()}
-    joined_attributes = {
-        a: None
-        for a
-        in list(attribute_lookup.values()) + list(Attribute.specials.values())
-    }
+    joined_attributes = _get_joined_attributes(attribute_lookup)
+    entities = _get_access_control_entities(user, app)
+
+    # The changed objects are only used for validation, access control
+    # and the return value.  Materializing all attributes of them is
+    # expensive on big commits, so we limit them to the attributes these
+    # need.  The created and deleted objects are fully materialized, as
+    # they are stored on the change log.
+    changed_joined_attributes = _get_joined_attributes(
+        attribute_lookup, _get_commit_attribute_ids(changed, entities)
+    )
 
     with transaction.atomic():
         change_commit = ChangeCommit.objects.create(app=app, user=user)
         changed_servers = _fetch_servers(set(c['object_id'] for c in changed))
-        unchanged_objects = _materialize(changed_servers, joined_attributes)
+        unchanged_objects = _materialize(
+            changed_servers, changed_joined_attributes
+        )
 
         deleted_servers = _fetch_servers(deleted)
         deleted_objects = _materialize(deleted_servers, joined_attributes)
@@ -103,16 +111,23 @@ def commit_query(created=[], changed=[], deleted=[], app=None, user=None):
         _validate(attribute_lookup, changed, unchanged_objects)
 
         # Changes should be applied in order to prevent integrity errors.
-        _delete_attributes(attribute_lookup, changed, changed_servers, deleted)
+        writer = AttributeWriter()
+        _delete_attributes(
+            writer, attribute_lookup, changed, changed_servers, deleted
+        )
         _delete_servers(changed, deleted, deleted_servers)
-        created_servers = _create_servers(attribute_lookup, created)
-        created_objects = _materialize(created_servers, joined_attributes)
+        created_servers = _create_servers(writer, attribute_lookup, created)
         _update_servers(changed, changed_servers)
-        _upsert_attributes(attribute_lookup, changed, changed_servers)
-        changed_objects = _materialize(changed_servers, joined_attributes)
+        _update_supernets(created_servers, changed, changed_servers)
+        _upsert_attributes(writer, attribute_lookup, changed, changed_servers)
+        writer.flush_additions()
+        created_objects = _materialize(created_servers, joined_attributes)
+        changed_objects = _materialize(
+            changed_servers, changed_joined_attributes
+        )
 
         _access_control(
-            user, app, unchanged_objects,
+            entities, unchanged_objects,
             created_objects, changed_objects, deleted_objects
         )
 
@@ -168,7 +183,9 @@ def _validate(attribute_lookup, changed, changed_objects):
         raise CommitNewerData('Newer data available', newer)
 
 
-def _delete_attributes(attribute_lookup, changed, changed_servers, deleted):
+def _delete_attributes(
+    writer, attribute_lookup, changed, changed_servers, deleted
+):
     # We first have to delete all of the relation attributes
     # to avoid integrity errors.  Other attributes will just go away
     # with the servers.
@@ -190,17 +207,15 @@ def _delete_attributes(attribute_lookup, changed, changed_servers, deleted):
             attribute = attribute_lookup[attribute_id]
             action = change['action']
 
-            if action == 'delete' or (
-                action == 'update' and change['new'] is None
-            ):
-                server.get_attributes(attribute).delete()
-            elif action == 'multi' and change['remove']:
-                for server_attribute in server.get_attributes(attribute):
-                    value = server_attribute.get_value()
-                    if isinstance(value, Server):
-                        value = value.hostname
-                    if value in change['remove']:
-                        server_attribute.delete()
+            # The updated values are removed here to be added again
+            # by _upsert_attributes().
+            if action in ('delete', 'update'):
+                writer.remove(server, attribute)
+            elif action == 'multi':
+                for value in change['remove']:
+                    writer.remove(server, attribute, value)
+
+    writer.flush_removals()
 
 
 def _delete_servers(changed, deleted, deleted_servers):
@@ -208,8 +223,7 @@ def _delete_servers(changed, deleted, deleted_servers):
         return
 
     try:
-        for server in deleted_servers.values():
-            server.delete()
+        Server.objects.filter(server_id__in=deleted_servers.keys()).delete()
     except IntegrityError as error:
         raise CommitError(
             'Cannot delete servers because they are referenced by {0}'
@@ -222,8 +236,8 @@ def _delete_servers(changed, deleted, deleted_servers):
             del changed[server_id]
 
 
-def _create_servers(attribute_lookup, created):
-    created_servers = {}
+def _create_servers(writer, attribute_lookup, created):
+    servers = []
     for attributes in created:
         if not attributes.get('hostname'):
             raise CommitError('"hostname" attribute is required.')
@@ -238,16 +252,16 @@ def _create_servers(attribute_lookup, created):
         attributes = dict(_get_real_attributes(attributes, attribute_lookup))
         _validate_real_attributes(servertype, attributes)
 
-        server = _insert_server(hostname, intern_ip, servertype, attributes)
-
-        created_server = {k.pk: v for k, v in attributes.items()}
-        created_server['hostname'] = hostname
-        created_server['servertype'] = servertype.pk
-        created_server['intern_ip'] = intern_ip
+        server = Server(
+            hostname=hostname,
+            intern_ip=intern_ip,
+            servertype=servertype,
+        )
+        servers.append((server, attributes))
 
-        created_servers[server.server_id] = server
+    _insert_servers(writer, servers)
 
-    return created_servers
+    return {server.server_id: server for server, attributes in servers}
 
 
 def _update_servers(changed, changed_servers):
@@ -269,11 +283,30 @@ def _update_servers(changed, changed_servers):
             really_changed.add(server)
 
     for server in really_changed:
-        server.full_clean()
-        server.save()
+        server.clean_fields(exclude=['servertype'])
+        server.clean_ip_addr()
+        server.validate_unique()
+    validate_inet_values(
+        (s, None, s.intern_ip) for s in really_changed if s.intern_ip
+    )
+    Server.objects.bulk_update(really_changed, ['hostname', 'intern_ip'])
+
+
+def _update_supernets(created_servers, changed, changed_servers):
+    servers = [s for s in created_servers.values() if s.intern_ip]
+    servers.extend(
+        changed_servers[c['object_id']] for c in changed if 'intern_ip' in c
+    )
+    ServerSupernet.update(
+        [s.server_id for s in servers],
+        [
+            s.server_id for s in servers
+            if s.servertype.ip_addr_type == 'network'
+        ],
+    )
 
 
-def _upsert_attributes(attribute_lookup, changed, changed_servers):
+def _upsert_attributes(writer, attribute_lookup, changed, changed_servers):
     for changes in changed:
         object_id = changes['object_id']
 
@@ -287,7 +320,7 @@ def _upsert_attributes(attribute_lookup, changed, changed_servers):
             action = change['action']
             if action == 'multi':
                 for value in change['add']:
-                    server.add_attribute(attribute, value)
+                    writer.add(server, attribute, value)
                 continue
 
             if action not in ('new', 'update'):
@@ -295,16 +328,66 @@ def _upsert_attributes(attribute_lookup, changed, changed_servers):
             if change['new'] is None:
                 continue
 
-            try:
-                server_attribute = server.get_attributes(attribute).get()
-            except ServerAttribute.get_model(attribute.type).DoesNotExist:
-                server.add_attribute(attribute, change['new'])
-            else:
-                server_attribute.save_value(change['new'])
+            writer.add(server, attribute, change['new'])
+
+
+def _get_access_control_entities(user, app):
+    """Get the ACL groups the commit has to be checked against
+
+    Returns a list of (entity class, entity, groups) tuples.  Superusers
+    and superuser apps are not included as they are not restricted.
+    """
+    entities = []
+    if not user.is_superuser:
+        entities.append(
+            ('user', user, list(user.access_control_groups.all()))
+        )
+    if app and not app.superuser:
+        entities.append(
+            ('application', app, list(app.access_control_groups.all()))
+        )
+
+    return entities
+
+
+def _get_commit_attribute_ids(changed, entities):
+    """Get the attribute ids needed to validate the changed objects
+
+    These are the changed attributes and the attributes referenced by
+    the filters of the ACLs the commit is going to be checked against.
+    The special attributes are always included.
+    """
+    attribute_ids = set(Attribute.specials.keys())
+    for changes in changed:
+        attribute_ids.update(changes.keys())
+    for entity_class, entity_name, groups in entities:
+        for acl in groups:
+            attribute_ids.update(acl.get_filters().keys())
+
+    return attribute_ids
+
+
+def _get_joined_attributes(attribute_lookup, attribute_ids=None):
+    """Get the joined attributes to materialize objects with
+
+    All attributes are returned, if attribute_ids is not given.  Unknown
+    attribute ids are ignored to let the validation report them.
+    """
+    if attribute_ids is None:
+        attribute_ids = chain(attribute_lookup, Attribute.specials)
+
+    joined_attributes = {}
+    for attribute_id in attribute_ids:
+        if attribute_id in Attribute.specials:
+            joined_attributes[Attribute.specials[attribute_id]] = None
+        elif attribute_id in attribute_lookup:
+            joined_attributes[attribute_lookup[attribute_id]] = None
+
+    return joined_attributes
 
 
 def _access_control(
-    user, app, unchanged_objects,
+    entities, unchanged_objects,
     created_objects, changed_objects, deleted_objects,
 ):
     """Enforce serveradmin ACLs
@@ -329,16 +412,6 @@ def _access_control(
     Returns None on success.
     """
 
-    entities = []
-    if not user.is_superuser:
-        entities.append(
-            ('user', user, list(user.access_control_groups.all()))
-        )
-    if app and not app.superuser:
-        entities.append(
-            ('application', app, list(app.access_control_groups.all()))
-        )
-
     # Check all objects touched by this commit
     for obj in chain(
         created_objects.values(),
@@ -427,37 +500,44 @@ def _acl_violations(changed_objects, obj, acl):
 
 
 def _log_changes(commit, changed, created_objects, deleted_objects):
-    for updates in changed:
-        ChangeUpdate.objects.create(
+    ChangeUpdate.objects.bulk_create(
+        ChangeUpdate(
             commit=commit,
+            change_on=commit.change_on,
             server_id=updates['object_id'],
-            updates_json=json.dumps(updates, default=json_encode_extra),
+            updates_json=updates,
         )
-
-    for attributes in deleted_objects.values():
-        attributes_json = json.dumps(attributes, default=json_encode_extra)
-        ChangeDelete.objects.create(
+        for updates in changed
+    )
+    ChangeDelete.objects.bulk_create(
+        ChangeDelete(
             commit=commit,
+            change_on=commit.change_on,
             server_id=attributes['object_id'],
-            attributes_json=attributes_json,
-        )
-
-    for obj in created_objects.values():
-        attributes_json = json.dumps(
-            obj, default=json_encode_extra
+            attributes_json=attributes,
         )
-        ChangeAdd.objects.create(
+        for attributes in deleted_objects.values()
+    )
+    ChangeAdd.objects.bulk_create(
+        ChangeAdd(
             commit=commit,
+            change_on=commit.change_on,
             server_id=obj['object_id'],
-            attributes_json=attributes_json,
+            attributes_json=obj,
         )
+        for obj in created_objects.values()
+    )
 
 
 def _fetch_servers(object_ids):
     servers = {
         s.server_id: s
-        for s
-        in Server.objects.select_for_update().filter(server_id__in=object_ids)
+        for s in (
+            Server.objects
+            .select_for_update(of=('self', ))
+            .select_related('servertype')
+            .filter(server_id__in=object_ids)
+        )
     }
     for object_id in object_ids:
         if object_id in servers:
@@ -711,27 +791,32 @@ def _validate_real_attributes(servertype, real_attributes):     # NOQA: C901
     )
 
 
-def _insert_server(hostname, intern_ip, servertype, attributes):
-
-    if Server.objects.filter(hostname=hostname).exists():
+def _insert_servers(writer, servers):
+    hostnames = [s.hostname for s, a in servers]
+    if (
+        len(set(hostnames)) != len(hostnames) or
+        Server.objects.filter(hostname__in=hostnames).exists()
+    ):
         raise CommitError('Server with that hostname already exists')
 
-    server = Server(
-        hostname=hostname,
-        intern_ip=intern_ip,
-        servertype=servertype,
+    # We have already checked the servertype and the hostname.  The inet
+    # values are validated all at once instead of by Server.clean().
+    for server, attributes in servers:
+        server.clean_fields(exclude=['servertype'])
+        server.clean_ip_addr()
+    validate_inet_values(
+        (s, None, s.intern_ip) for s, a in servers if s.intern_ip
     )
-    server.full_clean()
-    server.save()
 
-    for attribute, value in attributes.items():
-        if attribute.multi:
-            for single_value in value:
-                server.add_attribute(attribute, single_value)
-        else:
-            server.add_attribute(attribute, value)
+    Server.objects.bulk_create(s for s, a in servers)
 
-    return server
+    for server, attributes in servers:
+        for attribute, value in attributes.items():
+            if attribute.multi:
+                for single_value in value:
+                    writer.add(server, attribute, single_value)
+            else:
+                writer.add(server, attribute, value)
 
 
 def handle_violations(
@@ -6,14 +6,24 @@ Copyright (c) 2019 InnoGames GmbH
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import DataError, connection, transaction
 
-from adminapi.filters import Any
+from adminapi.dataset import DatasetObject
+from adminapi.datatype import json_to_datatype
+from adminapi.filters import Any, ContainedOnlyBy, Empty, Not
 from serveradmin.serverdb.models import Attribute, ServertypeAttribute, Server
+from serveradmin.serverdb.snapshots import get_objects_as_of
 from serveradmin.serverdb.sql_generator import get_server_query
 from serveradmin.serverdb.query_materializer import QueryMaterializer
 
 
-def execute_query(filters, restrict, order_by):
-    """The main function to execute queries"""
+def execute_query(filters, restrict, order_by, as_of=None):
+    """The main function to execute queries
+
+    The objects are queried as they were at the given time, if the as_of
+    argument is set.  See the snapshots module for the details.
+    """
+
+    if as_of is not None:
+        return _execute_query_as_of(filters, restrict, order_by, as_of)
 
     # We need the restrict argument in slightly different structure.
     if restrict is None:
@@ -41,41 +51,13 @@ def execute_query(filters, restrict, order_by):
         _update_attribute_lookup(attribute_lookup, attribute_ids)
     _check_attributes_exist(attribute_ids, attribute_lookup)
 
-    # If we have real attributes on the query filter, we can use them to
-    # get the possible servertypes.  This is necessary to eliminate
-    # not-desired objects.  We also use them to eliminate the servertype
-    # attribute relations passed to the SQL generator module in "related_vias".
-    # This is an optimization that matters, because all of those in
-    # "related_vias" hit the database as complicated sub-queries.
-    related_vias = {}
-    real_attribute_ids = [a for a in filters if a not in Attribute.specials]
-    if real_attribute_ids:
-        servertype_attributes = list(ServertypeAttribute.objects.filter(
-            attribute_id__in=real_attribute_ids
-        ))
-        servertype_ids = _get_possible_servertype_ids(servertype_attributes)
-        filters = dict(filters)
-        servertype_ids = _override_servertype_filter(filters, servertype_ids)
-        servertype_attributes = [
-            sa for sa in servertype_attributes
-            if sa.servertype_id in servertype_ids
-        ]
-        _update_related_vias(
-            related_vias, servertype_attributes, attribute_lookup
-        )
-
     # Here we prepare the join dictionary for the query materializer.
     # For None on the restrict argument, we just use the complete list of
     # attributes prepared by the previous step.
     if restrict is None:
         materializer_args = [{a: None for a in attribute_lookup.values()}]
     else:
-        def cast(join):
-            return {
-                attribute_lookup[a]: j if j is None else cast(j)
-                for a, j in join
-            }
-        materializer_args = [cast(joins)]
+        materializer_args = [_cast_joins(joins, attribute_lookup)]
 
     if order_by is not None:
         materializer_args.append([attribute_lookup[a] for a in order_by])
@@ -97,10 +79,119 @@ def execute_query(filters, restrict, order_by):
         # for ordering may be lost after the materialization.  See the query
         # materializer module for its details.  The functions on this module
         # continues with the filtering step.
-        servers = _get_servers(filters, attribute_lookup, related_vias)
+        servers = _get_servers(filters, attribute_lookup)
         return list(QueryMaterializer(servers, *materializer_args))
 
 
+def execute_related_page(
+    filters, related_via_attribute_id, page_filters, restrict, offset, limit
+):
+    """Execute the query on the servers related to the matching ones
+
+    The servers matching the filters are replaced by the servers they
+    relate to with the relation attribute, if they have one.  The related
+    servers are filtered again by the page filters, and a page of them
+    ordered by hostname is materialized.  The number of all of them is
+    counted on the database without materializing them.
+
+    This returns the count and the page.
+    """
+    joins = list(_get_joins(restrict))
+    attribute_ids = set(_collect_attribute_ids(joins, filters))
+    attribute_ids.update(page_filters)
+    attribute_ids.add(related_via_attribute_id)
+    attribute_lookup = dict(Attribute.specials)
+    if any(a not in attribute_lookup for a in attribute_ids):
+        _update_attribute_lookup(attribute_lookup, attribute_ids)
+    _check_attributes_exist(attribute_ids, attribute_lookup)
+
+    related_via_attribute = attribute_lookup[related_via_attribute_id]
+    if related_via_attribute.type != 'relation' or related_via_attribute.multi:
+        raise ValidationError(
+            'Attribute "{}" is not a single relation'.format(
+                related_via_attribute_id
+            )
+        )
+
+    # See execute_query() for the transaction.
+    with transaction.atomic():
+        connection.cursor().execute(
+            'SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY'
+        )
+
+        params = {
+            'related_via_attribute_id': related_via_attribute_id,
+            'offset': offset,
+            'limit': limit,
+        }
+        sql_query = _get_server_query(filters, attribute_lookup, params)
+        page_sql_query = _get_server_query(
+            page_filters, attribute_lookup, params
+        )
+        if sql_query is None or page_sql_query is None:
+            return 0, []
+
+        # The count and the page are fetched at once
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute(
+                    'WITH related AS ('
+                    ' SELECT page.server_id, page.hostname'
+                    ' FROM (' + page_sql_query + ') AS page'
+                    ' WHERE page.server_id IN ('
+                    '  SELECT coalesce(sub.value, matched.server_id)'
+                    '  FROM (' + sql_query + ') AS matched'
+                    '  LEFT JOIN server_relation_attribute AS sub'
+                    '   ON sub.server_id = matched.server_id'
+                    '   AND sub.attribute_id = %(related_via_attribute_id)s'
+                    ' )'
+                    ')'
+                    ' SELECT'
+                    ' (SELECT count(*) FROM related),'
+                    ' array('
+                    '  SELECT server_id FROM related'
+                    '  ORDER BY hostname LIMIT %(limit)s OFFSET %(offset)s'
+                    ' )',
+                    params,
+                )
+            except DataError as error:
+                raise ValidationError(error)
+            count, server_ids = cursor.fetchone()
+
+        servers = list(Server.objects.filter(server_id__in=server_ids))
+        return count, list(QueryMaterializer(
+            servers,
+            _cast_joins(joins, attribute_lookup),
+            [attribute_lookup['hostname']],
+        ))
+
+
+def estimate_query_rows(filters):
+    """Estimate the number of servers matching the filters
+
+    The estimate of the query planner is used, so the servers are not
+    fetched.  It can be far off for the complicated filters.
+    """
+    attribute_lookup = dict(Attribute.specials)
+    if any(a not in attribute_lookup for a in filters):
+        _update_attribute_lookup(attribute_lookup, filters)
+    _check_attributes_exist(filters, attribute_lookup)
+
+    params = {}
+    sql_query = _get_server_query(filters, attribute_lookup, params)
+    if sql_query is None:
+        return 0
+
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql_query, params)
+        except DataError as error:
+            raise ValidationError(error)
+        plan = cursor.fetchone()[0]
+
+    return plan[0]['Plan']['Plan Rows']
+
+
 def _get_joins(restrict):
     """Iterate the restrict clause with the joins"""
 
@@ -231,8 +322,45 @@ def _update_related_vias(
         _update_related_vias(related_vias, to_be_looked_up, attribute_lookup)
 
 
-def _get_servers(filters, attribute_lookup, related_vias):
-    """Evaluate the filters to fetch the matching servers"""
+def _cast_joins(joins, attribute_lookup):
+    """Prepare the join dictionary of the query materializer"""
+    return {
+        attribute_lookup[a]: j if j is None else _cast_joins(
+            j, attribute_lookup
+        )
+        for a, j in joins
+    }
+
+
+def _get_server_query(filters, attribute_lookup, params):
+    """Get the SQL query to fetch the servers matching the filters
+
+    The parameters of the query are added to the params dictionary.  None
+    is returned, if the filters are destined to fail.
+    """
+
+    # If we have real attributes on the query filter, we can use them to
+    # get the possible servertypes.  This is necessary to eliminate
+    # not-desired objects.  We also use them to eliminate the servertype
+    # attribute relations passed to the SQL generator module in "related_vias".
+    # This is an optimization that matters, because all of those in
+    # "related_vias" hit the database as complicated sub-queries.
+    related_vias = {}
+    real_attribute_ids = [a for a in filters if a not in Attribute.specials]
+    if real_attribute_ids:
+        servertype_attributes = list(ServertypeAttribute.objects.filter(
+            attribute_id__in=real_attribute_ids
+        ))
+        servertype_ids = _get_possible_servertype_ids(servertype_attributes)
+        filters = dict(filters)
+        servertype_ids = _override_servertype_filter(filters, servertype_ids)
+        servertype_attributes = [
+            sa for sa in servertype_attributes
+            if sa.servertype_id in servertype_ids
+        ]
+        _update_related_vias(
+            related_vias, servertype_attributes, attribute_lookup
+        )
 
     # From now on, we will pass the filters dictionary using the attribute
     # objects as the keys.  The SQL generator module will repeatedly need
@@ -248,16 +376,126 @@ def _get_servers(filters, attribute_lookup, related_vias):
         # nonexistent attributes.
         destiny = filt.destiny()
         if destiny is False:
-            return []
+            return None
         if destiny is True:
             continue
 
         attribute_filters.append((attribute_lookup[attribute_id], filt))
 
+    return get_server_query(attribute_filters, related_vias, params)
+
+
+def _get_servers(filters, attribute_lookup):
+    """Evaluate the filters to fetch the matching servers"""
+    params = {}
+    sql_query = _get_server_query(filters, attribute_lookup, params)
+    if sql_query is None:
+        return []
+
     # If you managed to read this so far, the last step is refreshingly
-    # easy: get and execute the raw SQL query.
-    sql_query = get_server_query(attribute_filters, related_vias)
+    # easy: execute the raw SQL query.
     try:
-        return list(Server.objects.defer('intern_ip').raw(sql_query))
+        return list(Server.objects.defer('intern_ip').raw(sql_query, params))
     except DataError as error:
         raise ValidationError(error)
+
+
+def _execute_query_as_of(filters, restrict, order_by, as_of):
+    """Execute the query on the objects as they were at the given time
+
+    The objects of the past are not on the database tables, so they are
+    filtered, joined and ordered in here.
+    """
+    joins = None if restrict is None else list(_get_joins(restrict))
+    attribute_ids = set(_collect_attribute_ids(joins, filters, order_by))
+    attribute_lookup = dict(Attribute.specials)
+    _update_attribute_lookup(attribute_lookup, attribute_ids)
+    _check_attributes_exist(attribute_ids, attribute_lookup)
+
+    objects = {}
+    for object_id, obj in get_objects_as_of(as_of).items():
+        objects[object_id] = {
+            a: _json_to_value(v) for a, v in obj.items()
+        }
+    objects_by_hostname = {o['hostname']: o for o in objects.values()}
+
+    results = [
+        o for o in objects.values()
+        if all(_filter_matches(f, o, a) for a, f in filters.items())
+    ]
+    if order_by:
+        results.sort(key=lambda o: tuple(
+            (o.get(a) is None, o.get(a)) for a in order_by
+        ))
+
+    return [
+        DatasetObject(
+            _get_joined_values(o, joins, objects_by_hostname),
+            o['object_id'],
+        )
+        for o in results
+    ]
+
+
+def _json_to_value(value):
+    if isinstance(value, list):
+        return {json_to_datatype(v) for v in value}
+    if value is None:
+        return None
+    return json_to_datatype(value)
+
+
+def _filter_matches(filt, obj, attribute_id):
+    # The objects don't match with the filters on the attributes of other
+    # servertypes like on the database.
+    if attribute_id not in obj:
+        return False
+
+    return _value_matches(filt, obj[attribute_id])
+
+
+def _value_matches(filt, value):
+    if isinstance(filt, ContainedOnlyBy):
+        raise ValidationError(
+            'ContainedOnlyBy filter is not supported on the past'
+        )
+    if isinstance(filt, Not):
+        return not _value_matches(filt.value, value)
+    if isinstance(filt, Any):
+        return filt.func(_value_matches(f, value) for f in filt.values)
+    if isinstance(value, set):
+        if isinstance(filt, Empty):
+            return not value
+        return any(_value_matches(filt, v) for v in value)
+
+    try:
+        return filt.matches(value)
+    except TypeError:
+        # The values which cannot be compared, like None, don't match.
+        return False
+
+
+def _get_joined_values(obj, joins, objects_by_hostname):
+    if joins is None:
+        return obj
+
+    values = {'object_id': obj['object_id']}
+    for attribute_id, join in joins:
+        value = obj.get(attribute_id)
+        if join is not None and value is not None:
+            if isinstance(value, set):
+                value = [
+                    _get_joined_values(
+                        objects_by_hostname[v], join, objects_by_hostname
+                    )
+                    for v in value if v in objects_by_hostname
+                ]
+            elif value in objects_by_hostname:
+                value = _get_joined_values(
+                    objects_by_hostname[value], join, objects_by_hostname
+                )
+            else:
+                value = None
+        values[attribute_id] = value
+
+    return values
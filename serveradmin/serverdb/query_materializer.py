@@ -17,6 +17,7 @@ from serveradmin.serverdb.models import (
     Server,
     ServerAttribute,
     ServerRelationAttribute,
+    ServerSupernet,
 )
 
 
@@ -180,29 +181,15 @@ class QueryMaterializer:
             )
 
     def _add_supernet_attribute(self, attribute, servers):
-        """Merge-join networks to the servers
-
-        This function takes advantage of networks in the same servertype not
-        overlapping with each other.
-        """
-        target = None
-        for source in sorted(servers, key=lambda s: _sort_key(s.intern_ip)):
-            # Check the previous target
-            if target is not None:
-                network = target.intern_ip.network
-                if network.version != source.intern_ip.version:
-                    target = None
-                elif network.broadcast_address < source.intern_ip.ip:
-                    target = None
-                elif source.intern_ip not in network:
-                    continue
-            # Check for a new target
-            if target is None and source.intern_ip:
-                try:
-                    target = source.get_supernet(attribute.target_servertype)
-                except Server.DoesNotExist:
-                    continue
-            self._server_attributes[source][attribute] = target
+        """Join the networks to the servers"""
+        servers = {s.server_id: s for s in servers if s.intern_ip}
+        for ss in ServerSupernet.objects.filter(
+            server_id__in=servers.keys(),
+            servertype_id=attribute.target_servertype_id,
+        ).select_related('supernet'):
+            self._server_attributes[servers[ss.server_id]][attribute] = (
+                ss.supernet
+            )
 
     def _add_related_attribute(
         self, attribute, servertype_attribute, servers_by_type
@@ -0,0 +1,134 @@
+"""Serveradmin - Inventory Snapshots
+
+The state of the inventory at a time is found by loading the last snapshot
+before it and replaying the changes recorded after the snapshot.  Taking
+the snapshots regularly bounds the number of changes to replay.
+
+The attributes which are not stored on the objects themselves, like the
+supernets and the reverse relations, are not recorded on the change log.
+They are as of the snapshot.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from datetime import timezone
+
+from django.db import connection, transaction
+from django.utils.timezone import is_naive, make_aware, now
+
+from serveradmin.serverdb.models import (
+    Attribute,
+    ChangeAdd,
+    ChangeCommit,
+    ChangeDelete,
+    ChangeUpdate,
+    InventorySnapshot,
+    Server,
+)
+from serveradmin.serverdb.query_materializer import QueryMaterializer
+
+
+def create_snapshot():
+    """Take a snapshot of all of the objects as of now"""
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+            # The lock waits for the running commits and holds the new ones
+            # back until the snapshot is saved.  It has to be taken before
+            # the first query, so that the transaction sees all of the
+            # commits up to the last one.
+            cursor.execute(
+                'LOCK TABLE {} IN SHARE MODE'
+                .format(ChangeCommit._meta.db_table)
+            )
+
+        # The objects may exist without any commits, if they were imported
+        # to the database.  The snapshot covers them as of no commit then.
+        last_commit_id = (
+            ChangeCommit.objects.order_by('-id')
+            .values_list('id', flat=True)
+            .first()
+        ) or 0
+
+        # Taking the snapshot again without any new commits keeps the one
+        # we have.  Moving its time forward would leave the queries about
+        # the time in between without it.
+        snapshot = InventorySnapshot.objects.filter(
+            commit_id=last_commit_id
+        ).first()
+        if snapshot is not None:
+            return snapshot
+
+        attributes = list(Attribute.specials.values())
+        attributes.extend(Attribute.objects.all())
+        snapshot = InventorySnapshot(commit_id=last_commit_id, change_on=now())
+        snapshot.set_objects(QueryMaterializer(
+            list(Server.objects.all()), {a: None for a in attributes}
+        ))
+        snapshot.save()
+
+    return snapshot
+
+
+def get_objects_as_of(as_of):
+    """Get the objects as they were at the time indexed by their ids
+
+    The attribute values are returned the way they are stored on the change
+    log, which is the same way the API encodes them.
+    """
+    if is_naive(as_of):
+        as_of = make_aware(as_of, timezone.utc)
+
+    snapshot = (
+        InventorySnapshot.objects
+        .filter(change_on__lte=as_of)
+        .order_by('-commit_id')
+        .first()
+    )
+    if snapshot is None:
+        objects = {}
+        last_commit_id = 0
+    else:
+        objects = snapshot.get_objects()
+        last_commit_id = snapshot.commit_id
+
+    # The changes are applied in the order of the commits.  The changes of
+    # a commit are applied in the same order as the commit does.
+    changes = []
+    for order, model in enumerate((ChangeDelete, ChangeAdd, ChangeUpdate)):
+        changes.extend(
+            ((c.change_on, c.commit_id, order), c)
+            for c in model.objects.filter(
+                commit_id__gt=last_commit_id, change_on__lte=as_of
+            )
+        )
+    changes.sort(key=lambda c: c[0])
+
+    for key, change in changes:
+        if isinstance(change, ChangeDelete):
+            objects.pop(change.server_id, None)
+        elif isinstance(change, ChangeAdd):
+            objects[change.server_id] = dict(change.attributes)
+        elif change.server_id in objects:
+            _apply_updates(objects[change.server_id], change.updates)
+
+    return objects
+
+
+def _apply_updates(obj, updates):
+    for attribute_id, change in updates.items():
+        if attribute_id == 'object_id':
+            continue
+
+        action = change['action']
+        if action == 'multi':
+            values = [
+                v for v in obj.get(attribute_id) or []
+                if v not in change['remove']
+            ]
+            values.extend(v for v in change['add'] if v not in values)
+            obj[attribute_id] = values
+        elif action == 'delete':
+            obj[attribute_id] = None
+        else:
+            obj[attribute_id] = change['new']
@@ -29,13 +29,33 @@ from serveradmin.serverdb.models import (
     Server,
     ServerAttribute,
     ServerRelationAttribute,
+    ServerSupernet,
 )
 
 
+# Any() filters with this many values are passed as an array parameter
+VALUE_ARRAY_THRESHOLD = 100
+
+# The Postgres types of the value arrays by the attribute types
+ARRAY_TYPES = {
+    'string': 'text',
+    'number': 'numeric',
+    'inet': 'inet',
+    'macaddr': 'macaddr',
+    'date': 'date',
+    'datetime': 'timestamptz',
+}
+
+
 # XXX: The "related_vias" argument is carried all the way through most of
 # the functions to optimize related_via_attribute selection.  We should find
 # a nicer way to achieve this.
-def get_server_query(attribute_filters, related_vias):
+def get_server_query(attribute_filters, related_vias, params):
+    """Get the SQL query of the servers matching the filters
+
+    The long value lists are not put into the query.  They are added to
+    the params dictionary to be passed to the database separately.
+    """
     sql = (
         'SELECT'
         ' server.server_id,'
@@ -46,7 +66,7 @@ def get_server_query(attribute_filters, related_vias):
     )
     if attribute_filters:
         sql += ' WHERE ' + ' AND '.join(
-            _get_sql_condition(a, f, related_vias)
+            _get_sql_condition(a, f, related_vias, params)
             for a, f in attribute_filters
         )
     sql += ' ORDER BY server.hostname'
@@ -54,11 +74,13 @@ def get_server_query(attribute_filters, related_vias):
     return sql
 
 
-def _get_sql_condition(attribute, filt, related_vias):
+def _get_sql_condition(attribute, filt, related_vias, params):
     assert isinstance(filt, BaseFilter)
 
     if isinstance(filt, (Not, Any)):
-        return _logical_filter_sql_condition(attribute, filt, related_vias)
+        return _logical_filter_sql_condition(
+            attribute, filt, related_vias, params
+        )
 
     negate = False
     template = ''
@@ -111,10 +133,10 @@ def _covered_sql_condition(attribute, template, negate, related_vias):
     )
 
 
-def _logical_filter_sql_condition(attribute, filt, related_vias):
+def _logical_filter_sql_condition(attribute, filt, related_vias, params):
     if isinstance(filt, Not):
         return 'NOT ({0})'.format(
-            _get_sql_condition(attribute, filt.value, related_vias)
+            _get_sql_condition(attribute, filt.value, related_vias, params)
         )
 
     if isinstance(filt, All):
@@ -132,13 +154,25 @@ def _logical_filter_sql_condition(attribute, filt, related_vias):
             simple_values.append(value)
         else:
             templates.append(
-                _get_sql_condition(attribute, value, related_vias)
+                _get_sql_condition(attribute, value, related_vias, params)
             )
 
     if simple_values:
+        array_type = _get_array_type(attribute)
         if len(simple_values) == 1:
             template = _get_sql_condition(
-                attribute, simple_values[0], related_vias
+                attribute, simple_values[0], related_vias, params
+            )
+        elif len(simple_values) >= VALUE_ARRAY_THRESHOLD and array_type:
+            # The value is passed as a single array literal, so that
+            # the database doesn't parse and plan the values one by one.
+            name = 'values{}'.format(len(params))
+            params[name] = _array_literal(v.value for v in simple_values)
+            template = _covered_sql_condition(
+                attribute,
+                '{{0}} = ANY(%({0})s::{1}[])'.format(name, array_type),
+                False,
+                related_vias,
             )
         else:
             template = _covered_sql_condition(
@@ -154,6 +188,16 @@ def _logical_filter_sql_condition(attribute, filt, related_vias):
     return '({0})'.format(joiner.join(templates))
 
 
+def _get_array_type(attribute):
+    """Get the type to cast the value arrays of the attribute to"""
+    if attribute.type in ['relation', 'reverse', 'supernet', 'domain']:
+        return 'text'   # They are compared by the hostnames
+    if attribute.special and attribute.special.field == 'server_id':
+        return 'integer'
+
+    return ARRAY_TYPES.get(attribute.type)
+
+
 def _basic_comparison_filter_template(attribute, filt):
     if isinstance(filt, GreaterThan):
         operator = '>'
@@ -172,21 +216,18 @@ def _basic_comparison_filter_template(attribute, filt):
 def _containment_filter_template(attribute, filt):
     template = None     # To be formatted 2 times
     value = filt.value
+    cast = ''
 
     if attribute.type == 'inet':
+        # The values are cast explicitly, so that the operators of the GiST
+        # indexes are chosen.
+        cast = '::inet'
         if isinstance(filt, StartsWith):
-            template = "{{0}} >>= {0} AND host({{0}}) = host(0{})"
+            template = "{{0}} >>= {0} AND host({{0}}) = host({0})"
         elif isinstance(filt, Contains):
             template = "{{0}} >>= {0}"
         elif isinstance(filt, ContainedOnlyBy):
-            template = (
-                "{{0}} << {0} AND NOT EXISTS ("
-                '   SELECT 1 '
-                '   FROM server AS supernet '
-                '   WHERE {{0}} << supernet.intern_ip AND '
-                '       supernet.intern_ip << {0}'
-                ')'
-            )
+            template = _contained_only_by_template(attribute)
         elif isinstance(filt, ContainedBy):
             template = "{{0}} <<= {0}"
         else:
@@ -207,7 +248,32 @@ def _containment_filter_template(attribute, filt):
             .format(type(filt).__name__, attribute)
         )
 
-    return template.format(_raw_sql_escape(value))
+    return template.format(_raw_sql_escape(value) + cast)
+
+
+def _contained_only_by_template(attribute):
+    if attribute.special:
+        # The networks in between are among the supernets of the server.
+        return (
+            "{{0}} << {0} AND NOT EXISTS ("
+            '   SELECT 1 '
+            '   FROM server_supernet AS sup '
+            '       JOIN server AS supernet '
+            '           ON supernet.server_id = sup.supernet_id '
+            '   WHERE sup.server_id = server.server_id AND '
+            '       {{0}} << supernet.intern_ip AND '
+            '       supernet.intern_ip << {0}'
+            ')'
+        )
+
+    return (
+        "{{0}} << {0} AND NOT EXISTS ("
+        '   SELECT 1 '
+        '   FROM server AS supernet '
+        '   WHERE {{0}} << supernet.intern_ip AND '
+        '       supernet.intern_ip << {0}'
+        ')'
+    )
 
 
 def _condition_sql(attribute, template, related_vias):
@@ -215,10 +281,10 @@ def _condition_sql(attribute, template, related_vias):
         return template.format('server.' + attribute.special.field)
 
     if attribute.type == 'supernet':
-        return _exists_sql(Server, 'sub', (
+        return _exists_sql(ServerSupernet, 'sub', (
             "sub.servertype_id = '{0}'".format(attribute.target_servertype_id),
-            'sub.intern_ip >>= server.intern_ip',
-            template.format('sub.server_id'),
+            'sub.server_id = server.server_id',
+            template.format('sub.supernet_id'),
         ))
     if attribute.type == 'domain':
         return _exists_sql(Server, 'sub', (
@@ -260,12 +326,12 @@ def _real_condition_sql(attribute, template, related_vias):
             # The condition for directly attached attributes
             relation_condition = 'server.server_id = sub.server_id'
         elif related_via_attribute.type == 'supernet':
-            relation_condition = _exists_sql(Server, 'rel1', (
+            relation_condition = _exists_sql(ServerSupernet, 'rel1', (
                 "rel1.servertype_id = '{0}'".format(
                     related_via_attribute.target_servertype_id
                 ),
-                'rel1.intern_ip >>= server.intern_ip',
-                'rel1.server_id = sub.server_id',
+                'rel1.server_id = server.server_id',
+                'rel1.supernet_id = sub.server_id',
             ))
         elif related_via_attribute.type == 'reverse':
             relation_condition = _exists_sql(ServerRelationAttribute, 'rel1', (
@@ -326,3 +392,11 @@ def _raw_sql_escape(value):
     value = value.replace('{', '{{').replace('}', '}}').replace('%', '%%')
 
     return "'" + value + "'"
+
+
+def _array_literal(values):
+    """Format the values as a Postgres array literal"""
+    return '{' + ','.join(
+        '"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for v in values
+    ) + '}'
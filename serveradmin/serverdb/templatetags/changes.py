@@ -4,16 +4,11 @@ Copyright (c) 2020 InnoGames GmbH
 """
 
 from django import template
-from django.core.exceptions import ObjectDoesNotExist
-
-from serveradmin.serverdb.models import Server
 
 register = template.Library()
 
 
 @register.filter
-def hostname(object_id):
-    try:
-        return Server.objects.get(server_id=object_id).hostname
-    except ObjectDoesNotExist:
-        return object_id
+def hostname(object_id, hostnames):
+    """Look the object up in the hostnames resolved by the view"""
+    return hostnames.get(object_id, object_id)
@@ -0,0 +1,98 @@
+"""Serveradmin - Change log view tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase
+
+from serveradmin.dataset import Query
+
+
+class TestHistory(TransactionTestCase):
+    fixtures = ['test_dataset.json', 'auth_user.json']
+
+    def setUp(self):
+        self.user = User.objects.get(username='admin')
+        self.client.force_login(self.user)
+
+        q = Query({'hostname': 'test1'}, ['os', 'game_world'])
+        q.get()['os'] = 'wheezy'
+        q.commit(user=self.user)
+        q = Query({'hostname': 'test1'}, ['os', 'game_world'])
+        q.get()['game_world'] = 4
+        q.commit(user=self.user)
+        self.object_id = q.get().object_id
+
+    def get(self, **params):
+        response = self.client.get('/serverdb/history', {
+            'object_id': self.object_id,
+            **params,
+        })
+        self.assertEqual(response.status_code, 200)
+
+        return response
+
+    def search(self, search_string):
+        response = self.get(search_string=search_string)
+
+        return [c for t, c in response.context['change_list']]
+
+    def test_history(self):
+        changes = [c for t, c in self.get().context['change_list']]
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(changes[0].updates['game_world']['new'], 4)
+        self.assertEqual(changes[1].updates['os']['new'], 'wheezy')
+        self.assertEqual(changes[0].commit.user, self.user)
+
+    @patch('serveradmin.serverdb.views.HISTORY_PAGE_SIZE', 1)
+    def test_pages(self):
+        response = self.get()
+        first = [c for t, c in response.context['change_list']]
+        self.assertEqual(len(first), 1)
+        next_cursor = response.context['next_cursor']
+        self.assertEqual(next_cursor, first[0].commit.id)
+
+        response = self.get(before=next_cursor)
+        second = [c for t, c in response.context['change_list']]
+        self.assertEqual(len(second), 1)
+        self.assertLess(second[0].commit.change_on, first[0].commit.change_on)
+        self.assertIsNone(response.context['next_cursor'])
+
+    def test_search_attribute(self):
+        changes = self.search('game_world')
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].updates['game_world']['new'], 4)
+
+    def test_search_value(self):
+        self.assertEqual(len(self.search('os=wheezy')), 1)
+        self.assertEqual(len(self.search('os=squeeze')), 1)
+        self.assertEqual(len(self.search('game_world=4')), 1)
+        self.assertEqual(len(self.search('game_world=5')), 0)
+
+
+class TestChanges(TransactionTestCase):
+    fixtures = ['test_dataset.json', 'auth_user.json']
+
+    def setUp(self):
+        self.user = User.objects.get(username='admin')
+        self.client.force_login(self.user)
+
+    def test_hostnames(self):
+        q = Query({'hostname': 'test1'}, ['os'])
+        q.get()['os'] = 'wheezy'
+        q.commit(user=self.user)
+        object_id = q.get().object_id
+        q = Query({'hostname': 'test2'})
+        deleted_id = q.get().object_id
+        q.delete()
+        q.commit(user=self.user)
+
+        response = self.client.get('/serverdb/changes')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['hostnames'], {
+            object_id: 'test1',
+            deleted_id: 'test2',
+        })
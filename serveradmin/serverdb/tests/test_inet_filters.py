@@ -0,0 +1,143 @@
+"""Serveradmin - inet filter tests
+
+The benchmark of the containment filters on a big synthetic address set
+only runs with SERVERADMIN_BENCHMARK set to the number of servers.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import os
+import time
+from ipaddress import IPv4Address, IPv6Address, ip_network
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from adminapi.filters import ContainedBy, Contains, Overlaps, StartsWith
+from serveradmin.dataset import Query
+from serveradmin.serverdb.models import Server, ServerInetAttribute
+
+BENCHMARK_SIZE = int(os.environ.get('SERVERADMIN_BENCHMARK') or 0)
+
+
+class TestInetFilters(TransactionTestCase):
+    fixtures = ['auth_user.json', 'ip_addr_type.json']
+
+    def setUp(self):
+        user = User.objects.first()
+        for hostname, intern_ip, ip_config in (
+            ('net1', '10.0.0.0/16', '10.1.0.0/24'),
+            ('net2', '10.2.0.0/16', '10.3.0.0/24'),
+        ):
+            obj = Query().new_object('network')
+            obj['hostname'] = hostname
+            obj['intern_ip'] = intern_ip
+            obj['ip_config'] = ip_config
+            obj.commit(user=user)
+
+    def query(self, **filters):
+        return [o['hostname'] for o in Query(filters, ['hostname'])]
+
+    def explain(self, **filters):
+        """Get the plan of the query with the sequential scans discouraged
+
+        The test tables are too small for the planner to choose an index
+        on its own.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.query(**filters)
+        sql = next(
+            q['sql'] for q in queries
+            if q['sql'].startswith('SELECT server.server_id')
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('EXPLAIN ' + sql)
+            return '\n'.join(r for r, in cursor.fetchall())
+
+    def test_contains(self):
+        self.assertEqual(self.query(ip_config=Contains('10.1.0.1')), ['net1'])
+        self.assertEqual(self.query(intern_ip=Contains('10.2.1.1')), ['net2'])
+
+    def test_contained_by(self):
+        self.assertEqual(self.query(ip_config=ContainedBy('10.0.0.0/8')), [
+            'net1', 'net2'
+        ])
+        self.assertEqual(self.query(intern_ip=ContainedBy('10.2.0.0/15')), [
+            'net2'
+        ])
+
+    def test_overlaps(self):
+        self.assertEqual(self.query(ip_config=Overlaps('10.3.0.0/16')), [
+            'net2'
+        ])
+
+    def test_starts_with(self):
+        self.assertEqual(self.query(ip_config=StartsWith('10.1.0.0')), [
+            'net1'
+        ])
+        self.assertEqual(self.query(ip_config=StartsWith('10.1.0.1')), [])
+
+    def test_index(self):
+        self.assertIn(
+            'server_inet_attribute_value_gist',
+            self.explain(ip_config=ContainedBy('10.0.0.0/8')),
+        )
+        self.assertIn(
+            'server_intern_ip_gist',
+            self.explain(intern_ip=ContainedBy('10.0.0.0/8')),
+        )
+
+
+@skipUnless(BENCHMARK_SIZE, 'SERVERADMIN_BENCHMARK is not set')
+class BenchmarkInetFilters(TransactionTestCase):
+    fixtures = ['auth_user.json', 'ip_addr_type.json']
+
+    def setUp(self):
+        # Every other address is an IPv6 one, spread to 256 /64 networks.
+        servers = []
+        for index in range(BENCHMARK_SIZE):
+            if index % 2:
+                addr = IPv6Address(
+                    (0x20010db8 << 96) + (index % 256 << 64) + index
+                )
+            else:
+                addr = IPv4Address((10 << 24) + index)
+            servers.append((
+                Server(
+                    hostname='host{}'.format(index),
+                    intern_ip=addr,
+                    servertype_id='host',
+                ),
+                addr,
+            ))
+        self.addrs = [a for s, a in servers]
+        Server.objects.bulk_create((s for s, a in servers), batch_size=10000)
+        ServerInetAttribute.objects.bulk_create(
+            (
+                ServerInetAttribute(
+                    server=s, attribute_id='ip_config', value=a
+                )
+                for s, a in servers
+            ),
+            batch_size=10000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE server')
+            cursor.execute('ANALYZE server_inet_attribute')
+
+    def test_benchmark(self):
+        for network in ('10.0.0.0/16', '2001:db8:0:5::/64'):
+            expected = sum(a in ip_network(network) for a in self.addrs)
+            for attribute_id in ('intern_ip', 'ip_config'):
+                start = time.monotonic()
+                count = len(Query(
+                    {attribute_id: ContainedBy(network)}, ['hostname']
+                ))
+                print('{} in {}: {} objects in {:.3f} seconds'.format(
+                    attribute_id, network, count, time.monotonic() - start
+                ))
+                self.assertEqual(count, expected)
@@ -511,3 +511,76 @@ class TestIpAddrTypeNetworkForInetAttributes(TestIpAddrType):
         to_rename = Query({'hostname': server['hostname']}, ['hostname'])
         to_rename.update(hostname=self.faker.hostname())
         self.assertIsNone(to_rename.commit(user=User.objects.first()))
+
+
+class TestIpAddrTypeSameCommit(TestIpAddrType):
+    """Validation of the values committed together"""
+
+    def _get_servers(self, servertype: str, count: int) -> Query:
+        query = Query()
+        for i in range(count):
+            server = query.new_object(servertype)
+            server['hostname'] = self.faker.hostname()
+
+        return query
+
+    def test_servers_with_duplicate_inet_attribute(self):
+        query = self._get_servers('host', 2)
+        for i, server in enumerate(query):
+            server['intern_ip'] = '10.0.0.{}/32'.format(i + 1)
+            server['ip_config'] = '10.0.1.1/32'
+
+        with self.assertRaises(ValidationError) as context:
+            query.commit(user=User.objects.first())
+
+        # Every violating object must be reported.
+        for server in query:
+            self.assertIn(server['hostname'], str(context.exception))
+
+    def test_servers_with_duplicate_intern_ip(self):
+        query = self._get_servers('host', 2)
+        for server in query:
+            server['intern_ip'] = '10.0.0.1/32'
+
+        with self.assertRaises(ValidationError):
+            query.commit(user=User.objects.first())
+
+    def test_server_with_own_intern_ip(self):
+        query = self._get_servers('host', 1)
+        for server in query:
+            server['intern_ip'] = '10.0.0.1/32'
+            server['ip_config'] = '10.0.0.1/32'
+
+        self.assertIsNone(query.commit(user=User.objects.first()))
+
+    def test_servers_network_overlaps(self):
+        query = self._get_servers('network', 2)
+        for i, server in enumerate(query):
+            server['intern_ip'] = '10.0.{}.0/24'.format(i)
+            server['ip_config'] = '10.1.0.0/{}'.format(24 + i)
+
+        with self.assertRaises(ValidationError):
+            query.commit(user=User.objects.first())
+
+    def test_servers_network_overlaps_nested(self):
+        # The last network only overlaps with the first one, not with its
+        # neighbour.
+        query = self._get_servers('network', 3)
+        for server, intern_ip in zip(query, (
+            '10.0.0.0/16', '10.0.1.0/24', '10.0.2.0/24'
+        )):
+            server['intern_ip'] = intern_ip
+
+        with self.assertRaises(ValidationError) as context:
+            query.commit(user=User.objects.first())
+
+        for server in query:
+            self.assertIn(server['hostname'], str(context.exception))
+
+    def test_servers_network_with_own_intern_ip(self):
+        query = self._get_servers('network', 2)
+        for i, server in enumerate(query):
+            server['intern_ip'] = '10.0.{}.0/24'.format(i)
+            server['ip_config'] = '10.0.{}.0/25'.format(i)
+
+        self.assertIsNone(query.commit(user=User.objects.first()))
@@ -0,0 +1,79 @@
+"""Serveradmin - Change log partition tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from datetime import datetime, timezone
+from io import StringIO
+from os import listdir
+from tempfile import TemporaryDirectory
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from django.utils.timezone import now
+
+from serveradmin.dataset import Query
+from serveradmin.serverdb.models import ChangeCommit, ChangeUpdate
+from serveradmin.serverdb.partitions import (
+    create_partition,
+    get_month,
+    get_partition_months,
+)
+
+
+class TestChangePartitions(TransactionTestCase):
+    fixtures = ['test_dataset.json', 'auth_user.json']
+
+    def setUp(self):
+        self.user = User.objects.get(username='admin')
+
+    def commit(self):
+        q = Query({'hostname': 'test1'}, ['os'])
+        q.get()['os'] = 'wheezy'
+        q.commit(user=self.user)
+
+    def test_create(self):
+        call_command(
+            'change_partitions', 'create', '--months=3', stdout=StringIO()
+        )
+        months = get_partition_months()
+        self.assertIn(get_month(now()), months)
+        self.assertEqual(len(set(months)), len(months))
+
+    def test_create_moves_default(self):
+        # The month without a partition ends up on the default partition.
+        change_on = datetime(2000, 1, 15, tzinfo=timezone.utc)
+        commit = ChangeCommit.objects.create(change_on=change_on)
+        ChangeUpdate.objects.create(
+            commit=commit, change_on=change_on, server_id=1, updates_json={}
+        )
+        create_partition(get_month(change_on))
+
+        self.assertIn(get_month(change_on), get_partition_months())
+        self.assertTrue(
+            ChangeUpdate.objects.filter(change_on=change_on).exists()
+        )
+
+    def test_archive_restore(self):
+        self.commit()
+        month = get_month(now())
+        with TemporaryDirectory() as directory:
+            call_command(
+                'change_partitions', 'archive', '--keep-months=-1',
+                '--directory', directory, stdout=StringIO(),
+            )
+            self.assertNotIn(month, get_partition_months())
+            self.assertFalse(ChangeCommit.objects.exists())
+            self.assertFalse(ChangeUpdate.objects.exists())
+            self.assertEqual(len(listdir(directory)), 4)
+
+            call_command(
+                'change_partitions', 'restore',
+                '--month', month.strftime('%Y-%m'), '--directory', directory,
+                stdout=StringIO(),
+            )
+        self.assertIn(month, get_partition_months())
+        update = ChangeUpdate.objects.get()
+        self.assertEqual(update.updates['os']['new'], 'wheezy')
+        self.assertEqual(update.commit.user, self.user)
@@ -0,0 +1,311 @@
+"""Serveradmin - Query count budget tests
+
+The hot endpoints must issue a constant number of SQL statements no matter
+how many objects are stored in the database.  Every test in here runs its
+operation against a small fixture, grows the fixture and runs it again.
+A differing number of statements is almost always an N+1 pattern, so the
+failure message lists the statements that were repeated.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import json
+import re
+import time
+from collections import Counter
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from adminapi.request import calc_security_token, json_encode_extra
+from serveradmin.apps.models import Application
+from serveradmin.serverdb.models import (
+    Attribute,
+    ChangeAdd,
+    ChangeCommit,
+    Server,
+    ServerNumberAttribute,
+    ServerRelationAttribute,
+    ServerStringAttribute,
+    ServerSupernet,
+    Servertype,
+    ServertypeAttribute,
+)
+
+# The fixture is grown through these sizes (number of VMs).  There is one
+# hypervisor per 10 VMs and one route network per 100 VMs.
+FIXTURE_SIZES = (10, 1000)
+
+_literal_re = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_list_re = re.compile(r'\((?:\?, )+\?\)')
+
+
+def _normalize_sql(sql):
+    """Replace the literals to group statements that only differ by them"""
+    return _list_re.sub('(...)', _literal_re.sub('?', sql))
+
+
+class QueryCountTestCase(TransactionTestCase):
+    fixtures = ['auth_user.json']
+
+    def setUp(self):
+        self.user = User.objects.get(username='admin')
+        self.app = Application.objects.create(
+            name='query_count', owner=self.user, location='test',
+            superuser=True,
+        )
+        self.client.force_login(self.user)
+        self.num_vms = 0
+        self.servers = []
+
+        route_network = Servertype.objects.create(
+            servertype_id='route_network', ip_addr_type='network'
+        )
+        hypervisor = Servertype.objects.create(
+            servertype_id='hypervisor', ip_addr_type='host'
+        )
+        vm = Servertype.objects.create(servertype_id='vm', ip_addr_type='host')
+        any_value = {'regexp': r'\A.*\Z'}
+        attributes = {
+            a.attribute_id: a for a in Attribute.objects.bulk_create([
+                Attribute(attribute_id='os', type='string', **any_value),
+                Attribute(attribute_id='num_cpu', type='number', **any_value),
+                Attribute(
+                    attribute_id='tags', type='string', multi=True, **any_value
+                ),
+                Attribute(
+                    attribute_id='hypervisor', type='relation',
+                    target_servertype=hypervisor, **any_value
+                ),
+                Attribute(
+                    attribute_id='route_network', type='supernet',
+                    target_servertype=route_network, readonly=True,
+                    **any_value
+                ),
+            ])
+        }
+        ServertypeAttribute.objects.bulk_create([
+            ServertypeAttribute(servertype=vm, attribute=attributes[a])
+            for a in ('os', 'num_cpu', 'tags', 'hypervisor', 'route_network')
+        ] + [
+            ServertypeAttribute(servertype=hypervisor, attribute=attributes[a])
+            for a in ('os', 'route_network')
+        ])
+
+    def grow(self, num_vms):
+        """Add objects until the fixture has the given number of VMs"""
+        new_servers = []
+        hypervisor_ids = {}
+        for index in range(self.num_vms, num_vms):
+            network_index = index // 100
+            network_prefix = '10.{}.{}.'.format(
+                network_index // 256, network_index % 256
+            )
+            if index % 100 == 0:
+                new_servers.append(Server(
+                    hostname='net{}'.format(network_index),
+                    intern_ip=network_prefix + '0/24',
+                    servertype_id='route_network',
+                ))
+            if index % 10 == 0:
+                new_servers.append(Server(
+                    hostname='hv{}'.format(index // 10),
+                    intern_ip=network_prefix + str(101 + index // 10 % 10),
+                    servertype_id='hypervisor',
+                ))
+            new_servers.append(Server(
+                hostname='vm{}'.format(index),
+                intern_ip=network_prefix + str(1 + index % 100),
+                servertype_id='vm',
+            ))
+        Server.objects.bulk_create(new_servers)
+        ServerSupernet.update(
+            [s.server_id for s in new_servers],
+            [
+                s.server_id for s in new_servers
+                if s.servertype_id == 'route_network'
+            ],
+        )
+
+        for server in new_servers:
+            if server.servertype_id == 'hypervisor':
+                hypervisor_ids[server.hostname] = server.server_id
+        for server in Server.objects.filter(servertype_id='hypervisor'):
+            hypervisor_ids[server.hostname] = server.server_id
+
+        vms = [s for s in new_servers if s.servertype_id == 'vm']
+        ServerStringAttribute.objects.bulk_create(
+            [
+                ServerStringAttribute(
+                    server=s, attribute_id='os', value='wheezy'
+                )
+                for s in new_servers if s.servertype_id != 'route_network'
+            ] + [
+                ServerStringAttribute(server=s, attribute_id='tags', value=v)
+                for s in vms for v in ('web', 'production')
+            ]
+        )
+        ServerNumberAttribute.objects.bulk_create(
+            ServerNumberAttribute(server=s, attribute_id='num_cpu', value=4)
+            for s in vms
+        )
+        ServerRelationAttribute.objects.bulk_create(
+            ServerRelationAttribute(
+                server=s,
+                attribute_id='hypervisor',
+                value_id=hypervisor_ids[
+                    'hv{}'.format(int(s.hostname[len('vm'):]) // 10)
+                ],
+            )
+            for s in vms
+        )
+
+        # Record the new objects on the change log like a single commit
+        # would have done.
+        commit = ChangeCommit.objects.create(user=self.user)
+        ChangeAdd.objects.bulk_create(
+            ChangeAdd(
+                commit=commit,
+                change_on=commit.change_on,
+                server_id=s.server_id,
+                attributes_json={
+                    'object_id': s.server_id,
+                    'hostname': s.hostname,
+                    'servertype': s.servertype_id,
+                },
+            )
+            for s in new_servers
+        )
+
+        self.servers.extend(new_servers)
+        self.num_vms = num_vms
+
+    def assertConstantQueries(self, operation):
+        """Assert the operation issues the same statements on every size"""
+        captured = []
+        for num_vms in FIXTURE_SIZES:
+            self.grow(num_vms)
+
+            # The first call may populate caches like the last login time
+            # of the application.
+            operation()
+            with CaptureQueriesContext(connection) as context:
+                operation()
+            captured.append(context.captured_queries)
+
+        counts = [len(c) for c in captured]
+        if len(set(counts)) == 1:
+            return
+
+        duplicates = Counter(_normalize_sql(q['sql']) for q in captured[-1])
+        msg = 'Query count changed with the fixture size {}: {}'.format(
+            ' -> '.join(str(s) for s in FIXTURE_SIZES),
+            ' -> '.join(str(c) for c in counts),
+        )
+        for sql, count in duplicates.most_common():
+            if count < 2:
+                break
+            msg += '\n{:>6}x {}'.format(count, sql)
+        self.fail(msg)
+
+    def api_request(self, endpoint, data):
+        body = json.dumps(data, default=json_encode_extra)
+        timestamp = int(time.time())
+        response = self.client.post(
+            '/api' + endpoint,
+            body,
+            content_type='application/x-json',
+            HTTP_X_TIMESTAMP=str(timestamp),
+            HTTP_X_APPLICATION=self.app.app_id,
+            HTTP_X_SECURITYTOKEN=calc_security_token(
+                self.app.auth_token, timestamp, body
+            ),
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        result = json.loads(response.content.decode())
+        self.assertEqual(result.get('status'), 'success', result)
+
+        return result
+
+    def get(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        return response
+
+    def first_vm(self):
+        return Server.objects.get(hostname='vm0')
+
+
+class TestDatasetQueryCount(QueryCountTestCase):
+    def test_dataset_query(self):
+        self.assertConstantQueries(lambda: self.api_request('/dataset/query', {
+            'filters': {'servertype': 'vm'},
+            'restrict': ['hostname', 'os', 'num_cpu', 'tags', 'hypervisor'],
+        }))
+
+    def test_dataset_query_supernet(self):
+        self.assertConstantQueries(lambda: self.api_request('/dataset/query', {
+            'filters': {'servertype': 'vm'},
+            'restrict': ['hostname', 'route_network'],
+        }))
+
+
+class TestDatasetCommitQueryCount(QueryCountTestCase):
+    def test_dataset_commit(self):
+        def operation():
+            server_id = self.first_vm().server_id
+            old = ServerNumberAttribute.objects.get(
+                server_id=server_id, attribute_id='num_cpu'
+            ).get_value()
+            self.api_request('/dataset/commit', {'changed': [{
+                'object_id': server_id,
+                'num_cpu': {'action': 'update', 'old': old, 'new': old + 1},
+            }]})
+
+        self.assertConstantQueries(operation)
+
+    def test_dataset_commit_all(self):
+        def operation():
+            changed = []
+            for sa in ServerNumberAttribute.objects.filter(
+                attribute_id='num_cpu'
+            ):
+                changed.append({
+                    'object_id': sa.server_id,
+                    'num_cpu': {
+                        'action': 'update',
+                        'old': sa.get_value(),
+                        'new': sa.get_value() + 1,
+                    },
+                })
+            self.api_request('/dataset/commit', {'changed': changed})
+
+        self.assertConstantQueries(operation)
+
+
+class TestServershellQueryCount(QueryCountTestCase):
+    def test_get_results(self):
+        self.assertConstantQueries(lambda: self.get('/servershell/results', {
+            'term': 'servertype=vm',
+            'shown_attributes[]': ['hostname', 'os', 'tags', 'hypervisor'],
+            'offset': 0,
+            'limit': 25,
+        }))
+
+    def test_inspect(self):
+        self.assertConstantQueries(lambda: self.get(
+            '/servershell/inspect', {'object_id': self.first_vm().server_id}
+        ))
+
+
+class TestChangesQueryCount(QueryCountTestCase):
+    def test_changes(self):
+        self.assertConstantQueries(lambda: self.get('/serverdb/changes', {}))
+
+    def test_history(self):
+        self.assertConstantQueries(lambda: self.get(
+            '/serverdb/history', {'object_id': self.first_vm().server_id}
+        ))
@@ -0,0 +1,82 @@
+"""Serveradmin - Related page tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.test import TransactionTestCase
+
+from adminapi.filters import Any, BaseFilter
+from serveradmin.dataset import Query
+from serveradmin.serverdb.models import (
+    Attribute,
+    Servertype,
+    ServertypeAttribute,
+)
+from serveradmin.serverdb.query_executer import execute_related_page
+
+
+class TestRelatedPage(TransactionTestCase):
+    fixtures = ['auth_user.json']
+
+    def setUp(self):
+        any_value = {'regexp': r'\A.*\Z'}
+        hv = Servertype.objects.create(servertype_id='hv', ip_addr_type='null')
+        vm = Servertype.objects.create(servertype_id='vm', ip_addr_type='null')
+        tags = Attribute.objects.create(
+            attribute_id='tags', type='string', multi=True, **any_value
+        )
+        hypervisor = Attribute.objects.create(
+            attribute_id='hypervisor', type='relation',
+            target_servertype=hv, **any_value
+        )
+        for servertype, attribute in (
+            (hv, tags), (vm, tags), (vm, hypervisor)
+        ):
+            ServertypeAttribute.objects.create(
+                servertype=servertype, attribute=attribute
+            )
+
+        for hostname in ('hv1', 'hv2', 'hv3'):
+            self.create('hv', hostname, tags={'shown'})
+        self.create('vm', 'vm1', hypervisor='hv1')
+        self.create('vm', 'vm2', hypervisor='hv1')
+        self.create('vm', 'vm3', hypervisor='hv2')
+        self.create('vm', 'vm4', tags={'shown'})
+        self.create('vm', 'vm5')
+
+    def create(self, servertype, hostname, **attributes):
+        obj = Query().new_object(servertype)
+        obj['hostname'] = hostname
+        for attribute_id, value in attributes.items():
+            obj[attribute_id] = value
+        obj.commit(user=User.objects.first())
+
+    def get_page(self, filters, offset, limit):
+        count, page = execute_related_page(
+            filters, 'hypervisor', {'tags': BaseFilter('shown')},
+            ['hostname', 'servertype'], offset, limit,
+        )
+        return count, [(o['hostname'], o['servertype']) for o in page]
+
+    def test_page(self):
+        filters = {'servertype': BaseFilter('vm')}
+        self.assertEqual(self.get_page(filters, 0, 2), (3, [
+            ('hv1', 'hv'), ('hv2', 'hv'),
+        ]))
+        self.assertEqual(self.get_page(filters, 2, 2), (3, [('vm4', 'vm')]))
+        self.assertEqual(self.get_page(filters, 4, 2), (3, []))
+
+    def test_filters(self):
+        self.assertEqual(
+            self.get_page({'hostname': Any('vm3', 'hv3')}, 0, 10),
+            (2, [('hv2', 'hv'), ('hv3', 'hv')]),
+        )
+        self.assertEqual(self.get_page({'hostname': Any()}, 0, 10), (0, []))
+
+    def test_not_relation(self):
+        with self.assertRaises(ValidationError):
+            execute_related_page(
+                {}, 'tags', {}, ['hostname'], 0, 10,
+            )
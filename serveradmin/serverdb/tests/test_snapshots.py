@@ -0,0 +1,76 @@
+"""Serveradmin - Inventory snapshot tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase
+from django.utils.timezone import now
+
+from adminapi.filters import GreaterThan
+from serveradmin.dataset import Query
+from serveradmin.serverdb.snapshots import create_snapshot
+
+
+class TestSnapshots(TransactionTestCase):
+    fixtures = ['test_dataset.json', 'auth_user.json']
+
+    def setUp(self):
+        self.user = User.objects.get(username='admin')
+
+    def commit_os(self, hostname, os):
+        q = Query({'hostname': hostname}, ['os'])
+        q.get()['os'] = os
+        q.commit(user=self.user)
+
+    def test_snapshot(self):
+        self.commit_os('test1', 'wheezy')
+        create_snapshot()
+        as_of = now()
+
+        self.commit_os('test1', 'squeeze')
+        q = Query({'hostname': 'test1'}, ['os'], as_of=as_of)
+        self.assertEqual(q.get()['os'], 'wheezy')
+
+    def test_snapshot_again(self):
+        # The objects of the dataset are imported without any commits, so
+        # they can only be found on the snapshot.
+        first = create_snapshot()
+        as_of = now()
+        second = create_snapshot()
+        self.assertEqual(second.change_on, first.change_on)
+
+        q = Query({'hostname': 'test1'}, ['os'], as_of=as_of)
+        self.assertEqual(q.get()['os'], 'squeeze')
+
+    def test_replay(self):
+        create_snapshot()
+        self.commit_os('test1', 'wheezy')
+        as_of = now()
+        self.commit_os('test1', 'squeeze')
+        Query({'hostname': 'test2'}).delete().commit(user=self.user)
+
+        q = Query({'hostname': 'test1'}, ['os'], as_of=as_of)
+        self.assertEqual(q.get()['os'], 'wheezy')
+        q = Query({'hostname': 'test2'}, as_of=as_of)
+        self.assertEqual(len(q), 1)
+        q = Query({'hostname': 'test2'}, as_of=now())
+        self.assertEqual(len(q), 0)
+
+    def test_filters(self):
+        self.commit_os('test1', 'wheezy')
+        create_snapshot()
+        as_of = now()
+
+        for filters in (
+            {'os': 'wheezy'},
+            {'game_world': GreaterThan(0)},
+        ):
+            expected = [
+                s['hostname'] for s in Query(filters, order_by=['hostname'])
+            ]
+            self.assertTrue(expected)
+            self.assertEqual([
+                s['hostname']
+                for s in Query(filters, order_by=['hostname'], as_of=as_of)
+            ], expected)
@@ -0,0 +1,118 @@
+"""Serveradmin - Network hierarchy tests
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+from io import StringIO
+from ipaddress import IPv4Address, IPv4Network
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TransactionTestCase
+
+from adminapi.filters import ContainedOnlyBy
+from serveradmin.dataset import Query
+from serveradmin.serverdb.models import (
+    Attribute,
+    Server,
+    ServerSupernet,
+    ServertypeAttribute,
+)
+
+
+class TestSupernets(TransactionTestCase):
+    fixtures = ['auth_user.json', 'ip_addr_type.json']
+
+    def setUp(self):
+        self.user = User.objects.first()
+        attribute = Attribute.objects.create(
+            attribute_id='network', type='supernet',
+            target_servertype_id='network', readonly=True,
+            regexp=r'\A.*\Z',
+        )
+        ServertypeAttribute.objects.create(
+            servertype_id='host', attribute=attribute
+        )
+
+        self.create('network', 'net1', '10.0.0.0/24')
+        self.create('other_network', 'net2', '10.0.0.0/16')
+        self.create('host', 'host1', '10.0.0.1')
+        self.create('host', 'host2', '10.0.1.1')
+
+    def create(self, servertype, hostname, intern_ip):
+        obj = Query().new_object(servertype)
+        obj['hostname'] = hostname
+        obj['intern_ip'] = intern_ip
+        obj.commit(user=self.user)
+
+    def get_supernets(self, hostname):
+        return {
+            ss.servertype_id: ss.supernet.hostname
+            for ss in ServerSupernet.objects.filter(server__hostname=hostname)
+        }
+
+    def test_create(self):
+        self.assertEqual(self.get_supernets('host1'), {
+            'network': 'net1', 'other_network': 'net2',
+        })
+        self.assertEqual(self.get_supernets('host2'), {
+            'other_network': 'net2',
+        })
+        self.assertEqual(self.get_supernets('net1'), {
+            'network': 'net1', 'other_network': 'net2',
+        })
+
+    def test_change(self):
+        q = Query({'hostname': 'net1'}, ['intern_ip'])
+        q.update(intern_ip=IPv4Network('10.0.1.0/24'))
+        q.commit(user=self.user)
+        self.assertNotIn('network', self.get_supernets('host1'))
+        self.assertEqual(self.get_supernets('host2')['network'], 'net1')
+
+        q = Query({'hostname': 'host1'}, ['intern_ip'])
+        q.update(intern_ip=IPv4Address('10.0.1.2'))
+        q.commit(user=self.user)
+        self.assertEqual(self.get_supernets('host1')['network'], 'net1')
+
+    def test_delete(self):
+        Query({'hostname': 'net1'}).delete().commit(user=self.user)
+        self.assertEqual(self.get_supernets('host1'), {
+            'other_network': 'net2',
+        })
+
+    def test_save(self):
+        server = Server.objects.get(hostname='net1')
+        server.intern_ip = IPv4Network('10.0.1.0/24')
+        server.save()
+        self.assertNotIn('network', self.get_supernets('host1'))
+        self.assertEqual(self.get_supernets('host2')['network'], 'net1')
+
+    def test_rebuild(self):
+        Server.objects.filter(hostname='host2').update(intern_ip='10.0.0.2')
+        ServerSupernet.objects.filter(server__hostname='host1').delete()
+        call_command('rebuild_supernets', stdout=StringIO())
+        for hostname in ('host1', 'host2'):
+            self.assertEqual(self.get_supernets(hostname), {
+                'network': 'net1', 'other_network': 'net2',
+            })
+
+    def test_query(self):
+        self.assertEqual(
+            {
+                o['hostname']: o['network']
+                for o in Query({'servertype': 'host'}, ['hostname', 'network'])
+            },
+            {'host1': 'net1', 'host2': None},
+        )
+        self.assertEqual(
+            [o['hostname'] for o in Query({'network': 'net1'}, ['hostname'])],
+            ['host1'],
+        )
+        self.assertEqual(
+            [
+                o['hostname'] for o in Query(
+                    {'intern_ip': ContainedOnlyBy('10.0.0.0/16')}, ['hostname']
+                )
+            ],
+            ['host2', 'net1'],
+        )
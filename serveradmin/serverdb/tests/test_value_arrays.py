@@ -0,0 +1,112 @@
+"""Serveradmin - Value array tests
+
+The benchmark of the long Any() filters only runs with SERVERADMIN_BENCHMARK
+set to the number of servers.
+
+Copyright (c) 2021 InnoGames GmbH
+"""
+
+import os
+import time
+from ipaddress import IPv4Address
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from adminapi.filters import Any, Not
+from serveradmin.dataset import Query
+from serveradmin.serverdb import sql_generator
+from serveradmin.serverdb.models import Server
+
+BENCHMARK_SIZE = int(os.environ.get('SERVERADMIN_BENCHMARK') or 0)
+
+
+class TestValueArrays(TransactionTestCase):
+    fixtures = ['test_dataset.json']
+
+    def query(self, attribute_id, *values):
+        filler = [
+            'filler\\{},{{}}'.format(i)
+            if isinstance(values[0], str) else type(values[0])(i + 1000)
+            for i in range(sql_generator.VALUE_ARRAY_THRESHOLD)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            hostnames = sorted(
+                o['hostname']
+                for o in Query({attribute_id: Any(*values, *filler)})
+            )
+        self.assertTrue(any('= ANY(' in q['sql'] for q in queries))
+
+        return hostnames
+
+    def test_string(self):
+        self.assertEqual(self.query('hostname', 'test1', 'test3'), [
+            'test1', 'test3'
+        ])
+        self.assertEqual(self.query('os', 'wheezy'), ['test0'])
+        self.assertEqual(self.query('servertype', 'test0'), ['test0'])
+
+    def test_number(self):
+        self.assertEqual(self.query('game_world', 2, 10), ['test2', 'test3'])
+        self.assertEqual(self.query('object_id', 1, 2), ['test0', 'test1'])
+
+    def test_inet(self):
+        self.assertEqual(
+            self.query('intern_ip', IPv4Address(168820739)), ['test2']
+        )
+
+    def test_not(self):
+        values = ['test{}'.format(i) for i in range(1, 1000)]
+        self.assertEqual(
+            [o['hostname'] for o in Query({'hostname': Not(Any(*values))})],
+            ['test0'],
+        )
+
+
+@skipUnless(BENCHMARK_SIZE, 'SERVERADMIN_BENCHMARK is not set')
+class BenchmarkValueArrays(TransactionTestCase):
+    fixtures = ['test_dataset.json']
+
+    def setUp(self):
+        Server.objects.bulk_create(
+            (
+                Server(
+                    hostname='host{}'.format(i),
+                    intern_ip=IPv4Address((10 << 24) + i),
+                    servertype_id='test0',
+                )
+                for i in range(BENCHMARK_SIZE)
+            ),
+            batch_size=10000,
+        )
+
+    def test_benchmark(self):
+        for count in sorted({min(c, BENCHMARK_SIZE) for c in (
+            10, 1000, BENCHMARK_SIZE
+        )}):
+            hostnames = ['host{}'.format(i * 2) for i in range(count)]
+            expected = (min(count * 2, BENCHMARK_SIZE) + 1) // 2
+            for name, threshold in (('inline', count + 1), ('array', 2)):
+                with mock.patch.object(
+                    sql_generator, 'VALUE_ARRAY_THRESHOLD', threshold
+                ), CaptureQueriesContext(connection) as queries:
+                    start = time.monotonic()
+                    length = len(Query({'hostname': Any(*hostnames)}))
+                    duration = time.monotonic() - start
+                sql = next(
+                    q for q in queries
+                    if q['sql'].startswith('SELECT server.server_id')
+                )
+                self.assertEqual(length, expected)
+                self.assertEqual(
+                    '= ANY(' in sql['sql'], name == 'array' and count >= 2
+                )
+                print(
+                    '{} values {}: {} objects in {:.3f} seconds, '
+                    'filtered in {} seconds with {} bytes of SQL'.format(
+                        count, name, length, duration, sql['time'],
+                        len(sql['sql']),
+                    )
+                )
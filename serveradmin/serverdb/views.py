@@ -3,13 +3,22 @@
 Copyright (c) 2019 InnoGames GmbH
 """
 
+import json
+
 import dateparser
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.contrib.postgres.fields.jsonb import KeyTextTransform
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Q
+from django.db.models import (
+    CharField,
+    F,
+    Prefetch,
+    Q,
+    Value,
+    prefetch_related_objects,
+)
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
@@ -26,6 +35,11 @@ from serveradmin.serverdb.models import (
 from serveradmin.serverdb.query_committer import CommitError, commit_query
 
 
+# Number of rows shown per page on the change log views
+CHANGES_PAGE_SIZE = 20
+HISTORY_PAGE_SIZE = 100
+
+
 @login_required
 def changes(request):
     context = dict()
@@ -35,6 +49,7 @@ def changes(request):
     t_until = request.GET.get('until')
     hostname = request.GET.get('hostname')
     application = request.GET.get('application')
+    before = request.GET.get('before')
     date_settings = {'TIMEZONE': settings.TIME_ZONE}
 
     try:
@@ -59,29 +74,60 @@ def changes(request):
         )
         context['until_understood'] = column_filter['change_on__lt']
     if object_id:
+        # The commits are looked up from the changes of the server with
+        # the index instead of joining all of the changes to the commits.
+        # The time range limits the partitions to search.
         q_filter.append((
-            Q(changeupdate__server_id=object_id) |
-            Q(changedelete__server_id=object_id) |
-            Q(changeadd__server_id=object_id)
+            Q(pk__in=ChangeAdd.objects.filter(
+                server_id=object_id, **column_filter
+            ).values('commit_id')) |
+            Q(pk__in=ChangeUpdate.objects.filter(
+                server_id=object_id, **column_filter
+            ).values('commit_id')) |
+            Q(pk__in=ChangeDelete.objects.filter(
+                server_id=object_id, **column_filter
+            ).values('commit_id'))
         ))
     if application:
         q_filter.append((
             Q(app__name=application) | Q(user__username=application)
         ))
 
-    commits = ChangeCommit.objects.filter(
-        *q_filter,
-        **column_filter,
-    ).order_by('-change_on')
-    paginator = Paginator(commits, 20)
-
-    try:
-        page = paginator.page(request.GET.get('page', 1))
-    except (PageNotAnInteger, EmptyPage):
-        page = paginator.page(1)
+    commits = ChangeCommit.objects.filter(*q_filter, **column_filter)
+    cursor = _get_cursor(before)
+    if cursor:
+        commits = commits.filter(_before_cursor('id', *cursor))
+    commits, next_cursor = _get_page(
+        commits.select_related('app', 'user').order_by('-change_on', '-id'),
+        CHANGES_PAGE_SIZE,
+        lambda commit: commit.id,
+    )
+    if commits:
+        # The changes are looked up only on the partitions of the page.
+        change_range = (commits[-1].change_on, commits[0].change_on)
+        prefetch_related_objects(commits, *(
+            Prefetch(
+                model._meta.model_name + '_set',
+                model.objects.filter(change_on__range=change_range)
+                .only('commit_id', 'server_id'),
+            )
+            for model in (ChangeAdd, ChangeUpdate, ChangeDelete)
+        ))
 
     context.update({
-        'commits': page,
+        'commits': commits,
+        'hostnames': _get_hostnames({
+            change.server_id
+            for commit in commits
+            for changes in (
+                commit.changeadd_set.all(),
+                commit.changeupdate_set.all(),
+                commit.changedelete_set.all(),
+            )
+            for change in changes
+        }),
+        'before': before,
+        'next_cursor': next_cursor,
         'from': t_from,
         'until': t_until,
         'hostname': hostname,
@@ -93,48 +139,79 @@ def changes(request):
 
 @login_required
 def history(request):
-    object_id = request.GET.get('object_id')
     commit_id = request.GET.get('commit_id')
     search_string = request.GET.get('search_string')
+    before = request.GET.get('before')
 
-    if not object_id:
+    try:
+        object_id = int(request.GET['object_id'])
+    except (KeyError, ValueError):
         raise Http404
 
-    # TODO: Change data model so that server_id is moved to ChangeCommit.
-    #       To me this would make most sense. If that is not possible (why?!)
-    #       write a proper (custom) query that performs.
-    where = {'server_id': object_id}
-    adds = ChangeAdd.objects.filter(**where)
-    updates = ChangeUpdate.objects.filter(**where)
-    deletes = ChangeDelete.objects.filter(**where)
-
-    # @TODO Transform to PostgreSQL JSON and put a index here
     if search_string:
-        adds = adds.filter(attributes_json__contains=search_string)
-        updates = updates.filter(updates_json__contains=search_string)
-        deletes = deletes.filter(attributes_json__contains=search_string)
+        attributes_filter, updates_filter = _get_search_filters(search_string)
+    else:
+        attributes_filter = updates_filter = Q()
 
+    commit = None
     if commit_id:
-        adds = adds.filter(commit__pk=commit_id)
-        updates = updates.filter(commit__pk=commit_id)
-        deletes = deletes.filter(commit__pk=commit_id)
+        commit = get_object_or_404(ChangeCommit, pk=commit_id)
 
-    related = ('commit__app', 'commit__user')
-    adds = adds.select_related(*related)
-    updates = updates.select_related(*related)
-    deletes = deletes.select_related(*related)
+    cursor = _get_cursor(before)
+    querysets = []
+    for change_type, model, json_field, json_filter in (
+        ('add', ChangeAdd, 'attributes_json', attributes_filter),
+        ('update', ChangeUpdate, 'updates_json', updates_filter),
+        ('delete', ChangeDelete, 'attributes_json', attributes_filter),
+    ):
+        queryset = model.objects.filter(json_filter, server_id=object_id)
+        if commit:
+            queryset = queryset.filter(
+                commit_id=commit.id, change_on=commit.change_on
+            )
+        if cursor:
+            queryset = queryset.filter(_before_cursor('commit_id', *cursor))
+        querysets.append(queryset.annotate(
+            change_type=Value(change_type, CharField()),
+            payload=F(json_field),
+        ).values(
+            'id', 'commit_id', 'change_on', 'change_type', 'payload'
+        ))
 
-    change_list = ([('add', obj) for obj in adds] +
-                   [('update', obj) for obj in updates] +
-                   [('delete', obj) for obj in deletes])
-    change_list.sort(key=lambda entry: entry[1].commit.change_on, reverse=True)
+    # All of the changes of the server are read in order with a single
+    # query which can use the indexes on the server and the time.
+    rows, next_cursor = _get_page(
+        querysets[0].union(*querysets[1:], all=True)
+        .order_by('-change_on', '-commit_id'),
+        HISTORY_PAGE_SIZE,
+        lambda row: row['commit_id'],
+    )
+    commits = ChangeCommit.objects.select_related('app', 'user').in_bulk(
+        {row['commit_id'] for row in rows}
+    )
+    change_list = []
+    for row in rows:
+        model, json_field = {
+            'add': (ChangeAdd, 'attributes_json'),
+            'update': (ChangeUpdate, 'updates_json'),
+            'delete': (ChangeDelete, 'attributes_json'),
+        }[row['change_type']]
+        change_list.append((row['change_type'], model(**{
+            'id': row['id'],
+            'commit': commits[row['commit_id']],
+            'change_on': row['change_on'],
+            'server_id': object_id,
+            json_field: row['payload'],
+        })))
 
-    server = Server.objects.filter(server_id=object_id)
+    hostnames = _get_hostnames({object_id})
     return TemplateResponse(request, 'serverdb/history.html', {
         'change_list': change_list,
         'commit_id': commit_id,
         'object_id': object_id,
-        'name': server.get if server.exists() else object_id,
+        'before': before,
+        'next_cursor': next_cursor,
+        'name': hostnames.get(object_id, object_id),
         'is_ajax': request.is_ajax(),
         'base_template': 'empty.html' if request.is_ajax() else 'base.html',
         'link': request.get_full_path(),
@@ -142,13 +219,119 @@ def history(request):
     })
 
 
+def _get_hostnames(object_ids):
+    """Get the hostnames of the objects all at once to show the changes
+
+    The hostnames of the deleted objects are taken from the change log.
+    """
+    hostnames = dict(
+        Server.objects.filter(server_id__in=object_ids)
+        .values_list('server_id', 'hostname')
+    )
+    missing_ids = set(object_ids) - set(hostnames)
+    if missing_ids:
+        hostnames.update(
+            ChangeDelete.objects.filter(server_id__in=missing_ids)
+            .annotate(hostname=KeyTextTransform('hostname', 'attributes_json'))
+            .values_list('server_id', 'hostname')
+        )
+
+    return hostnames
+
+
+def _get_cursor(before):
+    """Get the position of the commit the previous page ended with
+
+    The pages are addressed by the last commit shown instead of an offset,
+    so that the following pages can be found with the indexes and don't
+    shift when new changes arrive.
+    """
+    if not before:
+        return None
+
+    try:
+        return ChangeCommit.objects.values_list('change_on', 'id').get(
+            pk=int(before)
+        )
+    except (ValueError, ObjectDoesNotExist):
+        return None
+
+
+def _before_cursor(commit_field, change_on, commit_id):
+    return Q(change_on__lt=change_on) | Q(
+        change_on=change_on, **{commit_field + '__lt': commit_id}
+    )
+
+
+def _get_page(queryset, size, get_commit_id):
+    """Get a page and the cursor for the next one without counting
+
+    One more row than necessary is fetched to know whether there is a next
+    page.  The changes of a commit are never split between the pages,
+    because the cursor skips the whole commit.
+    """
+    rows = list(queryset[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+
+    next_commit_id = get_commit_id(rows[size])
+    rows = rows[:size]
+    while len(rows) > 1 and get_commit_id(rows[-1]) == next_commit_id:
+        rows.pop()
+
+    return rows, get_commit_id(rows[-1])
+
+
+def _get_search_filters(search_string):
+    """Get the filters for the attributes and the updates of the changes
+
+    The search string is either an attribute, or an attribute and a value
+    separated by "=".  They are looked up with the key and containment
+    operators which can use the GIN indexes on the JSON.
+    """
+    attribute_id, sep, value = search_string.partition('=')
+    attribute_id = attribute_id.strip()
+    if not sep:
+        return (
+            Q(attributes_json__has_key=attribute_id),
+            Q(updates_json__has_key=attribute_id),
+        )
+
+    # The values are stored with their JSON types, so "num_cpu=4" should
+    # find the number 4.
+    values = [value.strip()]
+    try:
+        values.append(json.loads(values[0]))
+    except ValueError:
+        pass
+
+    attributes_filter = Q()
+    updates_filter = Q()
+    for value in values:
+        attributes_filter |= (
+            Q(attributes_json__contains={attribute_id: value}) |
+            Q(attributes_json__contains={attribute_id: [value]})
+        )
+        for change in (
+            {'new': value},
+            {'old': value},
+            {'add': [value]},
+            {'remove': [value]},
+        ):
+            updates_filter |= Q(updates_json__contains={attribute_id: change})
+
+    return attributes_filter, updates_filter
+
+
 @login_required
 def restore_deleted(request, change_commit_id):
     object_id = request.POST.get('object_id')
+    commit = get_object_or_404(ChangeCommit, pk=change_commit_id)
     deleted = get_object_or_404(
         ChangeDelete,
         server_id=object_id,
-        commit__pk=change_commit_id,
+        commit=commit,
+        change_on=commit.change_on,
     )
 
     server_obj = deleted.attributes
@@ -490,7 +490,11 @@ def choose_ip_addr(request):
     network_query = Query({'intern_ip': network}, ['intern_ip'])
 
     return TemplateResponse(request, 'servershell/choose_ip_addr.html', {
-        'ip_addrs': islice(network_query.get_free_ip_addrs(), 1000)})
+        'ip_ranges': [
+            (first, last, int(last) - int(first) + 1)
+            for first, last in islice(network_query.get_free_ip_ranges(), 100)
+        ],
+    })
 
 
 @login_required
@@ -179,6 +179,20 @@ GRAPHITE_SPRITE_PARAMS = (
     'height=' + str(GRAPHITE_SPRITE_HEIGHT) + '&' +
     'graphOnly=true'
 )
+# Seconds to cache the metrics found for the foreach_paths of the graph
+# templates, and to serve them stale while they are refreshed
+GRAPHITE_FOREACH_CACHE_TTL = 300
+GRAPHITE_FOREACH_CACHE_STALE_TTL = 3600
+# The directory and the maximum bytes of the cache of the rendered graphs,
+# and the maximum number of concurrent render requests to Graphite
+GRAPHITE_RENDER_CACHE_DIR = os.path.join(ROOT_DIR, '_graphite_cache')
+GRAPHITE_RENDER_CACHE_SIZE = 256 * 1024 * 1024
+GRAPHITE_RENDER_CONCURRENCY = 8
+
+# The directory of the state of the API limits of the applications shared
+# by the workers, and the seconds the requests over the limits are queued
+API_LIMITS_DIR = os.path.join(ROOT_DIR, '_api_limits')
+API_LIMIT_QUEUE_TIMEOUT = 5
 
 # Using exec certainly isn't an awesome solution but it's the best we've got.
 # The problem boils down to django configs being python files but python only
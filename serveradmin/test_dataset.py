@@ -6,6 +6,7 @@ Copyright (c) 2019 InnoGames GmbH
 from ipaddress import IPv4Address
 from datetime import datetime, timezone, tzinfo, timedelta
 from django.contrib.auth.models import User
+from django.core.exceptions import PermissionDenied, ValidationError
 from django.test import TransactionTestCase
 
 from adminapi.filters import (
@@ -14,7 +15,9 @@ from adminapi.filters import (
     Regexp,
     StartsWith,
 )
+from serveradmin.access_control.models import AccessControlGroup
 from serveradmin.dataset import Query
+from serveradmin.serverdb.models import Attribute, ServertypeAttribute
 
 
 class TestQuery(TransactionTestCase):
@@ -92,6 +95,87 @@ class TestCommit(TransactionTestCase):
         self.assertEqual(s['os'], 'wheezy')
         self.assertEqual(s['intern_ip'], IPv4Address('10.16.2.1'))
 
+    def test_commit_acl_filter_attribute(self):
+        """The ACL filters must see attributes the commit doesn't change"""
+        user = User.objects.create(username='restricted')
+        for os in ('wheezy', 'squeeze'):
+            acl = AccessControlGroup.objects.create(
+                name=os, query='os=' + os
+            )
+            acl.members.add(user)
+            acl.attributes.add('game_world')
+
+        q = Query({'hostname': 'test1'}, ['game_world'])
+        q.get()['game_world'] = 3
+        q.commit(user=user)
+        self.assertEqual(
+            Query({'hostname': 'test1'}, ['game_world']).get()['game_world'],
+            3,
+        )
+
+        AccessControlGroup.objects.get(name='squeeze').delete()
+        q = Query({'hostname': 'test1'}, ['game_world'])
+        q.get()['game_world'] = 4
+        with self.assertRaises(PermissionDenied):
+            q.commit(user=user)
+
+    def test_commit_multi(self):
+        q = Query({'hostname': 'test0'}, ['database'])
+        q.get()['database'].update({'foo', 'bar'})
+        q.commit(user=User.objects.first())
+
+        q = Query({'hostname': 'test0'}, ['database'])
+        s = q.get()
+        self.assertEqual(s['database'], {'foo', 'bar'})
+        s['database'].remove('foo')
+        s['database'].add('baz')
+        q.commit(user=User.objects.first())
+
+        s = Query({'hostname': 'test0'}, ['database']).get()
+        self.assertEqual(s['database'], {'bar', 'baz'})
+
+    def test_commit_relation(self):
+        attribute = Attribute.objects.create(
+            attribute_id='clients',
+            type='relation',
+            multi=True,
+            target_servertype_id='test2',
+            regexp=r'\A.*\Z',
+        )
+        ServertypeAttribute.objects.create(
+            servertype_id='test0', attribute=attribute
+        )
+
+        q = Query({'hostname': 'test0'}, ['clients'])
+        q.get()['clients'].update({'test0', 'test1', 'test4', 'test5'})
+        with self.assertRaises(ValidationError) as context:
+            q.commit(user=User.objects.first())
+
+        # All of the violations must be reported.
+        message = str(context.exception)
+        self.assertIn('has to be from servertype', message)
+        self.assertIn('"test4"', message)
+        self.assertIn('"test5"', message)
+
+        q = Query({'hostname': 'test0'}, ['clients'])
+        q.get()['clients'].update({'test1', 'test2'})
+        q.commit(user=User.objects.first())
+
+        s = Query({'hostname': 'test0'}, ['clients']).get()
+        self.assertEqual(s['clients'], {'test1', 'test2'})
+
+    def test_commit_created_duplicate_intern_ip(self):
+        q = Query()
+        for hostname in ('test4', 'test5'):
+            s = q.new_object('test2')
+            s['hostname'] = hostname
+            s['intern_ip'] = IPv4Address('10.16.2.10')
+            s['os'] = 'wheezy'
+
+        with self.assertRaises(ValidationError):
+            q.commit(user=User.objects.first())
+        self.assertFalse(Query({'hostname': Any('test4', 'test5')}))
+
     def test_commit_regexp_violation(self):
         pass
 